@@ -11,7 +11,8 @@ try:
 except PackageNotFoundError:  # pragma: no cover
     __version__ = "unknown"
 
-from datawrapper.chart_factory import get_chart
+from datawrapper.bulk import ChartBatch, ChartResult, ExportResult, export_many
+from datawrapper.chart_factory import get_chart, get_charts_typed
 from datawrapper.charts import (
     Annotate,
     AreaChart,
@@ -81,18 +82,29 @@ from datawrapper.charts.models import (
     GridDisplayMixin,
     GridFormatMixin,
 )
+from datawrapper.checkpoint import Checkpoint
+from datawrapper.download import Download
 from datawrapper.exceptions import (
     FailedRequestError,
     InvalidRequestError,
     RateLimitError,
 )
+from datawrapper.export_cache import ExportCache
 from datawrapper.flags import get_country_flag
+from datawrapper.http_cache import CacheBackend, DiskCache, MemoryCache
+from datawrapper.progress import BulkProgress, RequestStats
+from datawrapper.rate_limit import RateLimiter, TokenBucket
+from datawrapper.reference_cache import ReferenceCache
+from datawrapper.retry import RetryPolicy
 
 from .__main__ import Datawrapper
+from .async_client import AsyncDatawrapper
 
 __all__ = [
     "Datawrapper",
+    "AsyncDatawrapper",
     "get_chart",
+    "get_charts_typed",
     "BaseChart",
     "Annotate",
     "ColumnFormat",
@@ -160,4 +172,20 @@ __all__ = [
     "FailedRequestError",
     "InvalidRequestError",
     "RateLimitError",
+    "RetryPolicy",
+    "RateLimiter",
+    "TokenBucket",
+    "Download",
+    "export_many",
+    "ExportResult",
+    "ExportCache",
+    "CacheBackend",
+    "MemoryCache",
+    "DiskCache",
+    "ReferenceCache",
+    "ChartBatch",
+    "ChartResult",
+    "Checkpoint",
+    "BulkProgress",
+    "RequestStats",
 ]
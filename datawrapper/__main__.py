@@ -5,25 +5,46 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
+import time
 import warnings
-from io import StringIO
+from collections.abc import Callable, Hashable, Iterable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import pandas as pd
 import requests as r
 from IPython.display import IFrame, Image
+from requests.adapters import HTTPAdapter
 
+from .checkpoint import Checkpoint
+from .compression import UNSUPPORTED_MEDIA_TYPE, Encoding, compress_body
+from .data_io import DEFAULT_CHUNK_ROWS, CSVStream, is_table, read_csv_data
+from .download import DEFAULT_CHUNK_SIZE, Download, DownloadSink
 from .exceptions import FailedRequestError, InvalidRequestError, RateLimitError
+from .http_cache import (
+    NOT_MODIFIED,
+    CacheBackend,
+    CacheEntry,
+    MemoryCache,
+    cache_key,
+)
+from .pagination import DEFAULT_PAGE_SIZE, iter_items
+from .progress import RequestStats
+from .rate_limit import RateLimiter, TokenBucket
+from .reference_cache import ReferenceCache
+from .retry import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
 
-class Datawrapper:
-    """Handles working with the Datawrapper API.
+class BaseDatawrapper:
+    """Settings and API methods shared by the blocking and asyncio clients.
 
-    Your main interface for configuring Datawrapper, creating, editing and
-    publishing charts, maps and tables.
+    Subclasses send the requests: :class:`Datawrapper` blocks until a response
+    arrives and :class:`~datawrapper.AsyncDatawrapper` returns awaitables. API
+    methods that return the result of a single request are defined here once
+    and return whatever the subclass's request method returns.
     """
 
     _BASE_URL = "https://api.datawrapper.de"  #: The base URL for all API methods
@@ -55,18 +76,87 @@ class Datawrapper:
 
     _ACCESS_TOKEN = os.getenv("DATAWRAPPER_ACCESS_TOKEN")  #: The access token to use
 
-    def __init__(self, access_token=_ACCESS_TOKEN):
-        """Initalize a connection with the Datawrapper API.
+    # Implemented by the blocking and the asyncio client
+    delete: Callable[..., Any]
+    get: Callable[..., Any]
+    download: Callable[..., Any]
+    patch: Callable[..., Any]
+    post: Callable[..., Any]
+    put: Callable[..., Any]
+    update_chart: Callable[..., Any]
+    upload_data: Callable[..., Any]
+    _cached_reference: Callable[..., Any]
+    _invalidating: Callable[..., Any]
+    _iter_items: Callable[..., Any]
+
+    def __init__(
+        self,
+        access_token=_ACCESS_TOKEN,
+        retry: RetryPolicy | int | None = None,
+        rate_limit: float | TokenBucket | RateLimiter | None = None,
+        compression: Encoding | None = None,
+        compression_min_size: int = 1024,
+        http_cache: CacheBackend | bool | None = None,
+        reference_cache: ReferenceCache | bool | None = None,
+    ):
+        """Store the settings shared by the blocking and asyncio clients.
 
         Parameters
         ----------
         access_token : str, optional
-            The access token to use, by default it will look for DATAWRAPPER_ACCESS_TOKEN environment variable.
-            To create a token head to app.datawrapper.de/account/api-tokens.
+            The access token to use. See :class:`Datawrapper`.
+        retry : RetryPolicy | int, optional
+            How to retry failed requests. See :class:`Datawrapper`.
+        rate_limit : float | TokenBucket | RateLimiter, optional
+            How to pace requests. See :class:`Datawrapper`.
+        compression : {"gzip", "deflate"}, optional
+            Compress request bodies. See :class:`Datawrapper`.
+        compression_min_size : int, optional
+            Smallest body in bytes worth compressing, by default 1024.
+        http_cache : CacheBackend | bool, optional
+            Revalidate cached GET responses. See :class:`Datawrapper`.
+        reference_cache : ReferenceCache | bool, optional
+            Cache themes, basemaps, folders and account data. See :class:`Datawrapper`.
         """
 
         self._access_token = access_token
 
+        # Validate and store the request compression settings
+        if compression is not None and compression not in ("gzip", "deflate"):
+            raise ValueError(
+                f"Invalid compression: {compression}. Must be 'gzip' or 'deflate'."
+            )
+        self._compression: Encoding | None = compression
+        self._compression_min_size = compression_min_size
+        self._compression_rejected = False
+
+        # Pick the conditional GET cache
+        if http_cache is True:
+            http_cache = MemoryCache()
+        elif http_cache is False:
+            http_cache = None
+        self._http_cache: CacheBackend | None = http_cache
+
+        # Pick the reference data cache
+        if reference_cache is True:
+            reference_cache = ReferenceCache()
+        elif reference_cache is False:
+            reference_cache = None
+        self._reference_cache: ReferenceCache | None = reference_cache
+
+        # Normalize the retry policy
+        if isinstance(retry, int):
+            retry = RetryPolicy(max_retries=retry)
+        self._retry: RetryPolicy | None = retry
+
+        # Normalize the rate limiter
+        if rate_limit is not None and not isinstance(rate_limit, RateLimiter):
+            rate_limit = RateLimiter(rate=rate_limit)
+        self._rate_limiter: RateLimiter | None = rate_limit
+
+        # Request statistics, collected while a BulkProgress display is open
+        self._stats: RequestStats | None = None
+
     def _get_auth_header(self) -> dict:
         """Get the authentication header for the Datawrapper API.
 
@@ -81,268 +171,87 @@ class Datawrapper:
     # Web request methods
     #
 
-    def delete(
-        self,
-        url: str,
-        timeout: int = 15,
-        data: dict | None = None,
-        extra_headers: dict | None = None,
-    ) -> bool:
-        """Make a DELETE request to the Datawrapper API.
-
-        Parameters
-        ----------
-        url : str
-            The URL to request.
-        timeout : int, optional
-            The timeout for the request in seconds, by default 15
-        data : dict, optional
-            A dictionary of data to pass to the request, by default None
-        extra_headers : dict, optional
-            A dictionary of extra headers to pass to the request, by default None
-
-        Returns
-        -------
-        bool
-            Whether the request was successful.
-        """
-        # Set the headers
-        headers = self._get_auth_header()
-        headers["accept"] = "*/*"
-
-        # Add extra headers if provided
-        if extra_headers:
-            headers.update(extra_headers)
-
-        # Set kwargs
-        kwargs = {"headers": headers, "timeout": timeout}
-
-        # Add data if provided
-        if data:
-            kwargs["json"] = data
-
-        # Make the request
-        response = r.delete(url, **kwargs)  # type: ignore[arg-type]
-
-        # Handle the response
-        if response.ok:
-            return True
-        logger.error(f"Delete request failed with status code {response.status_code}.")
-        if response.status_code == 429:
-            raise RateLimitError(response)
-        raise FailedRequestError(response)
-
-    def get(self, url: str, params: dict | None = None, timeout: int = 15) -> Any:
-        """Make a GET request to the Datawrapper API.
+    def _compress(self, kwargs: dict[str, Any], body_key: str) -> dict[str, Any] | None:
+        """Compress the body of a request, if the client is set up to.
 
         Parameters
         ----------
-        url : str
-            The URL to request.
-        params : dict, optional
-            A dictionary of parameters to pass to the request, by default None
-        timeout : int, optional
-            The timeout for the request in seconds, by default 15
+        kwargs : dict
+            The keyword arguments of the request.
+        body_key : str
+            The keyword argument holding the body.
 
         Returns
         -------
-        Any
-            An object containing the response from the API.
+        dict | None
+            The keyword arguments with the body compressed and the
+            ``Content-Encoding`` header set, or None to send the request as it is.
         """
-        # Set headers
-        headers = self._get_auth_header()
-        headers["accept"] = "*/*"
-
-        # Make the request
-        response = r.get(
-            url=url,
-            headers=headers,
-            params=params,
-            timeout=timeout,
+        if self._compression is None or self._compression_rejected:
+            return None
+        body = compress_body(
+            kwargs.get(body_key), self._compression, self._compression_min_size
         )
+        if body is None:
+            return None
+        headers = {
+            **(kwargs.get("headers") or {}),
+            "Content-Encoding": self._compression,
+        }
+        return {**kwargs, body_key: body, "headers": headers}
 
-        # Check if the request was successful
-        if response.ok:
-            # Return the data as json if the mimetype is json
-            if "json" in response.headers["content-type"]:
-                return response.json()
-            # If it's a csv, read the text into a dataframe
-            if "text/csv" in response.headers["content-type"]:
-                return pd.read_csv(StringIO(response.text))
-            # Otherwise just return the content
-            return response.content
-        # If not, raise an exception
-        logger.error(f"Get request failed with status code {response.status_code}.")
-        if response.status_code == 429:
-            raise RateLimitError(response)
-        raise FailedRequestError(response)
-
-    def patch(
-        self,
-        url: str,
-        data: dict | None = None,
-        timeout: int = 15,
-        extra_headers: dict | None = None,
-    ) -> dict:
-        """Make a PATCH request to the Datawrapper API.
-
-        Parameters
-        ----------
-        url : str
-            The URL to request.
-        data : dict
-            A dictionary of data to pass to the request, by default None
-        timeout : int, optional
-            The timeout for the request in seconds, by default 15
-        extra_headers : dict, optional
-            A dictionary of extra headers to pass to the request, by default None
-
-        Returns
-        -------
-        dict
-            A dictionary containing the response from the API.
-        """
-        # Set headers
-        headers = self._get_auth_header()
-        headers["accept"] = "*/*"
-        headers["content-type"] = "application/json"
-
-        # Add extra headers if provided
-        if extra_headers:
-            headers.update(extra_headers)
-
-        # Set kwargs to post
-        kwargs = {"headers": headers, "timeout": timeout}
-
-        # Convert data to json
-        if data:
-            kwargs["data"] = json.dumps(data)
-
-        # Make the request
-        response = r.patch(url, **kwargs)  # type: ignore[arg-type]
-
-        # Check if the request was successful
-        if response.ok:
-            # Return the data as json
-            return response.json()
-        # If not, raise an exception
-        logger.error(f"Patch request failed with status code {response.status_code}.")
-        if response.status_code == 429:
-            raise RateLimitError(response)
-        raise FailedRequestError(response)
+    def _reject_compression(self, method: str, url: str) -> None:
+        """Stop compressing request bodies after the server rejected one."""
+        self._compression_rejected = True
+        logger.warning(
+            f"{method} {url} rejected a {self._compression} request body, "
+            "sending request bodies uncompressed from now on."
+        )
 
-    def post(
-        self,
-        url: str,
-        data: dict | None = None,
-        timeout: int = 30,
-        extra_headers: dict | None = None,
-    ) -> dict | bool:
-        """Make a POST request to the Datawrapper API.
+    def _track(
+        self, started: float, response: Any = None, streamed: bool = False
+    ) -> None:
+        """Count a request in the statistics of an open BulkProgress display.
 
         Parameters
         ----------
-        url : str
-            The URL to request.
-        data : dict
-            A dictionary of data to pass to the request, by default None
-        timeout : int, optional
-            The timeout for the request in seconds, by default 15
-        extra_headers : dict, optional
-            A dictionary of extra headers to pass to the request, by default None
-
-        Returns
-        -------
-        dict | bool
-            A dictionary containing the response from the API or True if the request was
-            successful but did not return any data.
+        started : float
+            ``time.monotonic()`` when the request was sent.
+        response : Any, optional
+            The response, or None if the connection failed.
+        streamed : bool, optional
+            Whether the body is still to be read, in which case its bytes are
+            counted as they are read, by default False
         """
-        # Set headers
-        headers = self._get_auth_header()
-        headers["accept"] = "*/*"
-
-        # Add extra headers if provided
-        if extra_headers:
-            headers.update(extra_headers)
-
-        # Set kwargs to post
-        kwargs = {"headers": headers, "timeout": timeout}
-
-        # Convert data to json
-        if data:
-            kwargs["data"] = json.dumps(data)
+        if self._stats is None:
+            return
+        content = None if streamed or response is None else response.content
+        self._stats.record(
+            time.monotonic() - started,
+            response.status_code if response is not None else None,
+            len(content) if isinstance(content, bytes) else 0,
+        )
 
-        # Make the request
-        response = r.post(url, **kwargs)  # type: ignore[arg-type]
+    def _cache_key(self, url: str, params: dict | None) -> str:
+        """Build the conditional GET cache key for a request from this client."""
+        return cache_key(self._access_token, url, params)
 
-        # Check if the request was successful
-        if response.ok:
-            # Return the data as json
-            if response.text:
-                return response.json()
-            return True
-        # If not, raise an exception
-        logger.error(f"Post request failed with status code {response.status_code}.")
-        if response.status_code == 429:
-            raise RateLimitError(response)
-        raise FailedRequestError(response)
+    def _store_cached(self, key: str | None, entry: CacheEntry | None) -> None:
+        """Store a response in the conditional GET cache, if it can be revalidated."""
+        if self._http_cache is not None and key is not None and entry is not None:
+            self._http_cache.set(key, entry)
 
-    def put(
-        self,
-        url: str,
-        data: dict | bytes | None = None,
-        timeout: int = 15,
-        extra_headers: dict | None = None,
-        dump_data: bool = True,
-    ) -> bool:
-        """Make a PUT request to the Datawrapper API.
+    def invalidate_reference_cache(self, *categories: str) -> None:
+        """Drop cached reference data so the next call fetches it again.
 
         Parameters
         ----------
-        url : str
-            The URL to request.
-        data : dict | bytes
-            A dictionary of data to pass to the request, or raw bytes when dump_data is False, by default None
-        timeout : int, optional
-            The timeout for the request in seconds, by default 15
-        extra_headers : dict, optional
-            A dictionary of extra headers to pass to the request, by default None
-        dump_data: bool, optional
-            Whether to dump the data to json, by default True
-
-        Returns
-        -------
-        bool
-            Whether the request was successful.
+        *categories : str
+            The categories to drop, such as ``"themes"`` or ``"folders"``. Drops
+            everything if none are given.
         """
-        # Set headers
-        headers = self._get_auth_header()
-        headers["accept"] = "*/*"
-
-        # Add extra headers if provided
-        if extra_headers:
-            headers.update(extra_headers)
-
-        # Set kwargs to post
-        kwargs = {"headers": headers, "timeout": timeout}
-
-        # Convert data to json
-        if data:
-            if dump_data:
-                kwargs["data"] = json.dumps(data)
-            else:
-                kwargs["data"] = data
-
-        # Make the request
-        response = r.put(url, **kwargs)  # type: ignore[arg-type]
-
-        # Handle the response
-        if response.ok:
-            return True
-        logger.error(f"Put request failed with status code {response.status_code}.")
-        if response.status_code == 429:
-            raise RateLimitError(response)
-        raise FailedRequestError(response)
+        if self._reference_cache is not None:
+            self._reference_cache.invalidate(*categories)
 
     #
     # Login token actions
@@ -375,35 +284,18 @@ class Datawrapper:
 
         return self.get(self._LOGIN_TOKENS_URL, params=_query)
 
-    def create_login_token(self) -> dict:
-        """Creates a new login token to authenticate a user, for use in CMS integrations.
+    def delete_login_token(self, token_id: str | int) -> bool:
+        """Deletes a login token.
 
-        Login tokens are valid for five minutes and can only be used once.
+        Parameters
+        ----------
+        token_id : str | int
+            ID of login token to delete.
 
         Returns
         -------
-        dict
-            A dictionary containing the login token's information.
-        """
-        response = self.post(
-            self._LOGIN_TOKENS_URL,
-            extra_headers={"content-type": "application/json"},
-        )
-        assert isinstance(response, dict)
-        return response
-
-    def delete_login_token(self, token_id: str | int) -> bool:
-        """Deletes a login token.
-
-        Parameters
-        ----------
-        token_id : str | int
-            ID of login token to delete.
-
-        Returns
-        -------
-        bool
-            True if the login token was deleted successfully.
+        bool
+            True if the login token was deleted successfully.
         """
         return self.delete(f"{self._LOGIN_TOKENS_URL}/{token_id}")
 
@@ -453,31 +345,6 @@ class Datawrapper:
 
         return self.get(self._API_TOKEN_URL, params=_query)
 
-    def create_api_token(self, comment: str, scopes: list[str]) -> dict:
-        """Create a new API Token.
-
-        Make sure to save the token somewhere, since you won't be able to see it again. Requires scope `auth:write`.
-
-        Parameters
-        ----------
-        comment : str
-            Comment to describe the API token. Tip: Use something to remember where this specific token is used.
-        scopes : list[str]
-            List of scopes for the API token.
-
-        Returns
-        -------
-        dict
-            A dictionary containing the API token's information.
-        """
-        response = self.post(
-            self._API_TOKEN_URL,
-            data={"comment": comment, "scopes": scopes},
-            extra_headers={"content-type": "application/json"},
-        )
-        assert isinstance(response, dict)
-        return response
-
     def update_api_token(
         self, id: str | int, comment: str, scopes: list[str] | None = None
     ) -> bool:
@@ -530,7 +397,9 @@ class Datawrapper:
         list[str]
             A list containing the scopes available to the current user.
         """
-        return self.get(self._LOGIN_SCOPES_URL)
+        return self._cached_reference(
+            "token_scopes", None, lambda: self.get(self._LOGIN_SCOPES_URL)
+        )
 
     #
     # Basemap actions
@@ -544,7 +413,9 @@ class Datawrapper:
         list[dict]
             A list of dictionaries containing the basemaps available in your Datawrapper account.
         """
-        return self.get(self._BASEMAPS_URL)
+        return self._cached_reference(
+            "basemaps", None, lambda: self.get(self._BASEMAPS_URL)
+        )
 
     def get_basemap(self, basemap_id: str, wgs84: bool = False) -> dict:
         """Get the metadata of the requested basemap.
@@ -561,9 +432,13 @@ class Datawrapper:
         dict
             A dictionary containing the requested basemap's metadata.
         """
-        return self.get(
-            f"{self._BASEMAPS_URL}/{basemap_id}",
-            params={"wgs84": wgs84},
+        return self._cached_reference(
+            "basemaps",
+            (basemap_id, wgs84),
+            lambda: self.get(
+                f"{self._BASEMAPS_URL}/{basemap_id}",
+                params={"wgs84": wgs84},
+            ),
         )
 
     def get_basemap_key(self, basemap_id: str, basemap_key: str) -> dict:
@@ -597,6 +472,7 @@ class Datawrapper:
         limit: int = 25,
         folder_id: int | None = None,
         team_id: str = "",
+        offset: int = 0,
     ) -> None | list[Any]:
         """Retrieves a list of charts by User
 
@@ -620,6 +496,8 @@ class Datawrapper:
         team_id : str, optional
             ID of the team where to list charts. The authenticated user must have access
             to this team, by default ""
+        offset : int, optional
+            Number of items to skip. Useful for pagination. Zero by default.
 
         Returns
         -------
@@ -643,9 +521,62 @@ class Datawrapper:
             _query["folderId"] = folder_id
         if team_id:
             _query["teamId"] = team_id
+        if offset:
+            _query["offset"] = offset
 
         return self.get(self._CHARTS_URL, params=_query)
 
+    def iter_charts(
+        self,
+        user_id: str = "",
+        published: bool = True,
+        search: str = "",
+        order: str = "DESC",
+        order_by: str = "createdAt",
+        folder_id: int | None = None,
+        team_id: str = "",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+        max_workers: int = 1,
+    ) -> Iterator[dict]:
+        """Iterate over every chart matching the filters, fetching pages as needed.
+
+        Parameters
+        ----------
+        user_id, published, search, order, order_by, folder_id, team_id : optional
+            Filters and ordering, see :meth:`get_charts`.
+        page_size : int, optional
+            Number of charts requested per page, by default and at most 100.
+        prefetch : bool, optional
+            Fetch the next page in the background while the current one is being
+            consumed, by default False.
+        max_workers : int, optional
+            Number of pages fetched at once, by default 1. Above 1, the total count
+            on the first page is used to fetch the remaining pages concurrently,
+            and the items are still yielded in order.
+
+        Yields
+        ------
+        dict
+            One chart at a time.
+        """
+        return self._iter_items(
+            lambda limit, offset: self.get_charts(
+                user_id=user_id,
+                published=published,
+                search=search,
+                order=order,
+                order_by=order_by,
+                limit=limit,
+                folder_id=folder_id,
+                team_id=team_id,
+                offset=offset,
+            ),
+            page_size,
+            prefetch,
+            max_workers,
+        )
+
     def get_chart(self, chart_id: str) -> dict:
         """Retrieve information of a specific chart, table or map.
 
@@ -683,161 +614,27 @@ class Datawrapper:
         # Use the newer method
         return self.get_chart(chart_id)
 
-    def create_chart(
-        self,
-        title: str,
-        chart_type: str,
-        theme: str | None = None,
-        data: pd.DataFrame | str | None = None,
-        external_data_url: str | None = None,
-        folder_id: int | None = None,
-        organization_id: str | None = None,
-        forkable: bool | None = None,
-        language: str | None = None,
-        metadata: dict | None = None,
-    ) -> dict:
-        """Creates a new Datawrapper chart, table or map.
-
-        .. deprecated::
-            Use the object-oriented chart classes instead (e.g., BarChart, LineChart).
-            This method will be removed in a future version.
-
-        Parameters
-        ----------
-        title : str
-            Title for new chart, table or map, by default "New Chart"
-        chart_type : str
-            Chart type to be created. See https://developer.datawrapper.de/docs/chart-types
-        theme : str, optional
-            Theme to use for new chart, table or map, by default None
-        data : pd.DataFrame | str, optional
-            A pandas DataFrame or string containing the data to be added,
-            by default None
-        external_data_url: str, optional
-            URL to external data to be added to the chart, table or map,
-        folder_id : int, optional
-            ID of folder in Datawrapper.de for the chart, table or map to be created in,
-            by default ""
-        organization_id : str, optional
-            ID of the team where the chart should be created. The authenticated user
-            must have access to this team.
-        forkable : bool, optional
-            Whether the chart should be forkable or not, by default None
-        language: str, optional
-            Locale of the chart (i.e. en-US), by default None
-        metadata: dict, optional
-            A Python dictionary of properties to add.
-
-        Returns
-        -------
-        dict
-            A dictionary containing the created chart's information.
-        """
-        warnings.warn(
-            "create_chart() is deprecated and will be removed in a future version. "
-            "Use the object-oriented chart classes instead. "
-            "Example: chart = BarChart(title='My Chart', data=df).create()",
-            DeprecationWarning,
-            stacklevel=2,
-        )
-
-        # Set chart properties
-        _query: dict[str, Any] = {"title": title, "type": chart_type}
-        if theme:
-            _query["theme"] = theme
-        if folder_id:
-            _query["folderId"] = folder_id
-        if organization_id:
-            _query["organizationId"] = organization_id
-        if forkable:
-            _query["forkable"] = json.dumps(forkable)
-        if language:
-            _query["language"] = language
-        if external_data_url:
-            _query["externalData"] = external_data_url
-        if metadata:
-            _query["metadata"] = metadata
-
-        # Create chart
-        obj = self.post(
-            self._CHARTS_URL,
-            data=_query,
-            extra_headers={"content-type": "application/json"},
-        )
-        assert isinstance(obj, dict)
-
-        # Add data, if provided
-        if data is not None:
-            self.add_data(chart_id=obj["id"], data=data)
-
-        # Return the result
-        return obj
-
-    def update_chart(
-        self,
-        chart_id: str,
+    @staticmethod
+    def _chart_query(
         title: str | None = None,
         chart_type: str | None = None,
         theme: str | None = None,
-        data: pd.DataFrame | str | None = None,
         external_data_url: str | None = None,
         folder_id: int | None = None,
         organization_id: str | None = None,
         forkable: bool | None = None,
         language: str | None = None,
         metadata: dict | None = None,
-    ) -> dict:
-        """Updates a chart's title, theme, type, language, folder or organization.
-
-        .. deprecated::
-            Use the object-oriented chart classes instead (e.g., BarChart, LineChart).
-            This method will be removed in a future version.
+    ) -> dict[str, Any]:
+        """Build the request body for creating or updating a chart.
 
-        Parameters
-        ----------
-        chart_id: str
-            ID Of chart, table, or map.
-        title: str, optional
-            New title
-        chart_type: str, optional
-            New chart type. See https://developer.datawrapper.de/docs/chart-types
-        theme: str, optional
-            New theme
-        data: pd.DataFrame | str, optional
-            A pandas DataFrame or string containing the data to be added,
-            by default None
-        external_data_url: str, optional
-            URL to external data to be added to the chart, table or map,
-        folder_id: int, optional
-            New folder's ID
-        organization_id: str, optional
-            New organization's ID
-        forkable: bool, optional
-            Whether the chart should be forkable or not, by default None
-        language : str, optional
-            New language
-        metadata: dict, optional
-            A Python dictionary of properties to add.
+        Only the properties that were provided are included.
 
-        Return
-        ------
+        Returns
+        -------
         dict
-            A dictionary containing the updated chart's information.
-
-        Raises
-        ------
-        InvalidRequestError
-            If no updates are submitted.
+            The chart properties keyed by their API names.
         """
-        warnings.warn(
-            "update_chart() is deprecated and will be removed in a future version. "
-            "Use the object-oriented chart classes instead. "
-            "Example: chart = BarChart.get(chart_id='abc123'); chart.title = 'New Title'; chart.update()",
-            DeprecationWarning,
-            stacklevel=2,
-        )
-
-        # Load the query with the provided parameters
         _query: dict[str, Any] = {}
         if title:
             _query["title"] = title
@@ -857,29 +654,7 @@ class Datawrapper:
             _query["language"] = language
         if metadata:
             _query["metadata"] = metadata
-
-        # If there's nothing there to update, raise an exception
-        if not _query and data is None:
-            msg = "No updates submitted."
-            logger.error(msg)
-            raise InvalidRequestError(msg)
-
-        # Update the chart
-        if _query:
-            obj = self.patch(
-                f"{self._CHARTS_URL}/{chart_id}",
-                data=_query,
-                extra_headers={"content-type": "application/json"},
-            )
-        else:
-            obj = self.get_chart(chart_id)
-
-        # Add data, if provided
-        if data is not None:
-            self.add_data(chart_id=obj["id"], data=data)
-
-        # Return the result
-        return obj
+        return _query
 
     def update_metadata(self, chart_id: str, metadata: dict) -> dict:
         """A deprecated method of the update_chart method."""
@@ -1002,227 +777,53 @@ class Datawrapper:
 
         return self.delete(f"{self._CHARTS_URL}/{chart_id}")
 
-    def display_chart(self, chart_id: str) -> IFrame:
-        """Displays a datawrapper chart.
+    def move_chart(self, chart_id: str, folder_id: int) -> dict:
+        """Moves a chart, table, or map to a specified folder.
 
         Parameters
         ----------
         chart_id : str
             ID of chart, table, or map.
+        folder_id : int
+            ID of folder to move visualization to.
+        """
+        return self._invalidating(
+            "folders",
+            self.patch(
+                f"{self._CHARTS_URL}/{chart_id}",
+                data={"folderId": folder_id},
+            ),
+        )
+
+    @staticmethod
+    def _export_query(
+        unit: str,
+        mode: str,
+        width: int,
+        height: int | str | None,
+        plain: bool,
+        zoom: int,
+        scale: int,
+        border_width: int,
+        border_color: str | None,
+        transparent: bool,
+        download: bool,
+        full_vector: bool,
+        ligatures: bool,
+        logo: str,
+        logo_id: str | None,
+        dark: bool,
+    ) -> dict[str, Any]:
+        """Build the query parameters for exporting a chart.
+
+        See :meth:`export_chart` for a description of each parameter.
 
         Returns
         -------
-        IPython.display.IFrame
-            IFrame displaying the chart.
+        dict
+            The export parameters keyed by their API names.
         """
-        obj = self.get_chart(chart_id)
-        src = obj["publicUrl"]
-        width = obj["metadata"]["publish"]["embed-width"]
-        height = obj["metadata"]["publish"]["embed-height"]
-        return IFrame(src, width=width, height=height)
-
-    def copy_chart(self, chart_id: str) -> dict:
-        """Copy one of your charts, tables, or maps and create a new editable copy.
-
-        .. deprecated::
-            Use the object-oriented chart classes instead (e.g., BarChart, LineChart).
-            This method will be removed in a future version.
-
-        Parameters
-        ----------
-        chart_id : str
-            ID of chart, table, or map.
-
-        Returns
-        -------
-        dict
-            A dictionary containing the information of the chart, table, or map.
-        """
-        warnings.warn(
-            "copy_chart() is deprecated and will be removed in a future version. "
-            "Use the object-oriented chart classes instead. "
-            "Example: chart = BarChart.get(chart_id='abc123'); duplicate = chart.duplicate()",
-            DeprecationWarning,
-            stacklevel=2,
-        )
-
-        response = self.post(f"{self._CHARTS_URL}/{chart_id}/copy")
-        assert isinstance(response, dict)
-        return response
-
-    def fork_chart(self, chart_id: str) -> dict:
-        """Fork a chart, table, or map and create an editable copy.
-
-        .. deprecated::
-            Use the object-oriented chart classes instead (e.g., BarChart, LineChart).
-            This method will be removed in a future version.
-
-        Parameters
-        ----------
-        chart_id : str
-            ID of chart, table, or map.
-
-        Returns
-        -------
-        dict
-            A dictionary containing the information of the chart, table, or map.
-        """
-        warnings.warn(
-            "fork_chart() is deprecated and will be removed in a future version. "
-            "Use the object-oriented chart classes instead. "
-            "Example: chart = BarChart.get(chart_id='abc123'); fork = chart.fork()",
-            DeprecationWarning,
-            stacklevel=2,
-        )
-
-        response = self.post(f"{self._CHARTS_URL}/{chart_id}/fork")
-        assert isinstance(response, dict)
-        return response
-
-    def move_chart(self, chart_id: str, folder_id: int) -> dict:
-        """Moves a chart, table, or map to a specified folder.
-
-        Parameters
-        ----------
-        chart_id : str
-            ID of chart, table, or map.
-        folder_id : int
-            ID of folder to move visualization to.
-        """
-        return self.patch(
-            f"{self._CHARTS_URL}/{chart_id}",
-            data={"folderId": folder_id},
-        )
-
-    def publish_chart(self, chart_id: str, display: bool = False) -> dict | IFrame:
-        """Publishes a chart, table or map.
-
-        .. deprecated::
-            Use the object-oriented chart classes instead (e.g., BarChart, LineChart).
-            This method will be removed in a future version.
-
-        Parameters
-        ----------
-        chart_id : str
-            ID of chart, table or map.
-        display : bool, optional
-            Display the published chart as output in notebook cell, by default False
-
-        Returns
-        -------
-        dict | IFrame
-            Either a dictionary containing the published chart's information or an IFrame
-            object displaying the chart.
-        """
-        warnings.warn(
-            "publish_chart() is deprecated and will be removed in a future version. "
-            "Use the object-oriented chart classes instead. "
-            "Example: chart = BarChart.get(chart_id='abc123'); chart.publish()",
-            DeprecationWarning,
-            stacklevel=2,
-        )
-
-        obj = self.post(f"{self._CHARTS_URL}/{chart_id}/publish")
-        assert isinstance(obj, dict)
-        if display:
-            src = obj["data"]["publicUrl"]
-            width = obj["data"]["metadata"]["publish"]["embed-width"]
-            height = obj["data"]["metadata"]["publish"]["embed-height"]
-            return IFrame(src, width=width, height=height)
-        return obj
-
-    def export_chart(
-        self,
-        chart_id: str,
-        unit: str = "px",
-        mode: str = "rgb",
-        width: int = 400,
-        height: int | str | None = None,
-        plain: bool = False,
-        zoom: int = 2,
-        scale: int = 1,
-        border_width: int = 20,
-        border_color: str | None = None,
-        transparent: bool = False,
-        download: bool = False,
-        full_vector: bool = False,
-        ligatures: bool = True,
-        logo: str = "auto",
-        logo_id: str | None = None,
-        dark: bool = False,
-        output: str = "png",
-        filepath: str = "./image.png",
-        display: bool = False,
-    ) -> Path | Image:
-        """Exports a chart, table, or map.
-
-        .. deprecated::
-            Use the object-oriented chart classes instead (e.g., BarChart, LineChart).
-            This method will be removed in a future version.
-
-        Parameters
-        ----------
-        chart_id : str
-            ID of chart, table, or map.
-        unit : str, optional
-            One of px, mm, inch. Defines the unit in which the borderwidth, height,
-            and width will be measured in, by default "px"
-        mode : str, optional
-            One of rgb or cmyk. Which color mode the output should be in,
-            by default "rgb"
-        width : int, optional
-            Width of visualization. If not specified, it takes the chart width,
-            by default 400
-        height : int | str, optional
-            Height of visualization. Can be a number or "auto", by default None
-        plain : bool, optional
-            Defines if only the visualization should be exported (True), or if it should
-             include header and footer as well (False), by default False
-        zoom : int, optional
-            Defines the multiplier for the png size, by default 2
-        scale : int, optional
-            Defines the multiplier for the pdf size, by default 1
-        border_width : int, optional
-            Margin around the visualization, by default 20
-        border_color : str, optional
-            Color of the border around the visualization, by default None
-        transparent : bool, optional
-            Set to `True` to export your visualization with a transparent background,
-            by default False
-        download : bool, optional
-            Whether to trigger a download, by default False
-        full_vector : bool, optional
-            Export as full vector graphic (for supported formats), by default False
-        ligatures : bool, optional
-            Enable typographic ligatures, by default True
-        logo : str, optional
-            Logo display setting. One of "auto", "on", or "off", by default "auto"
-        logo_id : str, optional
-            Custom logo ID to use, by default None
-        dark : bool, optional
-            Export in dark mode, by default False
-        output : str, optional
-            One of png, pdf, or svg, by default "png"
-        filepath : str, optional
-            Name/filepath to save output in, by default "./image.png"
-        display : bool, optional
-            Whether to display the exported image as output in the notebook cell,
-            by default False
-
-        Returns
-        -------
-        Path | Image
-            The file path to the exported image or an Image object displaying the image.
-        """
-        warnings.warn(
-            "export_chart() is deprecated and will be removed in a future version. "
-            "Use the object-oriented chart classes instead. "
-            "Example: chart = BarChart.get(chart_id='abc123'); png_data = chart.export_png(); Path('chart.png').write_bytes(png_data)",
-            DeprecationWarning,
-            stacklevel=2,
-        )
-
-        _query = {
+        _query: dict[str, Any] = {
             "unit": unit,
             "mode": mode,
             "width": width,
@@ -1245,25 +846,7 @@ class Datawrapper:
             _query["borderColor"] = border_color
         if logo_id is not None:
             _query["logoId"] = logo_id
-
-        content = self.get(
-            f"{self._CHARTS_URL}/{chart_id}/export/{output}", params=_query
-        )
-
-        # Set the file path
-        _filepath = Path(filepath)
-        _filepath = _filepath.with_suffix(f".{output}")
-
-        # Write the file to the file path
-        with open(_filepath, "wb") as fh:
-            fh.write(content)
-
-        # Display the image if requested
-        if display:
-            return Image(_filepath)
-        # Otherwise return the file path
-        logger.debug(f"File exported at {_filepath}")
-        return _filepath
+        return _query
 
     def get_chart_display_urls(self, chart_id: str) -> list[dict]:
         """Get the URLs for the published chart, table or map.
@@ -1280,44 +863,23 @@ class Datawrapper:
         """
         return self.get(f"{self._CHARTS_URL}/{chart_id}/display-urls")
 
-    def get_iframe_code(self, chart_id: str, responsive: bool = False) -> str:
-        """Returns a chart, table, or map's iframe embed code.
-
-        Parameters
-        ----------
-        chart_id : str
-            ID of chart, table, or map.
-        responsive : bool, optional
-            Whether to return a responsive iframe embed code., by default False
-
-        Returns
-        -------
-        str
-            iframe embed code.
-        """
-        obj = self.get_chart(chart_id)
-        if responsive:
-            iframe = obj["metadata"]["publish"]["embed-codes"][
-                "embed-method-responsive"
-            ]
-        else:
-            iframe = obj["metadata"]["publish"]["embed-codes"]["embed-method-iframe"]
-        return iframe
-
-    def get_data(self, chart_id: str):
+    def get_data(self, chart_id: str, raw: bool = False):
         """Retrieve the data stored for a specific chart, table or map, which is typically CSV.
 
         Parameters
         ----------
         chart_id : str
             ID of chart, table, or map.
+        raw : bool, optional
+            Return the data exactly as stored, as bytes, without parsing it with
+            pandas, by default False
 
         Returns
         -------
-        dict
-            A dictionary containing the information of the chart, table, or map.
+        pd.DataFrame | bytes
+            The parsed data, or the raw bytes if raw is True.
         """
-        return self.get(f"{self._CHARTS_URL}/{chart_id}/data")
+        return self.get(f"{self._CHARTS_URL}/{chart_id}/data", raw=raw)
 
     def chart_data(self, chart_id: str):
         """A deprecated method of the get_data method."""
@@ -1358,68 +920,32 @@ class Datawrapper:
             stacklevel=2,
         )
 
-        # If data is a pandas dataframe, convert to csv
-        if isinstance(data, pd.DataFrame):
-            _data = data.to_csv(index=False, encoding="utf-8")
-        # If data is a string, use that
-        else:
-            _data = data
-
         # Add data to chart
-        return self.put(
-            f"{self._CHARTS_URL}/{chart_id}/data",
-            data=_data.encode("utf-8"),
-            extra_headers={"content-type": "text/csv"},
-            dump_data=False,
-        )
+        return self.upload_data(chart_id, data)
 
-    def add_json(self, chart_id: str, data: Any) -> bool:
-        """Add JSON data to a specified chart.
-
-        Can be used to add point, area and line markers to a locator map or other chart.
+    @staticmethod
+    def _data_body(data: Any, chunk_rows: int) -> bytes | Iterable[bytes]:
+        """Turn the data given to ``upload_data`` into a request body.
 
         Parameters
         ----------
-        chart_id : str
-            ID of chart, table or map to add data to.
-        data : Any
-            JSON data to add to the chart.
+        data : pd.DataFrame | list[dict] | str | bytes | Iterable[bytes]
+            The rows, CSV text or CSV byte chunks to upload.
+        chunk_rows : int
+            Number of DataFrame rows encoded into each chunk.
 
         Returns
         -------
-        bool
-            True if the data was added successfully.
-        """
-        # Set the chart metadata to accept JSON data
-        self.update_chart(
-            chart_id=chart_id,
-            metadata={
-                "data": {"json": True},
-            },
-        )
-
-        # Dump the provided data as a JSON string
-        json_data = json.dumps(data)
-
-        # Post it to the chart via the add_data method
-        return self.add_data(chart_id, json_data)
-
-    def refresh_data(self, chart_id: str) -> dict:
-        """Fetch configured external data and add it to the chart.
-
-        Parameters
-        ----------
-        chart_id : str
-            ID of chart, table or map to add data to.
-
-        Returns
-        -------
-        dict
-            A dictionary containing the chart's information.
+        bytes | Iterable[bytes]
+            The CSV body, streamed a chunk of rows at a time for DataFrames.
         """
-        response = self.post(f"{self._CHARTS_URL}/{chart_id}/data/refresh")
-        assert isinstance(response, dict)
-        return response
+        # A list is either records or byte chunks, so look at what it holds
+        records = isinstance(data, list) and all(isinstance(row, dict) for row in data)
+        if isinstance(data, pd.DataFrame) or records or is_table(data):
+            return CSVStream(data, chunk_rows=chunk_rows)
+        if isinstance(data, str):
+            return data.encode("utf-8")
+        return data
 
     #
     # Folder methods
@@ -1434,7 +960,9 @@ class Datawrapper:
             A dictionary containing the folders in your Datawrapper account and their
             information.
         """
-        return self.get(self._FOLDERS_URL)
+        return self._cached_reference(
+            "folders", None, lambda: self.get(self._FOLDERS_URL)
+        )
 
     def get_folder(self, folder_id: int) -> dict:
         """Get an existing folder.
@@ -1451,43 +979,6 @@ class Datawrapper:
         """
         return self.get(self._FOLDERS_URL + f"/{folder_id}")
 
-    def create_folder(
-        self,
-        name: str,
-        parent_id: int | None = None,
-        team_id: int | None = None,
-    ) -> dict:
-        """Create a new folder.
-
-        Parameters
-        ----------
-        name: str
-            Name of the folder to be created.
-        parent_id: int, optional
-            The parent folder that the folder belongs to.
-        team_id: int, optional
-            The team that the folder belongs to. If teamId is empty, the folder will
-            belong to the user directly.
-
-        Returns
-        -------
-        dict
-            A dictionary containing the folder's information.
-        """
-        _query: dict = {"name": name}
-        if parent_id:
-            _query["parentId"] = parent_id
-        if team_id:
-            _query["teamId"] = team_id
-
-        response = self.post(
-            self._FOLDERS_URL,
-            data=_query,
-            extra_headers={"content-type": "application/json"},
-        )
-        assert isinstance(response, dict)
-        return response
-
     def update_folder(
         self,
         folder_id: str | int,
@@ -1526,9 +1017,12 @@ class Datawrapper:
         if user_id:
             _query["userId"] = user_id
 
-        return self.patch(
-            f"{self._FOLDERS_URL}/{folder_id}",
-            data=_query,
+        return self._invalidating(
+            "folders",
+            self.patch(
+                f"{self._FOLDERS_URL}/{folder_id}",
+                data=_query,
+            ),
         )
 
     def delete_folder(self, folder_id: int) -> bool:
@@ -1544,7 +1038,9 @@ class Datawrapper:
         bool
             True if the folder was deleted successfully.
         """
-        return self.delete(f"{self._FOLDERS_URL}/{folder_id}")
+        return self._invalidating(
+            "folders", self.delete(f"{self._FOLDERS_URL}/{folder_id}")
+        )
 
     #
     # "Me" methods
@@ -1558,7 +1054,7 @@ class Datawrapper:
         dict
             A dictionary containing your account information.
         """
-        return self.get(self._ME_URL)
+        return self._cached_reference("account", None, lambda: self.get(self._ME_URL))
 
     def account_info(self) -> dict:
         """A deprecated method for calling get_my_account."""
@@ -1623,9 +1119,12 @@ class Datawrapper:
             logger.error(msg)
             raise Exception(msg)
 
-        return self.patch(
-            self._ME_URL,
-            data=_query,
+        return self._invalidating(
+            "account",
+            self.patch(
+                self._ME_URL,
+                data=_query,
+            ),
         )
 
     def update_my_settings(
@@ -1653,9 +1152,12 @@ class Datawrapper:
             logger.error(msg)
             raise Exception(msg)
 
-        return self.patch(
-            f"{self._ME_URL}/settings",
-            data=_query,
+        return self._invalidating(
+            "account",
+            self.patch(
+                f"{self._ME_URL}/settings",
+                data=_query,
+            ),
         )
 
     def get_my_recently_edited_charts(
@@ -1695,6 +1197,45 @@ class Datawrapper:
             params=_query,
         )
 
+    def iter_my_recently_edited_charts(
+        self,
+        min_last_edit_step: str | int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+        max_workers: int = 1,
+    ) -> Iterator[dict]:
+        """Iterate over all of your recently edited charts, fetching pages as needed.
+
+        Parameters
+        ----------
+        min_last_edit_step : str | int, optional
+            See :meth:`get_my_recently_edited_charts`.
+        page_size : int, optional
+            Number of charts requested per page, by default and at most 100.
+        prefetch : bool, optional
+            Fetch the next page in the background while the current one is being
+            consumed, by default False.
+        max_workers : int, optional
+            Number of pages fetched at once, by default 1. Above 1, the total count
+            on the first page is used to fetch the remaining pages concurrently,
+            and the items are still yielded in order.
+
+        Yields
+        ------
+        dict
+            One chart at a time.
+        """
+        return self._iter_items(
+            lambda limit, offset: self.get_my_recently_edited_charts(
+                limit=limit,
+                offset=offset,
+                min_last_edit_step=min_last_edit_step,
+            ),
+            page_size,
+            prefetch,
+            max_workers,
+        )
+
     def get_my_recently_published_charts(
         self,
         limit: int = 100,
@@ -1732,6 +1273,45 @@ class Datawrapper:
             params=_query,
         )
 
+    def iter_my_recently_published_charts(
+        self,
+        min_last_edit_step: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+        max_workers: int = 1,
+    ) -> Iterator[dict]:
+        """Iterate over all of your recently published charts, fetching pages as needed.
+
+        Parameters
+        ----------
+        min_last_edit_step : int, optional
+            See :meth:`get_my_recently_published_charts`.
+        page_size : int, optional
+            Number of charts requested per page, by default and at most 100.
+        prefetch : bool, optional
+            Fetch the next page in the background while the current one is being
+            consumed, by default False.
+        max_workers : int, optional
+            Number of pages fetched at once, by default 1. Above 1, the total count
+            on the first page is used to fetch the remaining pages concurrently,
+            and the items are still yielded in order.
+
+        Yields
+        ------
+        dict
+            One chart at a time.
+        """
+        return self._iter_items(
+            lambda limit, offset: self.get_my_recently_published_charts(
+                limit=limit,
+                offset=offset,
+                min_last_edit_step=min_last_edit_step,
+            ),
+            page_size,
+            prefetch,
+            max_workers,
+        )
+
     #
     # Oembed methods
     #
@@ -1812,6 +1392,47 @@ class Datawrapper:
 
         return self.get(self._RIVER_URL, params=_query)
 
+    def iter_river(
+        self,
+        approved: bool | None = None,
+        search: str | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+        max_workers: int = 1,
+    ) -> Iterator[dict]:
+        """Iterate over every matching River chart, fetching pages as needed.
+
+        Parameters
+        ----------
+        approved, search : optional
+            Filters and ordering, see :meth:`get_river`.
+        page_size : int, optional
+            Number of charts requested per page, by default and at most 100.
+        prefetch : bool, optional
+            Fetch the next page in the background while the current one is being
+            consumed, by default False.
+        max_workers : int, optional
+            Number of pages fetched at once, by default 1. Above 1, the total count
+            on the first page is used to fetch the remaining pages concurrently,
+            and the items are still yielded in order.
+
+        Yields
+        ------
+        dict
+            One River chart at a time.
+        """
+        return self._iter_items(
+            lambda limit, offset: self.get_river(
+                approved=approved,
+                limit=limit,
+                offset=offset,
+                search=search,
+            ),
+            page_size,
+            prefetch,
+            max_workers,
+        )
+
     def get_river_chart(self, chart_id: str) -> dict:
         """Get a River chart by ID.
 
@@ -1897,9 +1518,52 @@ class Datawrapper:
             "deleted": json.dumps(deleted),
         }
 
-        return self.get(
-            self._THEMES_URL,
-            params=_query,
+        return self._cached_reference(
+            "themes",
+            (limit, offset, deleted),
+            lambda: self.get(
+                self._THEMES_URL,
+                params=_query,
+            ),
+        )
+
+    def iter_themes(
+        self,
+        deleted: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+        max_workers: int = 1,
+    ) -> Iterator[dict]:
+        """Iterate over every theme in your Datawrapper account, fetching pages as needed.
+
+        Parameters
+        ----------
+        deleted : bool, optional
+            Whether to include deleted themes, by default False.
+        page_size : int, optional
+            Number of themes requested per page, by default and at most 100.
+        prefetch : bool, optional
+            Fetch the next page in the background while the current one is being
+            consumed, by default False.
+        max_workers : int, optional
+            Number of pages fetched at once, by default 1. Above 1, the total count
+            on the first page is used to fetch the remaining pages concurrently,
+            and the items are still yielded in order.
+
+        Yields
+        ------
+        dict
+            One theme at a time.
+        """
+        return self._iter_items(
+            lambda limit, offset: self.get_themes(
+                limit=limit,
+                offset=offset,
+                deleted=deleted,
+            ),
+            page_size,
+            prefetch,
+            max_workers,
         )
 
     #
@@ -1948,52 +1612,63 @@ class Datawrapper:
 
         return self.get(self._WORKSPACES_URL, params=_query)
 
-    def get_workspace(self, workspace_slug: str) -> dict:
-        """Get an existing workspace by its slug.
+    def iter_workspaces(
+        self,
+        search: str | None = None,
+        order: str = "ASC",
+        order_by: str = "name",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+        max_workers: int = 1,
+    ) -> Iterator[dict]:
+        """Iterate over every workspace in your account, fetching pages as needed.
 
         Parameters
         ----------
-        workspace_slug : str
-            Slug of workspace to get.
-
-        Returns
-        -------
+        search, order, order_by : optional
+            Filters and ordering, see :meth:`get_workspaces`.
+        page_size : int, optional
+            Number of workspaces requested per page, by default and at most 100.
+        prefetch : bool, optional
+            Fetch the next page in the background while the current one is being
+            consumed, by default False.
+        max_workers : int, optional
+            Number of pages fetched at once, by default 1. Above 1, the total count
+            on the first page is used to fetch the remaining pages concurrently,
+            and the items are still yielded in order.
+
+        Yields
+        ------
         dict
-            A dictionary containing the workspace's information.
+            One workspace at a time.
         """
-        return self.get(f"{self._WORKSPACES_URL}/{workspace_slug}")
+        return self._iter_items(
+            lambda limit, offset: self.get_workspaces(
+                search=search,
+                order=order,
+                order_by=order_by,
+                limit=limit,
+                offset=offset,
+            ),
+            page_size,
+            prefetch,
+            max_workers,
+        )
 
-    def create_workspace(
-        self,
-        name: str,
-        slug: str | None = None,
-    ) -> dict:
-        """Create a new workspace.
+    def get_workspace(self, workspace_slug: str) -> dict:
+        """Get an existing workspace by its slug.
 
         Parameters
         ----------
-        name : str
-            Name of the workspace to be created (2-100 characters).
-        slug : str, optional
-            Slug for the workspace (2-100 characters). If not provided,
-            will be auto-generated from the name.
+        workspace_slug : str
+            Slug of workspace to get.
 
         Returns
         -------
         dict
             A dictionary containing the workspace's information.
         """
-        _query: dict = {"name": name}
-        if slug:
-            _query["slug"] = slug
-
-        response = self.post(
-            self._WORKSPACES_URL,
-            data=_query,
-            extra_headers={"content-type": "application/json"},
-        )
-        assert isinstance(response, dict)
-        return response
+        return self.get(f"{self._WORKSPACES_URL}/{workspace_slug}")
 
     def update_workspace(
         self,
@@ -2125,6 +1800,57 @@ class Datawrapper:
             f"{self._WORKSPACES_URL}/{workspace_slug}/members", params=_query
         )
 
+    def iter_workspace_members(
+        self,
+        workspace_slug: str,
+        search: str | None = None,
+        order: str = "ASC",
+        order_by: str = "name",
+        role: str | None = None,
+        include_invites: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+        max_workers: int = 1,
+    ) -> Iterator[dict]:
+        """Iterate over every member of a workspace, fetching pages as needed.
+
+        Parameters
+        ----------
+        workspace_slug : str
+            Slug of workspace to get members for.
+        search, order, order_by, role, include_invites : optional
+            Filters and ordering, see :meth:`get_workspace_members`.
+        page_size : int, optional
+            Number of members requested per page, by default and at most 100.
+        prefetch : bool, optional
+            Fetch the next page in the background while the current one is being
+            consumed, by default False.
+        max_workers : int, optional
+            Number of pages fetched at once, by default 1. Above 1, the total count
+            on the first page is used to fetch the remaining pages concurrently,
+            and the items are still yielded in order.
+
+        Yields
+        ------
+        dict
+            One member at a time.
+        """
+        return self._iter_items(
+            lambda limit, offset: self.get_workspace_members(
+                workspace_slug,
+                search=search,
+                order=order,
+                order_by=order_by,
+                limit=limit,
+                offset=offset,
+                role=role,
+                include_invites=include_invites,
+            ),
+            page_size,
+            prefetch,
+            max_workers,
+        )
+
     def update_workspace_members(
         self,
         workspace_slug: str,
@@ -2227,59 +1953,69 @@ class Datawrapper:
 
         return self.get(f"{self._WORKSPACES_URL}/{workspace_slug}/teams", params=_query)
 
-    def get_workspace_team(self, workspace_slug: str, team_id: str) -> dict:
-        """Get a team within a workspace.
+    def iter_workspace_teams(
+        self,
+        workspace_slug: str,
+        search: str | None = None,
+        order: str = "ASC",
+        order_by: str = "name",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+        max_workers: int = 1,
+    ) -> Iterator[dict]:
+        """Iterate over every team in a workspace, fetching pages as needed.
 
         Parameters
         ----------
         workspace_slug : str
-            Slug of workspace the team belongs to.
-        team_id : str
-            ID of team to get.
-
-        Returns
-        -------
+            Slug of workspace to get teams for.
+        search, order, order_by : optional
+            Filters and ordering, see :meth:`get_workspace_teams`.
+        page_size : int, optional
+            Number of teams requested per page, by default and at most 100.
+        prefetch : bool, optional
+            Fetch the next page in the background while the current one is being
+            consumed, by default False.
+        max_workers : int, optional
+            Number of pages fetched at once, by default 1. Above 1, the total count
+            on the first page is used to fetch the remaining pages concurrently,
+            and the items are still yielded in order.
+
+        Yields
+        ------
         dict
-            A dictionary containing the team's information.
+            One team at a time.
         """
-        return self.get(f"{self._WORKSPACES_URL}/{workspace_slug}/teams/{team_id}")
+        return self._iter_items(
+            lambda limit, offset: self.get_workspace_teams(
+                workspace_slug,
+                search=search,
+                order=order,
+                order_by=order_by,
+                limit=limit,
+                offset=offset,
+            ),
+            page_size,
+            prefetch,
+            max_workers,
+        )
 
-    def create_workspace_team(
-        self,
-        workspace_slug: str,
-        name: str,
-        is_private: bool = False,
-        icon: str | None = None,
-    ) -> dict:
-        """Create a new team in a workspace.
+    def get_workspace_team(self, workspace_slug: str, team_id: str) -> dict:
+        """Get a team within a workspace.
 
         Parameters
         ----------
         workspace_slug : str
-            Slug of workspace to create team in.
-        name : str
-            Name of the team to be created.
-        is_private : bool, optional
-            Whether the team should be private, by default False.
-        icon : str, optional
-            Icon for the team (one of 183 available icons).
+            Slug of workspace the team belongs to.
+        team_id : str
+            ID of team to get.
 
         Returns
         -------
         dict
             A dictionary containing the team's information.
         """
-        _query: dict = {"name": name, "isPrivate": is_private}
-        if icon:
-            _query["icon"] = icon
-
-        response = self.post(
-            f"{self._WORKSPACES_URL}/{workspace_slug}/teams",
-            data=_query,
-            extra_headers={"content-type": "application/json"},
-        )
-        assert isinstance(response, dict)
-        return response
+        return self.get(f"{self._WORKSPACES_URL}/{workspace_slug}/teams/{team_id}")
 
     def update_workspace_team(
         self,
@@ -2437,23 +2173,23 @@ class Datawrapper:
             params=_query,
         )
 
-    def add_workspace_team_members(
+    def update_workspace_team_members(
         self,
         workspace_slug: str,
         team_id: str,
-        user_ids: list[int],
+        member_ids: list[int],
         role: str = "member",
-    ) -> bool:
-        """Add one or multiple users to a workspace team.
+    ) -> dict:
+        """Modify the role of users in a workspace team.
 
         Parameters
         ----------
         workspace_slug : str
             Slug of workspace the team belongs to.
         team_id : str
-            ID of team to add users to.
-        user_ids : list[int]
-            Array of user IDs to add to the team.
+            ID of team to update members in.
+        member_ids : list[int]
+            IDs of the users to modify in the team.
         role : str, optional
             Role to assign to the users in the team. One of "manager" or "member".
             By default "member".
@@ -2461,58 +2197,19 @@ class Datawrapper:
         Returns
         -------
         bool
-            True if the users were added successfully.
+            True if the members were updated successfully.
         """
         _query = {
-            "userIds": user_ids,
+            "memberIds": member_ids,
             "role": role,
         }
 
-        response = self.post(
+        return self.patch(
             f"{self._WORKSPACES_URL}/{workspace_slug}/teams/{team_id}/members",
             data=_query,
-            extra_headers={"content-type": "application/json"},
         )
-        assert isinstance(response, bool)
-        return response
 
-    def update_workspace_team_members(
-        self,
-        workspace_slug: str,
-        team_id: str,
-        member_ids: list[int],
-        role: str = "member",
-    ) -> dict:
-        """Modify the role of users in a workspace team.
-
-        Parameters
-        ----------
-        workspace_slug : str
-            Slug of workspace the team belongs to.
-        team_id : str
-            ID of team to update members in.
-        member_ids : list[int]
-            IDs of the users to modify in the team.
-        role : str, optional
-            Role to assign to the users in the team. One of "manager" or "member".
-            By default "member".
-
-        Returns
-        -------
-        bool
-            True if the members were updated successfully.
-        """
-        _query = {
-            "memberIds": member_ids,
-            "role": role,
-        }
-
-        return self.patch(
-            f"{self._WORKSPACES_URL}/{workspace_slug}/teams/{team_id}/members",
-            data=_query,
-        )
-
-    def remove_workspace_team_members(
+    def remove_workspace_team_members(
         self,
         workspace_slug: str,
         team_id: str,
@@ -2591,6 +2288,51 @@ class Datawrapper:
 
         return self.get(self._USERS_URL, params=_query)
 
+    def iter_users(
+        self,
+        team_id: str | None = None,
+        search: str | None = None,
+        order: str = "ASC",
+        order_by: str = "id",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+        max_workers: int = 1,
+    ) -> Iterator[dict]:
+        """Iterate over every user in your Datawrapper account, fetching pages as needed.
+
+        Parameters
+        ----------
+        team_id, search, order, order_by : optional
+            Filters and ordering, see :meth:`get_users`.
+        page_size : int, optional
+            Number of users requested per page, by default and at most 100.
+        prefetch : bool, optional
+            Fetch the next page in the background while the current one is being
+            consumed, by default False.
+        max_workers : int, optional
+            Number of pages fetched at once, by default 1. Above 1, the total count
+            on the first page is used to fetch the remaining pages concurrently,
+            and the items are still yielded in order.
+
+        Yields
+        ------
+        dict
+            One user at a time.
+        """
+        return self._iter_items(
+            lambda limit, offset: self.get_users(
+                team_id=team_id,
+                search=search,
+                order=order,
+                order_by=order_by,
+                limit=limit,
+                offset=offset,
+            ),
+            page_size,
+            prefetch,
+            max_workers,
+        )
+
     def get_user(self, user_id: str) -> dict:
         """Get an existing user.
 
@@ -2745,6 +2487,49 @@ class Datawrapper:
             params=_query,
         )
 
+    def iter_recently_edited_charts(
+        self,
+        user_id: int | str,
+        min_last_edit_step: str | int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+        max_workers: int = 1,
+    ) -> Iterator[dict]:
+        """Iterate over all of a user's recently edited charts, fetching pages as needed.
+
+        Parameters
+        ----------
+        user_id : int | str
+            ID of user to get recently edited charts for.
+        min_last_edit_step : str | int, optional
+            See :meth:`get_recently_edited_charts`.
+        page_size : int, optional
+            Number of charts requested per page, by default and at most 100.
+        prefetch : bool, optional
+            Fetch the next page in the background while the current one is being
+            consumed, by default False.
+        max_workers : int, optional
+            Number of pages fetched at once, by default 1. Above 1, the total count
+            on the first page is used to fetch the remaining pages concurrently,
+            and the items are still yielded in order.
+
+        Yields
+        ------
+        dict
+            One chart at a time.
+        """
+        return self._iter_items(
+            lambda limit, offset: self.get_recently_edited_charts(
+                user_id,
+                limit=limit,
+                offset=offset,
+                min_last_edit_step=min_last_edit_step,
+            ),
+            page_size,
+            prefetch,
+            max_workers,
+        )
+
     def get_recently_published_charts(
         self,
         user_id: int | str,
@@ -2784,3 +2569,1613 @@ class Datawrapper:
             self._USERS_URL + f"/{user_id}/recently-published-charts",
             params=_query,
         )
+
+    def iter_recently_published_charts(
+        self,
+        user_id: int | str,
+        min_last_edit_step: str | int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+        max_workers: int = 1,
+    ) -> Iterator[dict]:
+        """Iterate over all of a user's recently published charts, fetching pages as needed.
+
+        Parameters
+        ----------
+        user_id : int | str
+            ID of user to get recently published charts for.
+        min_last_edit_step : str | int, optional
+            See :meth:`get_recently_published_charts`.
+        page_size : int, optional
+            Number of charts requested per page, by default and at most 100.
+        prefetch : bool, optional
+            Fetch the next page in the background while the current one is being
+            consumed, by default False.
+        max_workers : int, optional
+            Number of pages fetched at once, by default 1. Above 1, the total count
+            on the first page is used to fetch the remaining pages concurrently,
+            and the items are still yielded in order.
+
+        Yields
+        ------
+        dict
+            One chart at a time.
+        """
+        return self._iter_items(
+            lambda limit, offset: self.get_recently_published_charts(
+                user_id,
+                limit=limit,
+                offset=offset,
+                min_last_edit_step=min_last_edit_step,
+            ),
+            page_size,
+            prefetch,
+            max_workers,
+        )
+
+
+class Datawrapper(BaseDatawrapper):
+    """Handles working with the Datawrapper API.
+
+    Your main interface for configuring Datawrapper, creating, editing and
+    publishing charts, maps and tables.
+    """
+
+    _POOL_CONNECTIONS = 10  #: The default number of per-host connection pools to keep
+    _POOL_MAXSIZE = 10  #: The default number of connections to keep open per host
+
+    _shared_session: r.Session | None = None
+    _shared_session_lock = threading.Lock()
+
+    def __init__(
+        self,
+        access_token=BaseDatawrapper._ACCESS_TOKEN,
+        session: r.Session | None = None,
+        pool_connections: int | None = None,
+        pool_maxsize: int | None = None,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        retry: RetryPolicy | int | None = None,
+        rate_limit: float | TokenBucket | RateLimiter | None = None,
+        compression: Encoding | None = None,
+        compression_min_size: int = 1024,
+        http_cache: CacheBackend | bool | None = None,
+        reference_cache: ReferenceCache | bool | None = None,
+    ):
+        """Initalize a connection with the Datawrapper API.
+
+        By default every client in the process shares one connection-pooled
+        ``requests.Session``, so chart objects and ad hoc clients reuse open
+        TCP/TLS connections. Passing any of the pool settings gives this client a
+        dedicated session configured accordingly.
+
+        Parameters
+        ----------
+        access_token : str, optional
+            The access token to use, by default it will look for DATAWRAPPER_ACCESS_TOKEN environment variable.
+            To create a token head to app.datawrapper.de/account/api-tokens.
+        session : requests.Session, optional
+            A session to send all requests through, by default None. It is not closed
+            by :meth:`close`, since the caller owns it.
+        pool_connections : int, optional
+            Number of per-host connection pools to cache, by default 10.
+        pool_maxsize : int, optional
+            Maximum number of connections to keep open per host, by default 10.
+        pool_block : bool, optional
+            Whether to block when all ``pool_maxsize`` connections to a host are busy
+            instead of opening throwaway connections, by default False.
+        keep_alive : bool, optional
+            Whether to keep connections open between requests, by default True.
+        retry : RetryPolicy | int, optional
+            How to retry rate-limited requests, server errors and connection failures.
+            An integer is shorthand for ``RetryPolicy(max_retries=...)``. By default
+            None, which raises on the first failure.
+        rate_limit : float | TokenBucket | RateLimiter, optional
+            Pace every request through a thread-safe token bucket. A number is the
+            allowed requests per second; a :class:`RateLimiter` can add separate
+            budgets for expensive endpoints such as exports and publishing. Share
+            one limiter between clients to enforce a budget across all of them.
+            By default None, which sends requests as fast as they are made.
+        compression : {"gzip", "deflate"}, optional
+            Compress request bodies with this ``Content-Encoding``. If the server
+            answers 415 Unsupported Media Type, the request is sent again
+            uncompressed and compression stays off for this client. By default
+            None, which sends bodies uncompressed.
+        compression_min_size : int, optional
+            Smallest body in bytes worth compressing, by default 1024. Streamed
+            uploads are always compressed.
+        http_cache : CacheBackend | bool, optional
+            Cache GET responses that carry an ``ETag`` or ``Last-Modified`` header
+            and revalidate them with ``If-None-Match``/``If-Modified-Since``. A 304
+            Not Modified answer returns the cached object without downloading the
+            body again. Pass a :class:`MemoryCache` or :class:`DiskCache`, or True
+            for a default in-memory cache. By default None, which caches nothing.
+        reference_cache : ReferenceCache | bool, optional
+            Cache the results of :meth:`get_themes`, :meth:`get_basemaps`,
+            :meth:`get_basemap`, :meth:`get_folders`, :meth:`get_token_scopes` and
+            :meth:`get_my_account` for a per-category TTL. Folder and account
+            changes made through this client clear the affected entries. Pass a
+            :class:`ReferenceCache`, or True for the default TTLs. By default None,
+            which caches nothing.
+        """
+        super().__init__(
+            access_token,
+            retry=retry,
+            rate_limit=rate_limit,
+            compression=compression,
+            compression_min_size=compression_min_size,
+            http_cache=http_cache,
+            reference_cache=reference_cache,
+        )
+
+        # Pick the session this client sends its requests through
+        if session is not None:
+            self._session = session
+            self._owns_session = False
+        elif (
+            pool_connections is not None
+            or pool_maxsize is not None
+            or pool_block
+            or not keep_alive
+        ):
+            self._session = self.create_session(
+                pool_connections=pool_connections or self._POOL_CONNECTIONS,
+                pool_maxsize=pool_maxsize or self._POOL_MAXSIZE,
+                pool_block=pool_block,
+                keep_alive=keep_alive,
+            )
+            self._owns_session = True
+        else:
+            self._session = self._get_shared_session()
+            self._owns_session = False
+
+    @classmethod
+    def create_session(
+        cls,
+        pool_connections: int = _POOL_CONNECTIONS,
+        pool_maxsize: int = _POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ) -> r.Session:
+        """Create a connection-pooled session suitable for the Datawrapper API.
+
+        The result can be handed to several clients via the ``session`` argument so
+        they all draw from the same pool.
+
+        Parameters
+        ----------
+        pool_connections : int, optional
+            Number of per-host connection pools to cache, by default 10.
+        pool_maxsize : int, optional
+            Maximum number of connections to keep open per host, by default 10.
+        pool_block : bool, optional
+            Whether to block when the pool for a host is exhausted, by default False.
+        keep_alive : bool, optional
+            Whether to keep connections open between requests, by default True.
+
+        Returns
+        -------
+        requests.Session
+            A new session with the pooled adapter mounted for http and https.
+        """
+        session = r.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    @classmethod
+    def _get_shared_session(cls) -> r.Session:
+        """Get the process-wide session, creating it on first use.
+
+        Returns
+        -------
+        requests.Session
+            The session shared by all clients created without pool settings.
+        """
+        with cls._shared_session_lock:
+            if cls._shared_session is None:
+                cls._shared_session = cls.create_session()
+            return cls._shared_session
+
+    @property
+    def session(self) -> r.Session:
+        """The ``requests.Session`` this client sends its requests through."""
+        return self._session
+
+    def close(self) -> None:
+        """Close the client's connection pool if the client created it.
+
+        Shared and caller-provided sessions are left open.
+        """
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> Datawrapper:
+        """Use the client as a context manager that closes its pool on exit."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the client's connection pool."""
+        self.close()
+
+    #
+    # Web request methods
+    #
+
+    def _request(self, method: str, url: str, **kwargs) -> r.Response:
+        """Send a request through the client's pooled session.
+
+        When the client has a rate limiter, every attempt waits for its turn
+        first. When the client has a retry policy, rate-limited responses, retryable
+        server errors and connection failures are retried with exponential
+        backoff, waiting as long as the server asks via ``Retry-After`` or
+        ``X-RateLimit-*`` headers. Requests whose body is a one-shot iterator
+        are never retried, because the body cannot be sent again.
+
+        When the client compresses request bodies and the server rejects a
+        compressed body, the request is sent again uncompressed.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method to use.
+        url : str
+            The URL to request.
+        **kwargs
+            Keyword arguments passed through to ``requests.Session.request``.
+
+        Returns
+        -------
+        requests.Response
+            The raw response. Responses that are still failing once the retry
+            budget is spent are returned for the caller to handle.
+        """
+        replayable = not isinstance(kwargs.get("data"), Iterator)
+        retry = self._retry if replayable else None
+        compressed_kwargs = self._compress(kwargs, "data")
+
+        attempt = 0
+        while True:
+            send_kwargs = (
+                compressed_kwargs
+                if compressed_kwargs is not None and not self._compression_rejected
+                else kwargs
+            )
+            compressed = send_kwargs is not kwargs
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire(url)
+            started = time.monotonic()
+            try:
+                response = self._session.request(method, url, **send_kwargs)
+            except (r.ConnectionError, r.Timeout):
+                self._track(started)
+                if retry is None or not retry.should_retry_error(method, attempt):
+                    raise
+                delay = retry.get_backoff(attempt)
+                logger.warning(
+                    f"{method} {url} failed to connect, retrying in {delay:.2f}s."
+                )
+            else:
+                self._track(started, response, streamed=kwargs.get("stream", False))
+                if compressed and response.status_code == UNSUPPORTED_MEDIA_TYPE:
+                    # Stop compressing even if this body can't be sent again
+                    self._reject_compression(method, url)
+                    if replayable:
+                        continue
+                if (
+                    retry is None
+                    or response.ok
+                    or not retry.should_retry_status(
+                        method, response.status_code, attempt
+                    )
+                ):
+                    return response
+                delay = retry.get_delay(attempt, response.headers)
+                logger.warning(
+                    f"{method} {url} returned status code {response.status_code}, "
+                    f"retrying in {delay:.2f}s."
+                )
+                # Release the connection of a streamed response before retrying
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def delete(
+        self,
+        url: str,
+        timeout: int = 15,
+        data: dict | None = None,
+        extra_headers: dict | None = None,
+    ) -> bool:
+        """Make a DELETE request to the Datawrapper API.
+
+        Parameters
+        ----------
+        url : str
+            The URL to request.
+        timeout : int, optional
+            The timeout for the request in seconds, by default 15
+        data : dict, optional
+            A dictionary of data to pass to the request, by default None
+        extra_headers : dict, optional
+            A dictionary of extra headers to pass to the request, by default None
+
+        Returns
+        -------
+        bool
+            Whether the request was successful.
+        """
+        # Set the headers
+        headers = self._get_auth_header()
+        headers["accept"] = "*/*"
+
+        # Add extra headers if provided
+        if extra_headers:
+            headers.update(extra_headers)
+
+        # Set kwargs
+        kwargs = {"headers": headers, "timeout": timeout}
+
+        # Add data if provided
+        if data:
+            kwargs["json"] = data
+
+        # Make the request
+        response = self._request("DELETE", url, **kwargs)  # type: ignore[arg-type]
+
+        # Handle the response
+        if response.ok:
+            return True
+        logger.error(f"Delete request failed with status code {response.status_code}.")
+        if response.status_code == 429:
+            raise RateLimitError(response)
+        raise FailedRequestError(response)
+
+    def get(
+        self,
+        url: str,
+        params: dict | None = None,
+        timeout: int = 15,
+        raw: bool = False,
+    ) -> Any:
+        """Make a GET request to the Datawrapper API.
+
+        Parameters
+        ----------
+        url : str
+            The URL to request.
+        params : dict, optional
+            A dictionary of parameters to pass to the request, by default None
+        timeout : int, optional
+            The timeout for the request in seconds, by default 15
+        raw : bool, optional
+            Return the body as bytes instead of parsing JSON and CSV responses,
+            by default False
+
+        Returns
+        -------
+        Any
+            An object containing the response from the API.
+        """
+        # Set headers
+        headers = self._get_auth_header()
+        headers["accept"] = "*/*"
+
+        # Ask the server to confirm a cached copy instead of sending it again
+        key = entry = None
+        if self._http_cache is not None:
+            key = self._cache_key(url, params)
+            entry = self._http_cache.get(key)
+            if entry is not None:
+                headers.update(entry.conditional_headers())
+
+        # Make the request
+        response = self._request(
+            "GET",
+            url,
+            headers=headers,
+            params=params,
+            timeout=timeout,
+        )
+
+        # Serve the cached copy if it is still current
+        if entry is not None and response.status_code == NOT_MODIFIED:
+            self._store_cached(key, entry.revalidated())
+            return entry.body if raw else entry.parse()
+
+        # Check if the request was successful
+        if response.ok:
+            if key is not None:
+                self._store_cached(
+                    key, CacheEntry.from_response(response.headers, response.content)
+                )
+            if raw:
+                return response.content
+            # Return the data as json if the mimetype is json
+            if "json" in response.headers["content-type"]:
+                return response.json()
+            # If it's a csv, parse the body into a dataframe
+            if "text/csv" in response.headers["content-type"]:
+                return read_csv_data(response.content)
+            # Otherwise just return the content
+            return response.content
+        # If not, raise an exception
+        logger.error(f"Get request failed with status code {response.status_code}.")
+        if response.status_code == 429:
+            raise RateLimitError(response)
+        raise FailedRequestError(response)
+
+    def _cached_reference(
+        self, category: str, key: Hashable, fetch: Callable[[], Any]
+    ) -> Any:
+        """Return reference data from the cache, fetching it on a miss.
+
+        Parameters
+        ----------
+        category : str
+            The kind of reference data, see :class:`ReferenceCache`.
+        key : Hashable
+            Identifies the call within the category, such as its arguments.
+        fetch : Callable
+            Requests the data from the API.
+
+        Returns
+        -------
+        Any
+            The cached or freshly fetched data.
+        """
+        if self._reference_cache is None:
+            return fetch()
+        hit, value = self._reference_cache.lookup(category, key)
+        if hit:
+            return value
+        value = fetch()
+        self._reference_cache.store(category, key, value)
+        return value
+
+    def _invalidating(self, category: str, result: Any) -> Any:
+        """Drop cached reference data that a completed change has made stale."""
+        self.invalidate_reference_cache(category)
+        return result
+
+    def _iter_items(
+        self,
+        fetch_page: Callable[[int, int], Any],
+        page_size: int,
+        prefetch: bool,
+        max_workers: int = 1,
+    ) -> Iterator[Any]:
+        """Iterate over every item of a paginated endpoint.
+
+        Parameters
+        ----------
+        fetch_page : Callable
+            Fetches the page with the given limit and offset.
+        page_size : int
+            Number of items requested per page.
+        prefetch : bool
+            Whether to fetch the next page in the background.
+        max_workers : int, optional
+            Number of pages fetched at once, by default 1.
+
+        Returns
+        -------
+        Iterator
+            The items, in order.
+        """
+        return iter_items(
+            fetch_page, page_size, prefetch=prefetch, max_workers=max_workers
+        )
+
+    def download(
+        self,
+        url: str,
+        destination: str | os.PathLike | BinaryIO,
+        params: dict | None = None,
+        timeout: int = 15,
+        checksum: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Download:
+        """Stream the body of a GET request to a file without holding it in memory.
+
+        Parameters
+        ----------
+        url : str
+            The URL to request.
+        destination : str | os.PathLike | BinaryIO
+            A path to write to, or a binary file-like object. A path is only
+            replaced once the download is complete.
+        params : dict, optional
+            A dictionary of parameters to pass to the request, by default None
+        timeout : int, optional
+            The timeout for the request in seconds, by default 15
+        checksum : str, optional
+            Name of a hashlib algorithm, such as "sha256", to compute a checksum of
+            the content while it is written, by default None
+        chunk_size : int, optional
+            Number of bytes read from the network at a time, by default 65,536
+
+        Returns
+        -------
+        Download
+            The path, size and checksum of the downloaded file.
+        """
+        # Set headers
+        headers = self._get_auth_header()
+        headers["accept"] = "*/*"
+
+        sink = DownloadSink(destination, checksum)
+        try:
+            # Make the request without reading the body
+            response = self._request(
+                "GET",
+                url,
+                headers=headers,
+                params=params,
+                timeout=timeout,
+                stream=True,
+            )
+            try:
+                if not response.ok:
+                    logger.error(
+                        f"Get request failed with status code {response.status_code}."
+                    )
+                    if response.status_code == 429:
+                        raise RateLimitError(response)
+                    raise FailedRequestError(response)
+
+                # Write the body as it arrives
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    sink.write(chunk)
+                    if self._stats is not None:
+                        self._stats.add_bytes(len(chunk))
+            finally:
+                response.close()
+        except BaseException:
+            sink.abort()
+            raise
+
+        return sink.commit()
+
+    def patch(
+        self,
+        url: str,
+        data: dict | None = None,
+        timeout: int = 15,
+        extra_headers: dict | None = None,
+    ) -> dict:
+        """Make a PATCH request to the Datawrapper API.
+
+        Parameters
+        ----------
+        url : str
+            The URL to request.
+        data : dict
+            A dictionary of data to pass to the request, by default None
+        timeout : int, optional
+            The timeout for the request in seconds, by default 15
+        extra_headers : dict, optional
+            A dictionary of extra headers to pass to the request, by default None
+
+        Returns
+        -------
+        dict
+            A dictionary containing the response from the API.
+        """
+        # Set headers
+        headers = self._get_auth_header()
+        headers["accept"] = "*/*"
+        headers["content-type"] = "application/json"
+
+        # Add extra headers if provided
+        if extra_headers:
+            headers.update(extra_headers)
+
+        # Set kwargs to post
+        kwargs = {"headers": headers, "timeout": timeout}
+
+        # Convert data to json
+        if data:
+            kwargs["data"] = json.dumps(data)
+
+        # Make the request
+        response = self._request("PATCH", url, **kwargs)  # type: ignore[arg-type]
+
+        # Check if the request was successful
+        if response.ok:
+            # Return the data as json
+            return response.json()
+        # If not, raise an exception
+        logger.error(f"Patch request failed with status code {response.status_code}.")
+        if response.status_code == 429:
+            raise RateLimitError(response)
+        raise FailedRequestError(response)
+
+    def post(
+        self,
+        url: str,
+        data: dict | None = None,
+        timeout: int = 30,
+        extra_headers: dict | None = None,
+    ) -> dict | bool:
+        """Make a POST request to the Datawrapper API.
+
+        Parameters
+        ----------
+        url : str
+            The URL to request.
+        data : dict
+            A dictionary of data to pass to the request, by default None
+        timeout : int, optional
+            The timeout for the request in seconds, by default 15
+        extra_headers : dict, optional
+            A dictionary of extra headers to pass to the request, by default None
+
+        Returns
+        -------
+        dict | bool
+            A dictionary containing the response from the API or True if the request was
+            successful but did not return any data.
+        """
+        # Set headers
+        headers = self._get_auth_header()
+        headers["accept"] = "*/*"
+
+        # Add extra headers if provided
+        if extra_headers:
+            headers.update(extra_headers)
+
+        # Set kwargs to post
+        kwargs = {"headers": headers, "timeout": timeout}
+
+        # Convert data to json
+        if data:
+            kwargs["data"] = json.dumps(data)
+
+        # Make the request
+        response = self._request("POST", url, **kwargs)  # type: ignore[arg-type]
+
+        # Check if the request was successful
+        if response.ok:
+            # Return the data as json
+            if response.text:
+                return response.json()
+            return True
+        # If not, raise an exception
+        logger.error(f"Post request failed with status code {response.status_code}.")
+        if response.status_code == 429:
+            raise RateLimitError(response)
+        raise FailedRequestError(response)
+
+    def put(
+        self,
+        url: str,
+        data: dict | bytes | Iterable[bytes] | None = None,
+        timeout: int = 15,
+        extra_headers: dict | None = None,
+        dump_data: bool = True,
+    ) -> bool:
+        """Make a PUT request to the Datawrapper API.
+
+        Parameters
+        ----------
+        url : str
+            The URL to request.
+        data : dict | bytes | Iterable[bytes]
+            A dictionary of data to pass to the request, or raw bytes or an iterable
+            of byte chunks to stream when dump_data is False, by default None
+        timeout : int, optional
+            The timeout for the request in seconds, by default 15
+        extra_headers : dict, optional
+            A dictionary of extra headers to pass to the request, by default None
+        dump_data: bool, optional
+            Whether to dump the data to json, by default True
+
+        Returns
+        -------
+        bool
+            Whether the request was successful.
+        """
+        # Set headers
+        headers = self._get_auth_header()
+        headers["accept"] = "*/*"
+
+        # Add extra headers if provided
+        if extra_headers:
+            headers.update(extra_headers)
+
+        # Set kwargs to post
+        kwargs = {"headers": headers, "timeout": timeout}
+
+        # Convert data to json
+        if data:
+            if dump_data:
+                kwargs["data"] = json.dumps(data)
+            else:
+                kwargs["data"] = data
+
+        # Make the request
+        response = self._request("PUT", url, **kwargs)  # type: ignore[arg-type]
+
+        # Handle the response
+        if response.ok:
+            return True
+        logger.error(f"Put request failed with status code {response.status_code}.")
+        if response.status_code == 429:
+            raise RateLimitError(response)
+        raise FailedRequestError(response)
+
+    #
+    # Login token actions
+    #
+
+    def create_login_token(self) -> dict:
+        """Creates a new login token to authenticate a user, for use in CMS integrations.
+
+        Login tokens are valid for five minutes and can only be used once.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the login token's information.
+        """
+        response = self.post(
+            self._LOGIN_TOKENS_URL,
+            extra_headers={"content-type": "application/json"},
+        )
+        assert isinstance(response, dict)
+        return response
+
+    #
+    # API token methods
+    #
+
+    def create_api_token(self, comment: str, scopes: list[str]) -> dict:
+        """Create a new API Token.
+
+        Make sure to save the token somewhere, since you won't be able to see it again. Requires scope `auth:write`.
+
+        Parameters
+        ----------
+        comment : str
+            Comment to describe the API token. Tip: Use something to remember where this specific token is used.
+        scopes : list[str]
+            List of scopes for the API token.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the API token's information.
+        """
+        response = self.post(
+            self._API_TOKEN_URL,
+            data={"comment": comment, "scopes": scopes},
+            extra_headers={"content-type": "application/json"},
+        )
+        assert isinstance(response, dict)
+        return response
+
+    #
+    # Charts methods
+    #
+
+    def create_chart(
+        self,
+        title: str,
+        chart_type: str,
+        theme: str | None = None,
+        data: pd.DataFrame | str | None = None,
+        external_data_url: str | None = None,
+        folder_id: int | None = None,
+        organization_id: str | None = None,
+        forkable: bool | None = None,
+        language: str | None = None,
+        metadata: dict | None = None,
+    ) -> dict:
+        """Creates a new Datawrapper chart, table or map.
+
+        .. deprecated::
+            Use the object-oriented chart classes instead (e.g., BarChart, LineChart).
+            This method will be removed in a future version.
+
+        Parameters
+        ----------
+        title : str
+            Title for new chart, table or map, by default "New Chart"
+        chart_type : str
+            Chart type to be created. See https://developer.datawrapper.de/docs/chart-types
+        theme : str, optional
+            Theme to use for new chart, table or map, by default None
+        data : pd.DataFrame | str, optional
+            A pandas DataFrame or string containing the data to be added,
+            by default None
+        external_data_url: str, optional
+            URL to external data to be added to the chart, table or map,
+        folder_id : int, optional
+            ID of folder in Datawrapper.de for the chart, table or map to be created in,
+            by default ""
+        organization_id : str, optional
+            ID of the team where the chart should be created. The authenticated user
+            must have access to this team.
+        forkable : bool, optional
+            Whether the chart should be forkable or not, by default None
+        language: str, optional
+            Locale of the chart (i.e. en-US), by default None
+        metadata: dict, optional
+            A Python dictionary of properties to add.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the created chart's information.
+        """
+        warnings.warn(
+            "create_chart() is deprecated and will be removed in a future version. "
+            "Use the object-oriented chart classes instead. "
+            "Example: chart = BarChart(title='My Chart', data=df).create()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        # Set chart properties
+        _query: dict[str, Any] = {"title": title, "type": chart_type}
+        _query.update(
+            self._chart_query(
+                theme=theme,
+                external_data_url=external_data_url,
+                folder_id=folder_id,
+                organization_id=organization_id,
+                forkable=forkable,
+                language=language,
+                metadata=metadata,
+            )
+        )
+
+        # Create chart
+        obj = self.post(
+            self._CHARTS_URL,
+            data=_query,
+            extra_headers={"content-type": "application/json"},
+        )
+        assert isinstance(obj, dict)
+
+        # Add data, if provided
+        if data is not None:
+            self.add_data(chart_id=obj["id"], data=data)
+
+        # Return the result
+        return obj
+
+    def update_chart(
+        self,
+        chart_id: str,
+        title: str | None = None,
+        chart_type: str | None = None,
+        theme: str | None = None,
+        data: pd.DataFrame | str | None = None,
+        external_data_url: str | None = None,
+        folder_id: int | None = None,
+        organization_id: str | None = None,
+        forkable: bool | None = None,
+        language: str | None = None,
+        metadata: dict | None = None,
+    ) -> dict:
+        """Updates a chart's title, theme, type, language, folder or organization.
+
+        .. deprecated::
+            Use the object-oriented chart classes instead (e.g., BarChart, LineChart).
+            This method will be removed in a future version.
+
+        Parameters
+        ----------
+        chart_id: str
+            ID Of chart, table, or map.
+        title: str, optional
+            New title
+        chart_type: str, optional
+            New chart type. See https://developer.datawrapper.de/docs/chart-types
+        theme: str, optional
+            New theme
+        data: pd.DataFrame | str, optional
+            A pandas DataFrame or string containing the data to be added,
+            by default None
+        external_data_url: str, optional
+            URL to external data to be added to the chart, table or map,
+        folder_id: int, optional
+            New folder's ID
+        organization_id: str, optional
+            New organization's ID
+        forkable: bool, optional
+            Whether the chart should be forkable or not, by default None
+        language : str, optional
+            New language
+        metadata: dict, optional
+            A Python dictionary of properties to add.
+
+        Return
+        ------
+        dict
+            A dictionary containing the updated chart's information.
+
+        Raises
+        ------
+        InvalidRequestError
+            If no updates are submitted.
+        """
+        warnings.warn(
+            "update_chart() is deprecated and will be removed in a future version. "
+            "Use the object-oriented chart classes instead. "
+            "Example: chart = BarChart.get(chart_id='abc123'); chart.title = 'New Title'; chart.update()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        # Load the query with the provided parameters
+        _query = self._chart_query(
+            title=title,
+            chart_type=chart_type,
+            theme=theme,
+            external_data_url=external_data_url,
+            folder_id=folder_id,
+            organization_id=organization_id,
+            forkable=forkable,
+            language=language,
+            metadata=metadata,
+        )
+
+        # If there's nothing there to update, raise an exception
+        if not _query and data is None:
+            msg = "No updates submitted."
+            logger.error(msg)
+            raise InvalidRequestError(msg)
+
+        # Update the chart
+        if _query:
+            obj = self.patch(
+                f"{self._CHARTS_URL}/{chart_id}",
+                data=_query,
+                extra_headers={"content-type": "application/json"},
+            )
+        else:
+            obj = self.get_chart(chart_id)
+
+        # Add data, if provided
+        if data is not None:
+            self.add_data(chart_id=obj["id"], data=data)
+
+        # Return the result
+        return obj
+
+    def display_chart(self, chart_id: str) -> IFrame:
+        """Displays a datawrapper chart.
+
+        Parameters
+        ----------
+        chart_id : str
+            ID of chart, table, or map.
+
+        Returns
+        -------
+        IPython.display.IFrame
+            IFrame displaying the chart.
+        """
+        obj = self.get_chart(chart_id)
+        src = obj["publicUrl"]
+        width = obj["metadata"]["publish"]["embed-width"]
+        height = obj["metadata"]["publish"]["embed-height"]
+        return IFrame(src, width=width, height=height)
+
+    def copy_chart(self, chart_id: str) -> dict:
+        """Copy one of your charts, tables, or maps and create a new editable copy.
+
+        .. deprecated::
+            Use the object-oriented chart classes instead (e.g., BarChart, LineChart).
+            This method will be removed in a future version.
+
+        Parameters
+        ----------
+        chart_id : str
+            ID of chart, table, or map.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the information of the chart, table, or map.
+        """
+        warnings.warn(
+            "copy_chart() is deprecated and will be removed in a future version. "
+            "Use the object-oriented chart classes instead. "
+            "Example: chart = BarChart.get(chart_id='abc123'); duplicate = chart.duplicate()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        response = self.post(f"{self._CHARTS_URL}/{chart_id}/copy")
+        assert isinstance(response, dict)
+        return response
+
+    def fork_chart(self, chart_id: str) -> dict:
+        """Fork a chart, table, or map and create an editable copy.
+
+        .. deprecated::
+            Use the object-oriented chart classes instead (e.g., BarChart, LineChart).
+            This method will be removed in a future version.
+
+        Parameters
+        ----------
+        chart_id : str
+            ID of chart, table, or map.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the information of the chart, table, or map.
+        """
+        warnings.warn(
+            "fork_chart() is deprecated and will be removed in a future version. "
+            "Use the object-oriented chart classes instead. "
+            "Example: chart = BarChart.get(chart_id='abc123'); fork = chart.fork()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        response = self.post(f"{self._CHARTS_URL}/{chart_id}/fork")
+        assert isinstance(response, dict)
+        return response
+
+    def publish_chart(self, chart_id: str, display: bool = False) -> dict | IFrame:
+        """Publishes a chart, table or map.
+
+        .. deprecated::
+            Use the object-oriented chart classes instead (e.g., BarChart, LineChart).
+            This method will be removed in a future version.
+
+        Parameters
+        ----------
+        chart_id : str
+            ID of chart, table or map.
+        display : bool, optional
+            Display the published chart as output in notebook cell, by default False
+
+        Returns
+        -------
+        dict | IFrame
+            Either a dictionary containing the published chart's information or an IFrame
+            object displaying the chart.
+        """
+        warnings.warn(
+            "publish_chart() is deprecated and will be removed in a future version. "
+            "Use the object-oriented chart classes instead. "
+            "Example: chart = BarChart.get(chart_id='abc123'); chart.publish()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        obj = self.post(f"{self._CHARTS_URL}/{chart_id}/publish")
+        assert isinstance(obj, dict)
+        if display:
+            src = obj["data"]["publicUrl"]
+            width = obj["data"]["metadata"]["publish"]["embed-width"]
+            height = obj["data"]["metadata"]["publish"]["embed-height"]
+            return IFrame(src, width=width, height=height)
+        return obj
+
+    def sync_many(
+        self,
+        charts: Iterable[Any],
+        publish: bool = True,
+        max_workers: int = 8,
+        folder_id: int | None = None,
+        raise_on_error: bool = True,
+        checkpoint: Checkpoint | None = None,
+        progress: bool = False,
+    ) -> list[Any]:
+        """Create or update many charts, upload their data and publish them in parallel.
+
+        Charts without a chart_id are created, the others are updated. Saving and
+        publishing run in separate worker pools, so charts are published while
+        others are still being saved. See :class:`datawrapper.ChartBatch`.
+
+        Parameters
+        ----------
+        charts : Iterable[BaseChart]
+            The charts to save and publish. Every request is sent through this client.
+        publish : bool, optional
+            Publish each chart after saving it, by default True
+        max_workers : int, optional
+            Maximum number of concurrent requests per stage, by default 8
+        folder_id : int | None, optional
+            Folder to create new charts in, by default None
+        raise_on_error : bool, optional
+            Raise the errors of any failed charts as an ExceptionGroup once every
+            chart has been processed, by default True
+        checkpoint : Checkpoint | None, optional
+            Ledger to record finished charts in. A rerun with the same ledger skips
+            the charts that finished and never creates a chart twice, by default None
+        progress : bool, optional
+            Show a live progress bar with the request rate, latency and number of
+            rate-limited responses, by default False
+
+        Returns
+        -------
+        list[ChartResult]
+            One result per chart, in the same order as the charts.
+        """
+        # Import here to avoid circular imports
+        from .bulk import ChartBatch
+
+        batch = ChartBatch(
+            charts,
+            publish=publish,
+            max_workers=max_workers,
+            folder_id=folder_id,
+            client=self,
+            checkpoint=checkpoint,
+            progress=progress,
+        )
+        return batch.run(raise_on_error=raise_on_error)
+
+    def export_chart(
+        self,
+        chart_id: str,
+        unit: str = "px",
+        mode: str = "rgb",
+        width: int = 400,
+        height: int | str | None = None,
+        plain: bool = False,
+        zoom: int = 2,
+        scale: int = 1,
+        border_width: int = 20,
+        border_color: str | None = None,
+        transparent: bool = False,
+        download: bool = False,
+        full_vector: bool = False,
+        ligatures: bool = True,
+        logo: str = "auto",
+        logo_id: str | None = None,
+        dark: bool = False,
+        output: str = "png",
+        filepath: str = "./image.png",
+        display: bool = False,
+    ) -> Path | Image:
+        """Exports a chart, table, or map.
+
+        .. deprecated::
+            Use the object-oriented chart classes instead (e.g., BarChart, LineChart).
+            This method will be removed in a future version.
+
+        Parameters
+        ----------
+        chart_id : str
+            ID of chart, table, or map.
+        unit : str, optional
+            One of px, mm, inch. Defines the unit in which the borderwidth, height,
+            and width will be measured in, by default "px"
+        mode : str, optional
+            One of rgb or cmyk. Which color mode the output should be in,
+            by default "rgb"
+        width : int, optional
+            Width of visualization. If not specified, it takes the chart width,
+            by default 400
+        height : int | str, optional
+            Height of visualization. Can be a number or "auto", by default None
+        plain : bool, optional
+            Defines if only the visualization should be exported (True), or if it should
+             include header and footer as well (False), by default False
+        zoom : int, optional
+            Defines the multiplier for the png size, by default 2
+        scale : int, optional
+            Defines the multiplier for the pdf size, by default 1
+        border_width : int, optional
+            Margin around the visualization, by default 20
+        border_color : str, optional
+            Color of the border around the visualization, by default None
+        transparent : bool, optional
+            Set to `True` to export your visualization with a transparent background,
+            by default False
+        download : bool, optional
+            Whether to trigger a download, by default False
+        full_vector : bool, optional
+            Export as full vector graphic (for supported formats), by default False
+        ligatures : bool, optional
+            Enable typographic ligatures, by default True
+        logo : str, optional
+            Logo display setting. One of "auto", "on", or "off", by default "auto"
+        logo_id : str, optional
+            Custom logo ID to use, by default None
+        dark : bool, optional
+            Export in dark mode, by default False
+        output : str, optional
+            One of png, pdf, or svg, by default "png"
+        filepath : str, optional
+            Name/filepath to save output in, by default "./image.png"
+        display : bool, optional
+            Whether to display the exported image as output in the notebook cell,
+            by default False
+
+        Returns
+        -------
+        Path | Image
+            The file path to the exported image or an Image object displaying the image.
+        """
+        warnings.warn(
+            "export_chart() is deprecated and will be removed in a future version. "
+            "Use the object-oriented chart classes instead. "
+            "Example: chart = BarChart.get(chart_id='abc123'); png_data = chart.export_png(); Path('chart.png').write_bytes(png_data)",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        _query = self._export_query(
+            unit=unit,
+            mode=mode,
+            width=width,
+            height=height,
+            plain=plain,
+            zoom=zoom,
+            scale=scale,
+            border_width=border_width,
+            border_color=border_color,
+            transparent=transparent,
+            download=download,
+            full_vector=full_vector,
+            ligatures=ligatures,
+            logo=logo,
+            logo_id=logo_id,
+            dark=dark,
+        )
+
+        content = self.get(
+            f"{self._CHARTS_URL}/{chart_id}/export/{output}", params=_query
+        )
+
+        # Set the file path
+        _filepath = Path(filepath).with_suffix(f".{output}")
+
+        # Write the file to the file path
+        with open(_filepath, "wb") as fh:
+            fh.write(content)
+
+        # Display the image if requested
+        if display:
+            return Image(_filepath)
+        # Otherwise return the file path
+        logger.debug(f"File exported at {_filepath}")
+        return _filepath
+
+    def get_iframe_code(self, chart_id: str, responsive: bool = False) -> str:
+        """Returns a chart, table, or map's iframe embed code.
+
+        Parameters
+        ----------
+        chart_id : str
+            ID of chart, table, or map.
+        responsive : bool, optional
+            Whether to return a responsive iframe embed code., by default False
+
+        Returns
+        -------
+        str
+            iframe embed code.
+        """
+        obj = self.get_chart(chart_id)
+        if responsive:
+            iframe = obj["metadata"]["publish"]["embed-codes"][
+                "embed-method-responsive"
+            ]
+        else:
+            iframe = obj["metadata"]["publish"]["embed-codes"]["embed-method-iframe"]
+        return iframe
+
+    def upload_data(
+        self,
+        chart_id: str,
+        data: Any,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        timeout: int = 15,
+        content_type: str = "text/csv",
+    ) -> bool:
+        """Upload CSV data to a chart, table or map.
+
+        DataFrames are streamed to the API a chunk of rows at a time, so the full
+        CSV is never held in memory. polars DataFrames and pyarrow Tables are
+        encoded by their own CSV writer, without converting them to pandas.
+
+        Parameters
+        ----------
+        chart_id : str
+            ID of chart, table or map to add data to.
+        data : pd.DataFrame | list[dict] | str | bytes | Iterable[bytes]
+            The rows to upload, CSV text, or an iterable of CSV byte chunks. The
+            rows may also be a polars DataFrame or a pyarrow Table.
+            Bytes and byte chunks, including a list of them, are sent as they
+            are, without pandas. Only a list of dicts is encoded as rows. A
+            one-shot iterator, such as a generator, is not retried on failure.
+        chunk_rows : int, optional
+            Number of DataFrame rows encoded into each chunk, by default 50,000
+        timeout : int, optional
+            The timeout for the request in seconds, by default 15
+        content_type : str, optional
+            The ``Content-Type`` of the body, by default "text/csv". Pass
+            "application/json" when uploading JSON data as it is.
+
+        Returns
+        -------
+        bool
+            True if the data was uploaded successfully.
+        """
+        return self.put(
+            f"{self._CHARTS_URL}/{chart_id}/data",
+            data=self._data_body(data, chunk_rows),
+            timeout=timeout,
+            extra_headers={"content-type": content_type},
+            dump_data=False,
+        )
+
+    def copy_data(
+        self,
+        source_id: str,
+        destination_id: str,
+        timeout: int = 15,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> bool:
+        """Copy the data of one chart, table or map to another without parsing it.
+
+        The data is streamed from the source chart to the destination chart as
+        it arrives, so it is never held in memory or touched by pandas.
+
+        Parameters
+        ----------
+        source_id : str
+            ID of the chart, table or map to copy the data from.
+        destination_id : str
+            ID of the chart, table or map to copy the data to.
+        timeout : int, optional
+            The timeout for each request in seconds, by default 15
+        chunk_size : int, optional
+            Number of bytes read from the source at a time, by default 65,536
+
+        Returns
+        -------
+        bool
+            True if the data was copied successfully.
+        """
+        headers = self._get_auth_header()
+        headers["accept"] = "*/*"
+
+        # Read the source without loading its body
+        response = self._request(
+            "GET",
+            f"{self._CHARTS_URL}/{source_id}/data",
+            headers=headers,
+            timeout=timeout,
+            stream=True,
+        )
+        try:
+            if not response.ok:
+                logger.error(
+                    f"Get request failed with status code {response.status_code}."
+                )
+                if response.status_code == 429:
+                    raise RateLimitError(response)
+                raise FailedRequestError(response)
+
+            # Forward the body chunk by chunk as the upload's request body,
+            # labelled like the source so JSON map data isn't sent as CSV
+            return self.upload_data(
+                destination_id,
+                response.iter_content(chunk_size=chunk_size),
+                timeout=timeout,
+                content_type=response.headers.get("content-type", "text/csv"),
+            )
+        finally:
+            response.close()
+
+    def add_json(self, chart_id: str, data: Any) -> bool:
+        """Add JSON data to a specified chart.
+
+        Can be used to add point, area and line markers to a locator map or other chart.
+
+        Parameters
+        ----------
+        chart_id : str
+            ID of chart, table or map to add data to.
+        data : Any
+            JSON data to add to the chart.
+
+        Returns
+        -------
+        bool
+            True if the data was added successfully.
+        """
+        # Set the chart metadata to accept JSON data
+        self.update_chart(
+            chart_id=chart_id,
+            metadata={
+                "data": {"json": True},
+            },
+        )
+
+        # Dump the provided data as a JSON string
+        json_data = json.dumps(data)
+
+        # Post it to the chart via the add_data method
+        return self.add_data(chart_id, json_data)
+
+    def refresh_data(self, chart_id: str) -> dict:
+        """Fetch configured external data and add it to the chart.
+
+        Parameters
+        ----------
+        chart_id : str
+            ID of chart, table or map to add data to.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the chart's information.
+        """
+        response = self.post(f"{self._CHARTS_URL}/{chart_id}/data/refresh")
+        assert isinstance(response, dict)
+        return response
+
+    #
+    # Folder methods
+    #
+
+    def create_folder(
+        self,
+        name: str,
+        parent_id: int | None = None,
+        team_id: int | None = None,
+    ) -> dict:
+        """Create a new folder.
+
+        Parameters
+        ----------
+        name: str
+            Name of the folder to be created.
+        parent_id: int, optional
+            The parent folder that the folder belongs to.
+        team_id: int, optional
+            The team that the folder belongs to. If teamId is empty, the folder will
+            belong to the user directly.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the folder's information.
+        """
+        _query: dict = {"name": name}
+        if parent_id:
+            _query["parentId"] = parent_id
+        if team_id:
+            _query["teamId"] = team_id
+
+        response = self.post(
+            self._FOLDERS_URL,
+            data=_query,
+            extra_headers={"content-type": "application/json"},
+        )
+        assert isinstance(response, dict)
+        self.invalidate_reference_cache("folders")
+        return response
+
+    #
+    # Workspace methods
+    #
+
+    def create_workspace(
+        self,
+        name: str,
+        slug: str | None = None,
+    ) -> dict:
+        """Create a new workspace.
+
+        Parameters
+        ----------
+        name : str
+            Name of the workspace to be created (2-100 characters).
+        slug : str, optional
+            Slug for the workspace (2-100 characters). If not provided,
+            will be auto-generated from the name.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the workspace's information.
+        """
+        _query: dict = {"name": name}
+        if slug:
+            _query["slug"] = slug
+
+        response = self.post(
+            self._WORKSPACES_URL,
+            data=_query,
+            extra_headers={"content-type": "application/json"},
+        )
+        assert isinstance(response, dict)
+        return response
+
+    def create_workspace_team(
+        self,
+        workspace_slug: str,
+        name: str,
+        is_private: bool = False,
+        icon: str | None = None,
+    ) -> dict:
+        """Create a new team in a workspace.
+
+        Parameters
+        ----------
+        workspace_slug : str
+            Slug of workspace to create team in.
+        name : str
+            Name of the team to be created.
+        is_private : bool, optional
+            Whether the team should be private, by default False.
+        icon : str, optional
+            Icon for the team (one of 183 available icons).
+
+        Returns
+        -------
+        dict
+            A dictionary containing the team's information.
+        """
+        _query: dict = {"name": name, "isPrivate": is_private}
+        if icon:
+            _query["icon"] = icon
+
+        response = self.post(
+            f"{self._WORKSPACES_URL}/{workspace_slug}/teams",
+            data=_query,
+            extra_headers={"content-type": "application/json"},
+        )
+        assert isinstance(response, dict)
+        return response
+
+    def add_workspace_team_members(
+        self,
+        workspace_slug: str,
+        team_id: str,
+        user_ids: list[int],
+        role: str = "member",
+    ) -> bool:
+        """Add one or multiple users to a workspace team.
+
+        Parameters
+        ----------
+        workspace_slug : str
+            Slug of workspace the team belongs to.
+        team_id : str
+            ID of team to add users to.
+        user_ids : list[int]
+            Array of user IDs to add to the team.
+        role : str, optional
+            Role to assign to the users in the team. One of "manager" or "member".
+            By default "member".
+
+        Returns
+        -------
+        bool
+            True if the users were added successfully.
+        """
+        _query = {
+            "userIds": user_ids,
+            "role": role,
+        }
+
+        response = self.post(
+            f"{self._WORKSPACES_URL}/{workspace_slug}/teams/{team_id}/members",
+            data=_query,
+            extra_headers={"content-type": "application/json"},
+        )
+        assert isinstance(response, bool)
+        return response
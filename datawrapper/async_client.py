@@ -0,0 +1,949 @@
+"""An asyncio client for the Datawrapper API."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+import warnings
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+)
+from pathlib import Path
+from typing import Any, BinaryIO, NoReturn
+
+import pandas as pd
+from IPython.display import IFrame, Image
+
+from .__main__ import BaseDatawrapper
+from .checkpoint import Checkpoint
+from .compression import UNSUPPORTED_MEDIA_TYPE, Encoding
+from .data_io import DEFAULT_CHUNK_ROWS, read_csv_data
+from .download import DEFAULT_CHUNK_SIZE, Download, DownloadSink
+from .exceptions import FailedRequestError, InvalidRequestError, RateLimitError
+from .http_cache import NOT_MODIFIED, CacheBackend, CacheEntry
+from .pagination import aiter_items
+from .rate_limit import RateLimiter, TokenBucket
+from .reference_cache import ReferenceCache
+from .retry import RetryPolicy
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+async def _aiter_chunks(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """Yield byte chunks from a blocking iterable without blocking the event loop.
+
+    Each chunk is produced in a worker thread, since encoding a chunk of a
+    DataFrame as CSV can take a while.
+    """
+    iterator = iter(chunks)
+    while True:
+        chunk = await asyncio.to_thread(next, iterator, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+class AsyncDatawrapper(BaseDatawrapper):
+    """An asyncio version of the :class:`Datawrapper` client.
+
+    Every API method of :class:`Datawrapper` is available here and returns an
+    awaitable instead of blocking, so hundreds of requests can be in flight at
+    once from a single event loop. Requests run on a pooled ``httpx.AsyncClient``
+    and no more than ``max_concurrency`` of them are sent at the same time.
+    Retry policies and rate limiters behave exactly as they do for the blocking
+    client, except that waiting yields to the event loop.
+
+    Both clients share their settings and most API methods through
+    :class:`~datawrapper.__main__.BaseDatawrapper`: those methods return the
+    result of a single request method, which here is a coroutine. Methods that
+    combine several requests or inspect a response are implemented below.
+
+    The ``iter_*`` methods return async iterators, to be used with ``async for``.
+
+    Requires the optional ``httpx`` dependency, installed with
+    ``pip install "datawrapper[async]"``.
+
+    Example:
+        >>> async with AsyncDatawrapper(access_token="...") as dw:
+        ...     charts = await asyncio.gather(
+        ...         *(dw.get_chart_display_urls(chart_id) for chart_id in chart_ids)
+        ...     )
+    """
+
+    def __init__(
+        self,
+        access_token=BaseDatawrapper._ACCESS_TOKEN,
+        client: httpx.AsyncClient | None = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 5.0,
+        max_concurrency: int | None = None,
+        retry: RetryPolicy | int | None = None,
+        rate_limit: float | TokenBucket | RateLimiter | None = None,
+        compression: Encoding | None = None,
+        compression_min_size: int = 1024,
+        http_cache: CacheBackend | bool | None = None,
+        reference_cache: ReferenceCache | bool | None = None,
+    ):
+        """Initalize an asynchronous connection with the Datawrapper API.
+
+        Parameters
+        ----------
+        access_token : str, optional
+            The access token to use, by default it will look for DATAWRAPPER_ACCESS_TOKEN environment variable.
+        client : httpx.AsyncClient, optional
+            An HTTP client to send all requests through, by default None. It is not
+            closed by :meth:`aclose`, since the caller owns it.
+        max_connections : int, optional
+            Maximum number of open connections in the pool, by default 20.
+        max_keepalive_connections : int, optional
+            Maximum number of idle connections kept open for reuse, by default 10.
+        keepalive_expiry : float, optional
+            Seconds an idle connection is kept open, by default 5.
+        max_concurrency : int, optional
+            Maximum number of requests in flight at once, by default ``max_connections``.
+        retry : RetryPolicy | int, optional
+            How to retry failed requests. See :class:`Datawrapper`.
+        rate_limit : float | TokenBucket | RateLimiter, optional
+            How to pace requests. See :class:`Datawrapper`.
+        compression : {"gzip", "deflate"}, optional
+            Compress request bodies. See :class:`Datawrapper`.
+        compression_min_size : int, optional
+            Smallest body in bytes worth compressing, by default 1024.
+        http_cache : CacheBackend | bool, optional
+            Revalidate cached GET responses. See :class:`Datawrapper`.
+        reference_cache : ReferenceCache | bool, optional
+            Cache themes, basemaps, folders and account data. See :class:`Datawrapper`.
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncDatawrapper requires httpx. "
+                'Install it with `pip install "datawrapper[async]"`.'
+            )
+
+        super().__init__(
+            access_token,
+            retry=retry,
+            rate_limit=rate_limit,
+            compression=compression,
+            compression_min_size=compression_min_size,
+            http_cache=http_cache,
+            reference_cache=reference_cache,
+        )
+
+        if client is not None:
+            self._http_client = client
+            self._owns_http_client = False
+        else:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+            )
+            self._owns_http_client = True
+        self._semaphore = asyncio.Semaphore(max_concurrency or max_connections)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The ``httpx.AsyncClient`` this client sends its requests through."""
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the client's connection pool if the client created it."""
+        if self._owns_http_client:
+            await self._http_client.aclose()
+
+    async def __aenter__(self) -> AsyncDatawrapper:
+        """Use the client as an async context manager that closes its pool on exit."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the client's connection pool."""
+        await self.aclose()
+
+    #
+    # Web request methods
+    #
+
+    @staticmethod
+    def _params(params: dict | None) -> dict | None:
+        """Encode query parameters the same way ``requests`` does."""
+        if params is None:
+            return None
+        return {
+            key: str(value) if isinstance(value, bool) else value
+            for key, value in params.items()
+            if value is not None
+        }
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request through the client's connection pool.
+
+        Mirrors :meth:`Datawrapper._request`, including rate limiting and retries,
+        without blocking the event loop.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method to use.
+        url : str
+            The URL to request.
+        **kwargs
+            Keyword arguments passed through to ``httpx.AsyncClient.build_request``.
+            Pass ``stream=True`` to return before the body is read; the caller
+            must then close the response.
+
+        Returns
+        -------
+        httpx.Response
+            The raw response.
+        """
+        stream = kwargs.pop("stream", False)
+        replayable = not isinstance(kwargs.get("content"), (Iterator, AsyncIterator))
+        retry = self._retry if replayable else None
+        compressed_kwargs = self._compress(kwargs, "content")
+
+        attempt = 0
+        while True:
+            send_kwargs = (
+                compressed_kwargs
+                if compressed_kwargs is not None and not self._compression_rejected
+                else kwargs
+            )
+            compressed = send_kwargs is not kwargs
+            if self._rate_limiter is not None:
+                wait = self._rate_limiter.reserve(url)
+                if wait:
+                    await asyncio.sleep(wait)
+
+            # httpx needs an async stream; blocking iterables are wrapped on every
+            # attempt so that re-iterable bodies can be sent again on a retry
+            content = send_kwargs.get("content")
+            if isinstance(content, Iterable) and not isinstance(content, (bytes, str)):
+                send_kwargs = {**send_kwargs, "content": _aiter_chunks(content)}
+
+            try:
+                async with self._semaphore:
+                    started = time.monotonic()
+                    request = self._http_client.build_request(
+                        method, url, **send_kwargs
+                    )
+                    response = await self._http_client.send(request, stream=stream)
+                    if not stream:
+                        await response.aread()
+            except httpx.TransportError:
+                self._track(started)
+                if retry is None or not retry.should_retry_error(method, attempt):
+                    raise
+                delay = retry.get_backoff(attempt)
+                logger.warning(
+                    f"{method} {url} failed to connect, retrying in {delay:.2f}s."
+                )
+            else:
+                self._track(started, response, streamed=stream)
+                if compressed and response.status_code == UNSUPPORTED_MEDIA_TYPE:
+                    # Stop compressing even if this body can't be sent again
+                    self._reject_compression(method, url)
+                    if replayable:
+                        continue
+                if (
+                    retry is None
+                    or response.is_success
+                    or not retry.should_retry_status(
+                        method, response.status_code, attempt
+                    )
+                ):
+                    return response
+                delay = retry.get_delay(attempt, response.headers)
+                logger.warning(
+                    f"{method} {url} returned status code {response.status_code}, "
+                    f"retrying in {delay:.2f}s."
+                )
+                # Release the connection of a streamed response before retrying
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _raise_for_response(response: httpx.Response, verb: str) -> NoReturn:
+        """Raise the library's exception for a failed response."""
+        logger.error(f"{verb} request failed with status code {response.status_code}.")
+        if response.status_code == 429:
+            raise RateLimitError(response)
+        raise FailedRequestError(response)
+
+    async def delete(
+        self,
+        url: str,
+        timeout: int = 15,
+        data: dict | None = None,
+        extra_headers: dict | None = None,
+    ) -> bool:
+        """Make a DELETE request to the Datawrapper API.
+
+        See :meth:`Datawrapper.delete`.
+        """
+        headers = self._get_auth_header()
+        headers["accept"] = "*/*"
+        if extra_headers:
+            headers.update(extra_headers)
+
+        kwargs: dict[str, Any] = {"headers": headers, "timeout": timeout}
+        if data:
+            kwargs["json"] = data
+
+        response = await self._request("DELETE", url, **kwargs)
+        if response.is_success:
+            return True
+        self._raise_for_response(response, "Delete")
+
+    async def _cached_reference(
+        self, category: str, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return reference data from the cache, awaiting the fetch on a miss.
+
+        See :meth:`Datawrapper._cached_reference`.
+        """
+        if self._reference_cache is None:
+            return await fetch()
+        hit, value = self._reference_cache.lookup(category, key)
+        if hit:
+            return value
+        value = await fetch()
+        self._reference_cache.store(category, key, value)
+        return value
+
+    def _iter_items(
+        self,
+        fetch_page: Callable[[int, int], Awaitable[Any]],
+        page_size: int,
+        prefetch: bool,
+        max_workers: int = 1,
+    ) -> AsyncIterator[Any]:
+        """Iterate over every item of a paginated endpoint with ``async for``.
+
+        See :meth:`Datawrapper._iter_items`.
+        """
+        return aiter_items(
+            fetch_page, page_size, prefetch=prefetch, max_workers=max_workers
+        )
+
+    async def _invalidating(self, category: str, result: Awaitable[Any]) -> Any:
+        """Drop cached reference data once the pending change has completed."""
+        value = await result
+        self.invalidate_reference_cache(category)
+        return value
+
+    async def get(
+        self,
+        url: str,
+        params: dict | None = None,
+        timeout: int = 15,
+        raw: bool = False,
+    ) -> Any:
+        """Make a GET request to the Datawrapper API.
+
+        See :meth:`Datawrapper.get`.
+        """
+        headers = self._get_auth_header()
+        headers["accept"] = "*/*"
+
+        key = entry = None
+        if self._http_cache is not None:
+            key = self._cache_key(url, params)
+            entry = self._http_cache.get(key)
+            if entry is not None:
+                headers.update(entry.conditional_headers())
+
+        response = await self._request(
+            "GET",
+            url,
+            headers=headers,
+            params=self._params(params),
+            timeout=timeout,
+        )
+
+        if entry is not None and response.status_code == NOT_MODIFIED:
+            self._store_cached(key, entry.revalidated())
+            return entry.body if raw else entry.parse()
+
+        if response.is_success:
+            if key is not None:
+                self._store_cached(
+                    key, CacheEntry.from_response(response.headers, response.content)
+                )
+            if raw:
+                return response.content
+            content_type = response.headers.get("content-type", "")
+            if "json" in content_type:
+                return response.json()
+            if "text/csv" in content_type:
+                return read_csv_data(response.content)
+            return response.content
+        self._raise_for_response(response, "Get")
+
+    async def download(
+        self,
+        url: str,
+        destination: str | os.PathLike | BinaryIO,
+        params: dict | None = None,
+        timeout: int = 15,
+        checksum: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Download:
+        """Stream the body of a GET request to a file without holding it in memory.
+
+        See :meth:`Datawrapper.download`.
+        """
+        headers = self._get_auth_header()
+        headers["accept"] = "*/*"
+
+        sink = DownloadSink(destination, checksum)
+        try:
+            response = await self._request(
+                "GET",
+                url,
+                headers=headers,
+                params=self._params(params),
+                timeout=timeout,
+                stream=True,
+            )
+            try:
+                if not response.is_success:
+                    await response.aread()
+                    self._raise_for_response(response, "Get")
+                async for chunk in response.aiter_bytes(chunk_size):
+                    sink.write(chunk)
+                    if self._stats is not None:
+                        self._stats.add_bytes(len(chunk))
+            finally:
+                await response.aclose()
+        except BaseException:
+            sink.abort()
+            raise
+
+        return sink.commit()
+
+    async def patch(
+        self,
+        url: str,
+        data: dict | None = None,
+        timeout: int = 15,
+        extra_headers: dict | None = None,
+    ) -> dict:
+        """Make a PATCH request to the Datawrapper API.
+
+        See :meth:`Datawrapper.patch`.
+        """
+        headers = self._get_auth_header()
+        headers["accept"] = "*/*"
+        headers["content-type"] = "application/json"
+        if extra_headers:
+            headers.update(extra_headers)
+
+        kwargs: dict[str, Any] = {"headers": headers, "timeout": timeout}
+        if data:
+            kwargs["content"] = json.dumps(data)
+
+        response = await self._request("PATCH", url, **kwargs)
+        if response.is_success:
+            return response.json()
+        self._raise_for_response(response, "Patch")
+
+    async def post(
+        self,
+        url: str,
+        data: dict | None = None,
+        timeout: int = 30,
+        extra_headers: dict | None = None,
+    ) -> dict | bool:
+        """Make a POST request to the Datawrapper API.
+
+        See :meth:`Datawrapper.post`.
+        """
+        headers = self._get_auth_header()
+        headers["accept"] = "*/*"
+        if extra_headers:
+            headers.update(extra_headers)
+
+        kwargs: dict[str, Any] = {"headers": headers, "timeout": timeout}
+        if data:
+            kwargs["content"] = json.dumps(data)
+
+        response = await self._request("POST", url, **kwargs)
+        if response.is_success:
+            if response.text:
+                return response.json()
+            return True
+        self._raise_for_response(response, "Post")
+
+    async def put(
+        self,
+        url: str,
+        data: dict | bytes | Iterable[bytes] | None = None,
+        timeout: int = 15,
+        extra_headers: dict | None = None,
+        dump_data: bool = True,
+    ) -> bool:
+        """Make a PUT request to the Datawrapper API.
+
+        See :meth:`Datawrapper.put`.
+        """
+        headers = self._get_auth_header()
+        headers["accept"] = "*/*"
+        if extra_headers:
+            headers.update(extra_headers)
+
+        kwargs: dict[str, Any] = {"headers": headers, "timeout": timeout}
+        if data:
+            kwargs["content"] = json.dumps(data) if dump_data else data
+
+        response = await self._request("PUT", url, **kwargs)
+        if response.is_success:
+            return True
+        self._raise_for_response(response, "Put")
+
+    #
+    # API methods that do more than return a single request
+    #
+
+    async def create_login_token(self) -> dict:
+        """Creates a new login token. See :meth:`Datawrapper.create_login_token`."""
+        response = await self.post(
+            self._LOGIN_TOKENS_URL,
+            extra_headers={"content-type": "application/json"},
+        )
+        assert isinstance(response, dict)
+        return response
+
+    async def create_api_token(self, comment: str, scopes: list[str]) -> dict:
+        """Create a new API Token. See :meth:`Datawrapper.create_api_token`."""
+        response = await self.post(
+            self._API_TOKEN_URL,
+            data={"comment": comment, "scopes": scopes},
+            extra_headers={"content-type": "application/json"},
+        )
+        assert isinstance(response, dict)
+        return response
+
+    async def create_chart(
+        self,
+        title: str,
+        chart_type: str,
+        theme: str | None = None,
+        data: pd.DataFrame | str | None = None,
+        external_data_url: str | None = None,
+        folder_id: int | None = None,
+        organization_id: str | None = None,
+        forkable: bool | None = None,
+        language: str | None = None,
+        metadata: dict | None = None,
+    ) -> dict:
+        """Creates a new Datawrapper chart, table or map.
+
+        .. deprecated::
+            Use the object-oriented chart classes instead (e.g., BarChart, LineChart).
+
+        See :meth:`Datawrapper.create_chart`.
+        """
+        warnings.warn(
+            "create_chart() is deprecated and will be removed in a future version. "
+            "Use the object-oriented chart classes instead. "
+            "Example: chart = await BarChart(title='My Chart', data=df).acreate()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        _query: dict[str, Any] = {"title": title, "type": chart_type}
+        _query.update(
+            self._chart_query(
+                theme=theme,
+                external_data_url=external_data_url,
+                folder_id=folder_id,
+                organization_id=organization_id,
+                forkable=forkable,
+                language=language,
+                metadata=metadata,
+            )
+        )
+
+        obj = await self.post(
+            self._CHARTS_URL,
+            data=_query,
+            extra_headers={"content-type": "application/json"},
+        )
+        assert isinstance(obj, dict)
+
+        if data is not None:
+            await self.upload_data(obj["id"], data)
+
+        return obj
+
+    async def update_chart(
+        self,
+        chart_id: str,
+        title: str | None = None,
+        chart_type: str | None = None,
+        theme: str | None = None,
+        data: pd.DataFrame | str | None = None,
+        external_data_url: str | None = None,
+        folder_id: int | None = None,
+        organization_id: str | None = None,
+        forkable: bool | None = None,
+        language: str | None = None,
+        metadata: dict | None = None,
+    ) -> dict:
+        """Updates a chart's title, theme, type, language, folder or organization.
+
+        .. deprecated::
+            Use the object-oriented chart classes instead (e.g., BarChart, LineChart).
+
+        See :meth:`Datawrapper.update_chart`.
+        """
+        warnings.warn(
+            "update_chart() is deprecated and will be removed in a future version. "
+            "Use the object-oriented chart classes instead. "
+            "Example: chart = await BarChart.aget(chart_id='abc123'); chart.title = 'New Title'; await chart.aupdate()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        _query = self._chart_query(
+            title=title,
+            chart_type=chart_type,
+            theme=theme,
+            external_data_url=external_data_url,
+            folder_id=folder_id,
+            organization_id=organization_id,
+            forkable=forkable,
+            language=language,
+            metadata=metadata,
+        )
+
+        if not _query and data is None:
+            msg = "No updates submitted."
+            logger.error(msg)
+            raise InvalidRequestError(msg)
+
+        if _query:
+            obj = await self.patch(
+                f"{self._CHARTS_URL}/{chart_id}",
+                data=_query,
+                extra_headers={"content-type": "application/json"},
+            )
+        else:
+            obj = await self.get(f"{self._CHARTS_URL}/{chart_id}")
+
+        if data is not None:
+            await self.upload_data(obj["id"], data)
+
+        return obj
+
+    async def display_chart(self, chart_id: str) -> IFrame:
+        """Displays a datawrapper chart. See :meth:`Datawrapper.display_chart`."""
+        obj = await self.get(f"{self._CHARTS_URL}/{chart_id}")
+        src = obj["publicUrl"]
+        width = obj["metadata"]["publish"]["embed-width"]
+        height = obj["metadata"]["publish"]["embed-height"]
+        return IFrame(src, width=width, height=height)
+
+    async def copy_chart(self, chart_id: str) -> dict:
+        """Copy a chart, table, or map. See :meth:`Datawrapper.copy_chart`."""
+        warnings.warn(
+            "copy_chart() is deprecated and will be removed in a future version. "
+            "Use the object-oriented chart classes instead. "
+            "Example: chart = await BarChart.aget(chart_id='abc123'); duplicate = await chart.aduplicate()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        response = await self.post(f"{self._CHARTS_URL}/{chart_id}/copy")
+        assert isinstance(response, dict)
+        return response
+
+    async def fork_chart(self, chart_id: str) -> dict:
+        """Fork a chart, table, or map. See :meth:`Datawrapper.fork_chart`."""
+        warnings.warn(
+            "fork_chart() is deprecated and will be removed in a future version. "
+            "Use the object-oriented chart classes instead. "
+            "Example: chart = await BarChart.aget(chart_id='abc123'); fork = await chart.afork()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        response = await self.post(f"{self._CHARTS_URL}/{chart_id}/fork")
+        assert isinstance(response, dict)
+        return response
+
+    async def publish_chart(
+        self, chart_id: str, display: bool = False
+    ) -> dict | IFrame:
+        """Publishes a chart, table or map. See :meth:`Datawrapper.publish_chart`."""
+        warnings.warn(
+            "publish_chart() is deprecated and will be removed in a future version. "
+            "Use the object-oriented chart classes instead. "
+            "Example: chart = await BarChart.aget(chart_id='abc123'); await chart.apublish()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        obj = await self.post(f"{self._CHARTS_URL}/{chart_id}/publish")
+        assert isinstance(obj, dict)
+        if display:
+            src = obj["data"]["publicUrl"]
+            width = obj["data"]["metadata"]["publish"]["embed-width"]
+            height = obj["data"]["metadata"]["publish"]["embed-height"]
+            return IFrame(src, width=width, height=height)
+        return obj
+
+    async def sync_many(
+        self,
+        charts: Iterable[Any],
+        publish: bool = True,
+        max_workers: int = 8,
+        folder_id: int | None = None,
+        raise_on_error: bool = True,
+        checkpoint: Checkpoint | None = None,
+        progress: bool = False,
+    ) -> list[Any]:
+        """Create or update many charts and publish them concurrently. See :meth:`Datawrapper.sync_many`."""
+        # Import here to avoid circular imports
+        from .bulk import ChartBatch
+
+        batch = ChartBatch(
+            charts,
+            publish=publish,
+            max_workers=max_workers,
+            folder_id=folder_id,
+            client=self,
+            checkpoint=checkpoint,
+            progress=progress,
+        )
+        return await batch.arun(raise_on_error=raise_on_error)
+
+    async def export_chart(
+        self,
+        chart_id: str,
+        unit: str = "px",
+        mode: str = "rgb",
+        width: int = 400,
+        height: int | str | None = None,
+        plain: bool = False,
+        zoom: int = 2,
+        scale: int = 1,
+        border_width: int = 20,
+        border_color: str | None = None,
+        transparent: bool = False,
+        download: bool = False,
+        full_vector: bool = False,
+        ligatures: bool = True,
+        logo: str = "auto",
+        logo_id: str | None = None,
+        dark: bool = False,
+        output: str = "png",
+        filepath: str = "./image.png",
+        display: bool = False,
+    ) -> Path | Image:
+        """Exports a chart, table, or map. See :meth:`Datawrapper.export_chart`."""
+        warnings.warn(
+            "export_chart() is deprecated and will be removed in a future version. "
+            "Use the object-oriented chart classes instead. "
+            "Example: chart = await BarChart.aget(chart_id='abc123'); png_data = await chart.aexport_png()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        _query = self._export_query(
+            unit=unit,
+            mode=mode,
+            width=width,
+            height=height,
+            plain=plain,
+            zoom=zoom,
+            scale=scale,
+            border_width=border_width,
+            border_color=border_color,
+            transparent=transparent,
+            download=download,
+            full_vector=full_vector,
+            ligatures=ligatures,
+            logo=logo,
+            logo_id=logo_id,
+            dark=dark,
+        )
+
+        content = await self.get(
+            f"{self._CHARTS_URL}/{chart_id}/export/{output}", params=_query
+        )
+
+        _filepath = Path(filepath).with_suffix(f".{output}")
+        with open(_filepath, "wb") as fh:
+            fh.write(content)
+
+        if display:
+            return Image(_filepath)
+        logger.debug(f"File exported at {_filepath}")
+        return _filepath
+
+    async def get_iframe_code(self, chart_id: str, responsive: bool = False) -> str:
+        """Returns a chart's iframe embed code. See :meth:`Datawrapper.get_iframe_code`."""
+        obj = await self.get(f"{self._CHARTS_URL}/{chart_id}")
+        embed_codes = obj["metadata"]["publish"]["embed-codes"]
+        if responsive:
+            return embed_codes["embed-method-responsive"]
+        return embed_codes["embed-method-iframe"]
+
+    async def upload_data(
+        self,
+        chart_id: str,
+        data: Any,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        timeout: int = 15,
+        content_type: str = "text/csv",
+    ) -> bool:
+        """Upload CSV data to a chart, table or map. See :meth:`Datawrapper.upload_data`."""
+        return await self.put(
+            f"{self._CHARTS_URL}/{chart_id}/data",
+            data=self._data_body(data, chunk_rows),
+            timeout=timeout,
+            extra_headers={"content-type": content_type},
+            dump_data=False,
+        )
+
+    async def copy_data(
+        self,
+        source_id: str,
+        destination_id: str,
+        timeout: int = 15,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> bool:
+        """Copy the data of one chart to another without parsing it. See :meth:`Datawrapper.copy_data`."""
+        headers = self._get_auth_header()
+        headers["accept"] = "*/*"
+
+        response = await self._request(
+            "GET",
+            f"{self._CHARTS_URL}/{source_id}/data",
+            headers=headers,
+            timeout=timeout,
+            stream=True,
+        )
+        try:
+            if not response.is_success:
+                await response.aread()
+                self._raise_for_response(response, "Get")
+            return await self.upload_data(
+                destination_id,
+                response.aiter_bytes(chunk_size),
+                timeout=timeout,
+                content_type=response.headers.get("content-type", "text/csv"),
+            )
+        finally:
+            await response.aclose()
+
+    async def add_json(self, chart_id: str, data: Any) -> bool:
+        """Add JSON data to a specified chart. See :meth:`Datawrapper.add_json`."""
+        await self.update_chart(
+            chart_id=chart_id,
+            metadata={
+                "data": {"json": True},
+            },
+        )
+        return await self.upload_data(chart_id, json.dumps(data))
+
+    async def refresh_data(self, chart_id: str) -> dict:
+        """Fetch configured external data. See :meth:`Datawrapper.refresh_data`."""
+        response = await self.post(f"{self._CHARTS_URL}/{chart_id}/data/refresh")
+        assert isinstance(response, dict)
+        return response
+
+    async def create_folder(
+        self,
+        name: str,
+        parent_id: int | None = None,
+        team_id: int | None = None,
+    ) -> dict:
+        """Create a new folder. See :meth:`Datawrapper.create_folder`."""
+        _query: dict = {"name": name}
+        if parent_id:
+            _query["parentId"] = parent_id
+        if team_id:
+            _query["teamId"] = team_id
+
+        response = await self.post(
+            self._FOLDERS_URL,
+            data=_query,
+            extra_headers={"content-type": "application/json"},
+        )
+        assert isinstance(response, dict)
+        self.invalidate_reference_cache("folders")
+        return response
+
+    async def create_workspace(
+        self,
+        name: str,
+        slug: str | None = None,
+    ) -> dict:
+        """Create a new workspace. See :meth:`Datawrapper.create_workspace`."""
+        _query: dict = {"name": name}
+        if slug:
+            _query["slug"] = slug
+
+        response = await self.post(
+            self._WORKSPACES_URL,
+            data=_query,
+            extra_headers={"content-type": "application/json"},
+        )
+        assert isinstance(response, dict)
+        return response
+
+    async def create_workspace_team(
+        self,
+        workspace_slug: str,
+        name: str,
+        is_private: bool = False,
+        icon: str | None = None,
+    ) -> dict:
+        """Create a new team in a workspace. See :meth:`Datawrapper.create_workspace_team`."""
+        _query: dict = {"name": name, "isPrivate": is_private}
+        if icon:
+            _query["icon"] = icon
+
+        response = await self.post(
+            f"{self._WORKSPACES_URL}/{workspace_slug}/teams",
+            data=_query,
+            extra_headers={"content-type": "application/json"},
+        )
+        assert isinstance(response, dict)
+        return response
+
+    async def add_workspace_team_members(
+        self,
+        workspace_slug: str,
+        team_id: str,
+        user_ids: list[int],
+        role: str = "member",
+    ) -> bool:
+        """Add users to a workspace team. See :meth:`Datawrapper.add_workspace_team_members`."""
+        response = await self.post(
+            f"{self._WORKSPACES_URL}/{workspace_slug}/teams/{team_id}/members",
+            data={"userIds": user_ids, "role": role},
+            extra_headers={"content-type": "application/json"},
+        )
+        assert isinstance(response, bool)
+        return response
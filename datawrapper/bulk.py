@@ -0,0 +1,658 @@
+"""Bulk operations that run many chart requests through a worker pool."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from datawrapper.__main__ import BaseDatawrapper, Datawrapper
+from datawrapper.async_client import AsyncDatawrapper
+from datawrapper.checkpoint import Checkpoint
+from datawrapper.download import Download
+from datawrapper.export_cache import ExportCache
+from datawrapper.progress import BulkProgress
+from datawrapper.rate_limit import RateLimiter, TokenBucket
+from datawrapper.retry import RetryPolicy
+
+if sys.version_info >= (3, 11):
+    from builtins import ExceptionGroup
+else:  # pragma: no cover
+    from exceptiongroup import ExceptionGroup
+
+if TYPE_CHECKING:
+    from datawrapper.charts.base import BaseChart
+
+ExportFormat = Literal["png", "pdf", "svg"]
+
+
+class ExportResult(BaseModel):
+    """The outcome of one export in a bulk run."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    #: The ID of the exported chart
+    chart_id: str = Field(description="The ID of the exported chart")
+
+    #: The export format
+    format: ExportFormat = Field(description="The export format")
+
+    #: The export options used for this size
+    options: dict[str, Any] = Field(
+        default_factory=dict, description="The export options used for this size"
+    )
+
+    #: Where the export was written
+    path: Path = Field(description="Where the export was written")
+
+    #: The completed download, or None if the export failed
+    download: Download | None = Field(
+        default=None,
+        description="The completed download, or None if the export failed",
+    )
+
+    #: The error raised by the export, or None if it succeeded
+    error: Exception | None = Field(
+        default=None,
+        description="The error raised by the export, or None if it succeeded",
+    )
+
+    #: Whether the export was skipped because an earlier run finished it
+    resumed: bool = Field(
+        default=False,
+        description="Whether the export was skipped because an earlier run finished it",
+    )
+
+    @property
+    def ok(self) -> bool:
+        """Whether the export succeeded."""
+        return self.error is None
+
+
+def _export_filename(chart_id: str, fmt: str, options: dict[str, Any]) -> str:
+    """Name an export file after its chart, size options and format.
+
+    Example:
+        >>> _export_filename("abc123", "png", {"zoom": 4, "width": 600})
+        'abc123_width-600_zoom-4.png'
+    """
+    suffix = "".join(f"_{key}-{value}" for key, value in sorted(options.items()))
+    return f"{chart_id}{suffix}.{fmt}"
+
+
+def _as_chart(chart: BaseChart | str) -> BaseChart:
+    """Resolve a chart or chart ID to a chart that can be exported."""
+    # Import here to avoid circular imports
+    from datawrapper.charts.base import BaseChart
+
+    if isinstance(chart, str):
+        # Exports only need the chart ID, so skip fetching the chart and its type
+        chart = BaseChart.model_construct(chart_id=chart)  # type: ignore[call-arg]
+        chart._client = None
+        chart._version = None
+    elif chart.chart_id is None:
+        raise ValueError("No chart_id set. Call create() first or set chart_id.")
+    return chart
+
+
+def export_many(
+    charts_or_ids: Iterable[BaseChart | str],
+    formats: Sequence[ExportFormat] = ("png", "pdf", "svg"),
+    sizes: Sequence[dict[str, Any]] | None = None,
+    out_dir: str | os.PathLike = ".",
+    max_workers: int = 4,
+    access_token: str | None = None,
+    rate_limit: float | TokenBucket | RateLimiter | None = None,
+    retry: RetryPolicy | int | None = 3,
+    client: Datawrapper | None = None,
+    cache: ExportCache | None = None,
+    timeout: int = 30,
+    checkpoint: Checkpoint | None = None,
+    progress: bool = False,
+) -> list[ExportResult]:
+    """Export many charts in several formats and sizes in parallel.
+
+    Every export is streamed to disk through one thread pool and one client, so
+    at most ``max_workers`` exports are rendered at once and every request draws
+    from the same retry policy and rate limit. A failed export does not stop the
+    others; its error is recorded in the returned results instead.
+
+    Args:
+        charts_or_ids: Charts, or chart IDs, to export.
+        formats: Export formats to produce for every chart and size.
+        sizes: Export options for each size, such as ``{"width": 600, "zoom": 2}``,
+            passed to export_png(), export_pdf() or export_svg(). By default a
+            single export with the default options.
+        out_dir: Directory to write the exports to. Created if it doesn't exist.
+        max_workers: Maximum number of concurrent exports, by default 4.
+        access_token: Optional Datawrapper API access token. If not provided,
+            will attempt to use the DATAWRAPPER_ACCESS_TOKEN environment variable.
+        rate_limit: Requests per second, or a bucket or limiter, shared by every
+            export. Ignored when a client is passed.
+        retry: How to retry rate-limited and failing exports, by default three
+            retries. Ignored when a client is passed.
+        client: Optional client to send every request through.
+        cache: Optional ExportCache to serve unchanged exports from.
+        timeout: Timeout for each export request in seconds.
+        checkpoint: Optional ledger to record finished exports in. Exports it
+            records as finished whose files still exist are skipped.
+        progress: Show a live progress bar with the request rate, latency,
+            bytes downloaded and number of rate-limited responses.
+
+    Returns:
+        One result per chart, format and size, in that order.
+
+    Raises:
+        ValueError: If max_workers is less than 1, a format is invalid, a chart has
+            no chart_id or no access token is available.
+
+    Example:
+        >>> from datawrapper import export_many
+        >>> results = export_many(
+        ...     ["abc123", "def456"],
+        ...     formats=["png", "pdf"],
+        ...     sizes=[{"width": 600}, {"width": 1200, "zoom": 4}],
+        ...     out_dir="exports",
+        ...     max_workers=8,
+        ... )
+        >>> failed = [result for result in results if not result.ok]
+    """
+    # Import here to avoid circular imports
+    from datawrapper.charts.base import BaseChart
+
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    for fmt in formats:
+        if fmt not in ("png", "pdf", "svg"):
+            raise ValueError(f"Invalid format: {fmt}. Must be 'png', 'pdf', or 'svg'.")
+
+    out_path = Path(out_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+    charts = [_as_chart(chart) for chart in charts_or_ids]
+
+    owns_client = client is None
+    if client is None:
+        client = Datawrapper(
+            access_token=BaseChart._resolve_access_token(access_token),
+            pool_maxsize=max_workers,
+            retry=retry,
+            rate_limit=rate_limit,
+        )
+
+    jobs = [
+        (chart, fmt, dict(options))
+        for chart in charts
+        for fmt in formats
+        for options in (sizes or [{}])
+    ]
+    display = (
+        BulkProgress(client, "Exporting charts", total=len(jobs)) if progress else None
+    )
+
+    def run(chart: BaseChart, fmt: str, options: dict[str, Any]) -> ExportResult:
+        result = export(chart, fmt, options)
+        if display is not None:
+            display.advance()
+        return result
+
+    def export(chart: BaseChart, fmt: str, options: dict[str, Any]) -> ExportResult:
+        chart_id = str(chart.chart_id)
+        path = out_path / _export_filename(chart_id, fmt, options)
+        result = {"chart_id": chart_id, "format": fmt, "options": options, "path": path}
+        key = f"export:{path}"
+        if checkpoint is not None:
+            record = checkpoint.get(key)
+            if record is not None and path.exists():
+                download = Download(path=path, **record)
+                return ExportResult(**result, download=download, resumed=True)
+        try:
+            method = getattr(chart, f"export_{fmt}")
+            download = method(destination=path, cache=cache, timeout=timeout, **options)
+        except Exception as error:
+            return ExportResult(**result, error=error)
+        if checkpoint is not None:
+            checkpoint.record(key, **download.model_dump(exclude={"path"}))
+        return ExportResult(**result, download=download)
+
+    # Export every chart through the shared client, even charts that have their own
+    previous = [chart._client for chart in charts]
+    for chart in charts:
+        chart._client = client
+    try:
+        with (
+            display or nullcontext(),
+            ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="datawrapper-export"
+            ) as executor,
+        ):
+            futures = [executor.submit(run, *job) for job in jobs]
+            try:
+                return [future.result() for future in futures]
+            except BaseException:
+                # Stop exporting if the caller interrupts the run
+                for future in futures:
+                    future.cancel()
+                raise
+    finally:
+        for chart, chart_client in zip(charts, previous, strict=True):
+            chart._client = chart_client
+        if owns_client:
+            client.close()
+
+
+class ChartResult(BaseModel):
+    """The outcome of saving and publishing one chart in a batch."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    #: The chart that was processed
+    chart: Any = Field(description="The chart that was processed")
+
+    #: The chart's ID, or None if it couldn't be created
+    chart_id: str | None = Field(
+        default=None, description="The chart's ID, or None if it couldn't be created"
+    )
+
+    #: Whether the chart was created or updated
+    action: Literal["create", "update"] = Field(
+        description="Whether the chart was created or updated"
+    )
+
+    #: Whether the chart was published
+    published: bool = Field(
+        default=False, description="Whether the chart was published"
+    )
+
+    #: The stage that failed, or None if every stage succeeded
+    failed_stage: Literal["save", "publish"] | None = Field(
+        default=None,
+        description="The stage that failed, or None if every stage succeeded",
+    )
+
+    #: The error raised by the failed stage
+    error: Exception | None = Field(
+        default=None, description="The error raised by the failed stage"
+    )
+
+    #: Whether an earlier run already created or saved the chart
+    resumed: bool = Field(
+        default=False,
+        description="Whether an earlier run already created or saved the chart",
+    )
+
+    @property
+    def ok(self) -> bool:
+        """Whether every stage succeeded."""
+        return self.error is None
+
+
+class ChartBatch:
+    """Create or update many charts, upload their data and publish them in parallel.
+
+    Every chart goes through two stages. First it is saved: charts without a
+    chart_id are created and then have their data uploaded, and the others are
+    updated, which uploads their data if it changed. Then it is published. Each stage has its
+    own pool of ``max_workers`` workers, so while some charts are still being
+    saved, those that are done are already being published. A chart that fails
+    is reported in its result and does not stop the others.
+
+    With a checkpoint, each new chart is recorded in the ledger as soon as the
+    API has created it, before its data is uploaded, and every chart is recorded
+    again once it is saved and once it is published. A rerun with the same
+    ledger skips the stages that already finished, and reuses the IDs of the
+    charts it created instead of creating them again.
+
+    Example:
+        >>> from datawrapper import ChartBatch
+        >>> batch = ChartBatch(county_charts, max_workers=16, rate_limit=10)
+        >>> results = batch.run()  # raises an ExceptionGroup if any chart failed
+    """
+
+    def __init__(
+        self,
+        charts: Iterable[BaseChart],
+        publish: bool = True,
+        max_workers: int = 8,
+        folder_id: int | None = None,
+        access_token: str | None = None,
+        rate_limit: float | TokenBucket | RateLimiter | None = None,
+        retry: RetryPolicy | int | None = 3,
+        client: Datawrapper | AsyncDatawrapper | None = None,
+        checkpoint: Checkpoint | None = None,
+        keys: Sequence[str] | None = None,
+        progress: bool = False,
+    ):
+        """Initialize the batch.
+
+        Args:
+            charts: The charts to save and publish.
+            publish: Whether to publish each chart after saving it, by default True.
+            max_workers: Maximum number of concurrent requests per stage, by
+                default 8.
+            folder_id: Optional folder ID to create new charts in.
+            access_token: Optional Datawrapper API access token. If not provided,
+                will attempt to use the DATAWRAPPER_ACCESS_TOKEN environment variable.
+            rate_limit: Requests per second, or a bucket or limiter, shared by the
+                whole batch. Ignored when a client is passed.
+            retry: How to retry rate-limited and failing requests, by default
+                three retries. Ignored when a client is passed.
+            client: Optional client to send every request through. Use an
+                AsyncDatawrapper with arun().
+            checkpoint: Optional ledger to record finished charts in, so a rerun
+                resumes where this one stopped.
+            keys: Optional key for each chart in the checkpoint. By default
+                charts are known by their chart_id, and new charts by their
+                position in the batch.
+            progress: Show a live progress bar with the request rate, latency
+                and number of rate-limited responses.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.charts = list(charts)
+        if keys is not None and len(keys) != len(self.charts):
+            raise ValueError(
+                f"Expected one key per chart, got {len(keys)} keys for "
+                f"{len(self.charts)} charts"
+            )
+        self.keys = list(keys) if keys is not None else None
+        self.checkpoint = checkpoint
+        self.progress = progress
+        self.publish = publish
+        self.max_workers = max_workers
+        self.folder_id = folder_id
+        self.access_token = access_token
+        self.rate_limit = rate_limit
+        self.retry = retry
+        self.client = client
+
+        #: Results of the last run, in the same order as the charts
+        self.results: list[ChartResult] = []
+
+    def _attach(self, client: Datawrapper) -> list[Datawrapper | None]:
+        """Send every chart's requests through the batch's client.
+
+        Charts that already have a client, such as charts loaded with get(), are
+        moved over too, so the whole run shares one pool, retry policy and rate
+        limit.
+
+        Returns:
+            The client each chart had before, to hand back with _detach().
+        """
+        previous = [chart._client for chart in self.charts]
+        for chart in self.charts:
+            chart._client = client
+        return previous
+
+    def _detach(self, previous: list[Datawrapper | None]) -> None:
+        """Give every chart back the client it had before the run."""
+        for chart, client in zip(self.charts, previous, strict=True):
+            chart._client = client
+
+    def _resume(self) -> tuple[list[Literal["create", "update"]], dict[int, dict]]:
+        """Work out how to save each chart, picking up where an earlier run stopped.
+
+        Returns:
+            The action for each chart, and the checkpoint records of the charts
+            an earlier run already saved.
+        """
+        self._checkpoint_keys = [
+            f"chart:{self.keys[index] if self.keys else chart.chart_id or index}"
+            for index, chart in enumerate(self.charts)
+        ]
+        actions: list[Literal["create", "update"]] = []
+        resumed: dict[int, dict] = {}
+        for index, chart in enumerate(self.charts):
+            record = None
+            if self.checkpoint is not None:
+                record = self.checkpoint.get(self._checkpoint_keys[index])
+            if record is not None:
+                # Reuse the chart an earlier run created instead of creating another.
+                # A chart that was created but not saved still needs its data.
+                chart.chart_id = record["chart_id"]
+                actions.append(record["action"])
+                resumed[index] = record
+            else:
+                actions.append("update" if chart.chart_id else "create")
+        return actions, resumed
+
+    def _display(self, client: BaseDatawrapper, done: int) -> BulkProgress | None:
+        """Open a progress display for the run, if one was asked for."""
+        if not self.progress:
+            return None
+        display = BulkProgress(client, "Saving charts", total=len(self.charts))
+        display.advance(done)
+        return display
+
+    def _record(
+        self, index: int, action: str, stage: Literal["created", "saved", "published"]
+    ) -> None:
+        """Record the last stage a chart finished in the checkpoint, if there is one."""
+        if self.checkpoint is not None:
+            self.checkpoint.record(
+                self._checkpoint_keys[index],
+                chart_id=self.charts[index].chart_id,
+                action=action,
+                stage=stage,
+            )
+
+    @staticmethod
+    def _stages(resumed: dict[int, dict]) -> tuple[set[int], set[int]]:
+        """Return the charts an earlier run already saved, and already published."""
+        saved = {
+            index for index, record in resumed.items() if record["stage"] != "created"
+        }
+        published = {
+            index for index, record in resumed.items() if record["stage"] == "published"
+        }
+        return saved, published
+
+    def _finish(
+        self,
+        actions: list[Literal["create", "update"]],
+        published: set[int],
+        failures: dict[int, tuple[Literal["save", "publish"], Exception]],
+        raise_on_error: bool,
+        resumed: Iterable[int] = (),
+    ) -> list[ChartResult]:
+        """Collect the results of a run and raise its failures as a group."""
+        self.results = [
+            ChartResult(
+                chart=chart,
+                chart_id=chart.chart_id,
+                action=actions[index],
+                published=index in published,
+                failed_stage=failures[index][0] if index in failures else None,
+                error=failures[index][1] if index in failures else None,
+                resumed=index in resumed,
+            )
+            for index, chart in enumerate(self.charts)
+        ]
+
+        errors = [result.error for result in self.results if result.error is not None]
+        if errors and raise_on_error:
+            raise ExceptionGroup(
+                f"{len(errors)} of {len(self.results)} charts failed", errors
+            )
+        return self.results
+
+    def run(self, raise_on_error: bool = True) -> list[ChartResult]:
+        """Save and publish every chart with a pool of worker threads.
+
+        Args:
+            raise_on_error: Raise the errors of any failed charts as an
+                ExceptionGroup once every chart has been processed, by default
+                True. The results stay available in ``results``.
+
+        Returns:
+            One result per chart, in the same order as the charts.
+
+        Raises:
+            ExceptionGroup: If any chart failed and raise_on_error is True.
+            TypeError: If the batch was given an AsyncDatawrapper client.
+        """
+        # Import here to avoid circular imports
+        from datawrapper.charts.base import BaseChart
+
+        if isinstance(self.client, AsyncDatawrapper):
+            raise TypeError("run() requires a Datawrapper client, use arun() instead.")
+
+        client = self.client or Datawrapper(
+            access_token=BaseChart._resolve_access_token(self.access_token),
+            pool_maxsize=2 * self.max_workers,
+            retry=self.retry,
+            rate_limit=self.rate_limit,
+        )
+        previous = self._attach(client)
+        try:
+            actions, resumed = self._resume()
+            saved, published = self._stages(resumed)
+            failures: dict[int, tuple[Literal["save", "publish"], Exception]] = {}
+
+            def save(index: int) -> None:
+                chart = self.charts[index]
+                if actions[index] == "create" and index not in resumed:
+                    # Record the new chart before its data, so a rerun can't create it again
+                    chart._post_chart(folder_id=self.folder_id)
+                    self._record(index, "create", "created")
+                chart.update()
+                self._record(index, actions[index], "saved")
+
+            def publish(index: int) -> None:
+                self.charts[index].publish()
+                self._record(index, actions[index], "published")
+
+            pending = set(range(len(self.charts))) - saved
+            if self.publish:
+                pending |= saved - published
+            display = self._display(client, len(self.charts) - len(pending))
+
+            def done(*_: Any) -> None:
+                if display is not None:
+                    display.advance()
+
+            def submit_publish(index: int) -> None:
+                future = publish_pool.submit(publish, index)
+                future.add_done_callback(done)
+                publishes[future] = index
+
+            with (
+                display or nullcontext(),
+                ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="datawrapper-save"
+                ) as save_pool,
+                ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="datawrapper-publish",
+                ) as publish_pool,
+            ):
+                saves = {
+                    save_pool.submit(save, index): index
+                    for index in range(len(self.charts))
+                    if index not in saved
+                }
+                publishes: dict[Future, int] = {}
+                if self.publish:
+                    for index in saved - published:
+                        submit_publish(index)
+
+                # Publish each chart as soon as it has been saved
+                for future in as_completed(saves):
+                    index = saves[future]
+                    try:
+                        future.result()
+                    except Exception as error:
+                        failures[index] = ("save", error)
+                        done()
+                        continue
+                    if self.publish:
+                        submit_publish(index)
+                    else:
+                        done()
+
+                for future in as_completed(publishes):
+                    index = publishes[future]
+                    try:
+                        future.result()
+                    except Exception as error:
+                        failures[index] = ("publish", error)
+                    else:
+                        published.add(index)
+
+            return self._finish(actions, published, failures, raise_on_error, resumed)
+        finally:
+            self._detach(previous)
+            if self.client is None:
+                client.close()
+
+    async def arun(self, raise_on_error: bool = True) -> list[ChartResult]:
+        """Save and publish every chart concurrently on the event loop.
+
+        See run(). At most ``max_workers`` requests are in flight at once, shared
+        between both stages.
+        """
+        # Import here to avoid circular imports
+        from datawrapper.charts.base import BaseChart
+
+        client = self.client
+        if client is None:
+            client = AsyncDatawrapper(
+                access_token=BaseChart._resolve_access_token(self.access_token),
+                retry=self.retry,
+                rate_limit=self.rate_limit,
+            )
+        if not isinstance(client, AsyncDatawrapper):
+            raise TypeError("arun() requires an AsyncDatawrapper client.")
+
+        actions, resumed = self._resume()
+        saved, published = self._stages(resumed)
+        failures: dict[int, tuple[Literal["save", "publish"], Exception]] = {}
+        semaphore = asyncio.Semaphore(self.max_workers)
+        finished = sum(1 for index in saved if index in published or not self.publish)
+        display = self._display(client, finished)
+
+        async def process(index: int, chart: BaseChart) -> None:
+            stage: Literal["save", "publish"] = "save"
+            try:
+                if index not in saved:
+                    if actions[index] == "create" and index not in resumed:
+                        async with semaphore:
+                            await chart._apost_chart(
+                                folder_id=self.folder_id, client=client
+                            )
+                        self._record(index, "create", "created")
+                    async with semaphore:
+                        await chart.aupdate(client=client)
+                    self._record(index, actions[index], "saved")
+                if self.publish and index not in published:
+                    stage = "publish"
+                    async with semaphore:
+                        await chart.apublish(client=client)
+                    published.add(index)
+                    self._record(index, actions[index], "published")
+            except Exception as error:
+                failures[index] = (stage, error)
+            if display is not None:
+                display.advance()
+
+        try:
+            with display or nullcontext():
+                await asyncio.gather(
+                    *(
+                        process(index, chart)
+                        for index, chart in enumerate(self.charts)
+                        if index not in saved
+                        or (self.publish and index not in published)
+                    )
+                )
+        finally:
+            if self.client is None:
+                await client.aclose()
+
+        return self._finish(actions, published, failures, raise_on_error, resumed)
@@ -2,43 +2,19 @@
 
 from __future__ import annotations
 
-import os
-from typing import TYPE_CHECKING, cast
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from datawrapper.charts.base import BaseChart
+    from datawrapper.data_io import DtypeBackend
 
 
-def get_chart(chart_id: str, access_token: str | None = None) -> BaseChart:
-    """Retrieve a chart and return the appropriate typed chart instance.
-
-    This function fetches a chart from the Datawrapper API and automatically
-    returns an instance of the appropriate chart class (LineChart, BarChart,
-    ColumnChart, etc.) based on the chart's type.
-
-    Args:
-        chart_id: The ID of the chart to retrieve
-        access_token: Optional Datawrapper API access token. If not provided,
-            will attempt to use the DATAWRAPPER_ACCESS_TOKEN environment variable.
-
-    Returns:
-        BaseChart: A typed chart instance (LineChart, BarChart, ColumnChart, etc.)
-
-    Raises:
-        ValueError: If the chart type is not supported
-        FailedRequestError: If the API request fails
-        InvalidRequestError: If the request is invalid
-
-    Example:
-        >>> from datawrapper import get_chart
-        >>> chart = get_chart("abc123")
-        >>> print(type(chart))
-        <class 'datawrapper.charts.line.LineChart'>
-        >>> chart.title = "Updated Title"
-        >>> chart.update()
-    """
+def _chart_type_map() -> dict[str, type[BaseChart]]:
+    """Map Datawrapper API chart types to Python chart classes."""
     # Import here to avoid circular imports
-    from datawrapper import Datawrapper
     from datawrapper.charts import (
         AreaChart,
         ArrowChart,
@@ -50,23 +26,31 @@ def get_chart(chart_id: str, access_token: str | None = None) -> BaseChart:
         StackedBarChart,
     )
 
-    # Type mapping from Datawrapper API chart types to Python chart classes
-    chart_type_map = {
+    return {
         "d3-lines": LineChart,
         "d3-bars": BarChart,
         "column-chart": ColumnChart,
         "d3-area": AreaChart,
         "d3-arrow-plot": ArrowChart,
-        "d3-bars-split": MultipleColumnChart,
+        "multiple-columns": MultipleColumnChart,
         "d3-scatter-plot": ScatterPlot,
         "d3-bars-stacked": StackedBarChart,
     }
 
-    # Fetch chart metadata to determine type
-    # Handle empty strings from environment variable by converting to None
-    access_token = access_token or os.getenv("DATAWRAPPER_ACCESS_TOKEN") or None
-    dw = Datawrapper(access_token=access_token)
-    metadata = dw.get_chart(chart_id)
+
+def _resolve_chart_class(chart_id: str, metadata: dict[str, Any]) -> type[BaseChart]:
+    """Pick the chart class for a chart's metadata.
+
+    Args:
+        chart_id: The ID of the chart
+        metadata: The chart metadata returned by the API
+
+    Returns:
+        The chart class matching the chart's type.
+
+    Raises:
+        ValueError: If the chart has no type or the type is not supported
+    """
     chart_type = metadata.get("type")
 
     # Validate chart type exists
@@ -74,14 +58,149 @@ def get_chart(chart_id: str, access_token: str | None = None) -> BaseChart:
         raise ValueError(f"Chart {chart_id} has no type field in metadata")
 
     # Get the appropriate chart class
+    chart_type_map = _chart_type_map()
     chart_class = chart_type_map.get(chart_type)
     if not chart_class:
         raise ValueError(
             f"Unsupported chart type: {chart_type}. "
             f"Supported types: {', '.join(chart_type_map.keys())}"
         )
+    return chart_class
+
+
+def get_chart(
+    chart_id: str,
+    access_token: str | None = None,
+    dtype: dict[str, Any] | None = None,
+    dtype_backend: DtypeBackend | None = None,
+    lazy_data: bool = False,
+) -> BaseChart:
+    """Retrieve a chart and return the appropriate typed chart instance.
+
+    This function fetches a chart from the Datawrapper API and automatically
+    returns an instance of the appropriate chart class (LineChart, BarChart,
+    ColumnChart, etc.) based on the chart's type. The chart's metadata and data
+    are requested concurrently, and the metadata is only fetched once.
+
+    Args:
+        chart_id: The ID of the chart to retrieve
+        access_token: Optional Datawrapper API access token. If not provided,
+            will attempt to use the DATAWRAPPER_ACCESS_TOKEN environment variable.
+        dtype: Optional column types for the data, such as a schema saved with
+            dtype_schema(), so they aren't inferred.
+        dtype_backend: Optional backend for the data's columns, "numpy_nullable"
+            or "pyarrow".
+        lazy_data: Only fetch the data the first time ``data`` is read.
+
+    Returns:
+        BaseChart: A typed chart instance (LineChart, BarChart, ColumnChart, etc.)
+
+    Raises:
+        ValueError: If no access token is available or the chart type is not supported
+        Exception: If the API request fails
+
+    Example:
+        >>> from datawrapper import get_chart
+        >>> chart = get_chart("abc123")
+        >>> print(type(chart))
+        <class 'datawrapper.charts.line.LineChart'>
+        >>> chart.title = "Updated Title"
+        >>> chart.update()
+    """
+    # Import here to avoid circular imports
+    from datawrapper import Datawrapper
+    from datawrapper.charts.base import BaseChart, _get_fetch_executor
+
+    client = Datawrapper(access_token=BaseChart._resolve_access_token(access_token))
+
+    # Fetch chart data in the background while the metadata is fetched here
+    data_future = None
+    if not lazy_data:
+        data_future = _get_fetch_executor().submit(
+            BaseChart._fetch_data, client, chart_id, dtype, dtype_backend
+        )
+
+    return BaseChart._load(
+        client,
+        chart_id,
+        lambda: client.get(f"{client._CHARTS_URL}/{chart_id}"),
+        data_future,
+        resolve_class=partial(_resolve_chart_class, chart_id),
+        dtype=dtype,
+        dtype_backend=dtype_backend,
+    )
+
+
+def get_charts_typed(
+    chart_ids: Iterable[str],
+    access_token: str | None = None,
+    max_workers: int = 8,
+    dtype_backend: DtypeBackend | None = None,
+) -> list[BaseChart]:
+    """Retrieve many charts in parallel as typed chart instances.
+
+    Every chart's metadata and data requests are sent through one thread pool
+    and one client, so at most ``max_workers`` requests are in flight at once.
+
+    Args:
+        chart_ids: The IDs of the charts to retrieve
+        access_token: Optional Datawrapper API access token. If not provided,
+            will attempt to use the DATAWRAPPER_ACCESS_TOKEN environment variable.
+        max_workers: Maximum number of concurrent requests, by default 8
+        dtype_backend: Optional backend for the data's columns, "numpy_nullable"
+            or "pyarrow".
+
+    Returns:
+        list[BaseChart]: Typed chart instances, in the same order as ``chart_ids``
+
+    Raises:
+        ValueError: If no access token is available or a chart type is not supported
+        Exception: If an API request fails
+
+    Example:
+        >>> from datawrapper import get_charts_typed
+        >>> charts = get_charts_typed(["abc123", "def456"], max_workers=16)
+    """
+    # Import here to avoid circular imports
+    from datawrapper import Datawrapper
+    from datawrapper.charts.base import BaseChart
+
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+    chart_ids = list(chart_ids)
+    client = Datawrapper(access_token=BaseChart._resolve_access_token(access_token))
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="datawrapper-fetch"
+    ) as executor:
+        metadata_futures = [
+            executor.submit(client.get, f"{client._CHARTS_URL}/{chart_id}")
+            for chart_id in chart_ids
+        ]
+        data_futures = [
+            executor.submit(
+                BaseChart._fetch_data, client, chart_id, None, dtype_backend
+            )
+            for chart_id in chart_ids
+        ]
 
-    # Cast to satisfy type checkers while avoiding circular imports
-    # Use string literal to avoid NameError at runtime
-    chart_class_typed = cast("type[BaseChart]", chart_class)
-    return chart_class_typed.get(chart_id=chart_id, access_token=access_token)
+        try:
+            return [
+                BaseChart._load(
+                    client,
+                    chart_id,
+                    metadata_future.result,
+                    data_future,
+                    resolve_class=partial(_resolve_chart_class, chart_id),
+                    dtype_backend=dtype_backend,
+                )
+                for chart_id, metadata_future, data_future in zip(
+                    chart_ids, metadata_futures, data_futures, strict=True
+                )
+            ]
+        except BaseException:
+            # Stop sending requests for charts that will not be returned
+            for future in (*metadata_futures, *data_futures):
+                future.cancel()
+            raise
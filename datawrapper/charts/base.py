@@ -1,14 +1,93 @@
+import asyncio
+import copy
+import hashlib
 import os
+import threading
 import warnings
-from io import StringIO
-from typing import Any, Literal
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Literal
 
 import pandas as pd
 from IPython.display import IFrame
-from pydantic import BaseModel, ConfigDict, Field, model_validator
-
-from datawrapper.__main__ import Datawrapper
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    ValidatorFunctionWrapHandler,
+    field_validator,
+    model_serializer,
+    model_validator,
+)
+
+from datawrapper.__main__ import BaseDatawrapper, Datawrapper
+from datawrapper.async_client import AsyncDatawrapper
 from datawrapper.charts.models import Annotate, Describe, Publish, Transform, Visualize
+from datawrapper.data_io import (
+    DtypeBackend,
+    is_empty_data,
+    is_polars_frame,
+    is_table,
+    read_csv_data,
+    write_csv_data,
+)
+from datawrapper.download import Download, copy_file
+from datawrapper.export_cache import ExportCache, chart_version
+
+# Threads that fetch chart data while the metadata request is in flight
+_FETCH_MAX_WORKERS = 8
+_fetch_executor: ThreadPoolExecutor | None = None
+_fetch_executor_lock = threading.Lock()
+
+# Stands in for the data fingerprint of a chart whose data hasn't been loaded
+_UNLOADED = "unloaded"
+
+
+def _get_fetch_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor used to overlap chart fetches.
+
+    Returns:
+        A thread pool shared by every call to BaseChart.get().
+    """
+    global _fetch_executor
+    with _fetch_executor_lock:
+        if _fetch_executor is None:
+            _fetch_executor = ThreadPoolExecutor(
+                max_workers=_FETCH_MAX_WORKERS, thread_name_prefix="datawrapper-fetch"
+            )
+        return _fetch_executor
+
+
+def _changed_values(
+    previous: dict[str, Any], current: dict[str, Any]
+) -> dict[str, Any]:
+    """Collect the entries of a serialized chart that differ from an earlier one.
+
+    Nested dictionaries are compared key by key, so only the changed leaves are
+    kept. Any other value, including a list, is kept whole when it differs.
+
+    Args:
+        previous: The chart as it was last synced with the API
+        current: The chart as it is now
+
+    Returns:
+        The changed entries, nested the same way as ``current``.
+    """
+    changes: dict[str, Any] = {}
+    for key, value in current.items():
+        if key not in previous:
+            changes[key] = value
+        elif isinstance(value, dict) and isinstance(previous[key], dict):
+            nested = _changed_values(previous[key], value)
+            if nested:
+                changes[key] = nested
+        elif previous[key] != value:
+            changes[key] = value
+    return changes
 
 
 class BaseChart(BaseModel):
@@ -88,7 +167,8 @@ class BaseChart(BaseModel):
     # Data
     #
 
-    #: The data to use for the chart
+    #: The data to use for the chart. A polars DataFrame or a pyarrow Table is
+    #: accepted too, and is uploaded without converting it to pandas.
     data: pd.DataFrame | list[dict] = Field(
         default_factory=list[dict], description="The data to use for the chart"
     )
@@ -341,21 +421,147 @@ class BaseChart(BaseModel):
             CSV string representation of the data, or None if data is empty.
         """
         # Check if data is empty
-        if isinstance(self.data, pd.DataFrame):
-            if self.data.empty:
-                return None
-        else:
-            if not bool(self.data):
-                return None
+        if is_empty_data(self.data):
+            return None
 
         # Convert to CSV
-        if isinstance(self.data, pd.DataFrame):
+        if is_table(self.data):
+            # polars and pyarrow write CSV themselves, without pandas
+            return write_csv_data(self.data).decode("utf-8")
+        elif isinstance(self.data, pd.DataFrame):
             return self.data.to_csv(index=False, encoding="utf-8")
         else:
             # Convert list of dicts to DataFrame first, then to CSV
             df = pd.DataFrame(self.data)
             return df.to_csv(index=False, encoding="utf-8")
 
+    def _data_fingerprint(self) -> str | None:
+        """Hash the chart data so changes can be detected without serializing it.
+
+        Returns:
+            A hex digest of the column names, dtypes and values, or None if data is empty.
+        """
+        if not self._data_loaded:
+            # Data that was never loaded can't have changed
+            return self._synced_data
+        if is_table(self.data):
+            return self._table_fingerprint()
+        df = (
+            self.data
+            if isinstance(self.data, pd.DataFrame)
+            else pd.DataFrame(self.data)
+        )
+        if df.empty:
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(repr([(str(c), str(t)) for c, t in df.dtypes.items()]).encode())
+        try:
+            values = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        except TypeError:
+            # Cells holding unhashable objects, such as lists, fall back to the CSV
+            digest.update((self.serialize_data() or "").encode("utf-8"))
+        else:
+            digest.update(values.tobytes())
+        return digest.hexdigest()
+
+    def _table_fingerprint(self) -> str | None:
+        """Hash a polars DataFrame or pyarrow Table without converting it to pandas.
+
+        Returns:
+            A hex digest of the schema and values, or None if data is empty.
+        """
+        table: Any = self.data
+        if is_empty_data(table):
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(repr(table.schema).encode())
+        if is_polars_frame(table):
+            try:
+                digest.update(table.hash_rows().to_numpy().tobytes())
+            except Exception:
+                # Columns polars can't hash, such as objects, fall back to the CSV
+                digest.update(write_csv_data(table))
+        else:
+            # pyarrow has no row hash, so hash its multithreaded CSV encoding
+            digest.update(write_csv_data(table))
+        return digest.hexdigest()
+
+    def _mark_synced(
+        self,
+        metadata: dict[str, Any] | None = None,
+        data_fingerprint: str | None = None,
+    ) -> None:
+        """Remember the chart's current state as the state stored by the API.
+
+        Args:
+            metadata: The serialized chart, if already computed.
+            data_fingerprint: The data fingerprint, if already computed.
+        """
+        if metadata is None:
+            metadata = self.serialize_model()
+            data_fingerprint = self._data_fingerprint()
+        self._synced_metadata = copy.deepcopy(metadata)
+        self._synced_data = data_fingerprint
+        # The API's version of the chart is no longer known once it is changed
+        self._version: dict[str, Any] | None = None
+
+    def _pending_update(
+        self, force: bool = False
+    ) -> tuple[dict[str, Any], Any, dict[str, Any], str | None]:
+        """Work out what update() has to send to bring the API in line with the chart.
+
+        Args:
+            force: Send the full chart even if it was synced before.
+
+        Returns:
+            The metadata arguments for update_chart(), which are None when
+            unchanged, the data to upload or None, and the serialized chart
+            and data fingerprint to remember once the update succeeds.
+        """
+        metadata = self.serialize_model()
+        fingerprint = self._data_fingerprint()
+
+        if force or self._synced_metadata is None:
+            # Nothing to compare against, so send everything
+            changed = metadata
+            data = self._data_payload()
+            if fingerprint == _UNLOADED:
+                # The payload loaded the deferred data
+                fingerprint = self._data_fingerprint()
+        else:
+            changed = _changed_values(self._synced_metadata, metadata)
+            data = self._data_payload() if fingerprint != self._synced_data else None
+
+        update_kwargs = {
+            "title": changed.get("title"),
+            "chart_type": changed.get("type"),
+            "theme": changed.get("theme") or None,
+            "language": changed.get("language"),
+            "metadata": changed.get("metadata"),
+        }
+        return update_kwargs, data, metadata, fingerprint
+
+    def _data_payload(self) -> Any:
+        """Return the data to upload, leaving CSV encoding to the client.
+
+        The client streams the DataFrame as CSV in chunks, so unlike
+        serialize_data() the full CSV string is never built.
+
+        Returns:
+            The data as a DataFrame, or None if data is empty. polars DataFrames
+            and pyarrow Tables are returned as they are.
+        """
+        if is_table(self.data):
+            return None if is_empty_data(self.data) else self.data
+        df = (
+            self.data
+            if isinstance(self.data, pd.DataFrame)
+            else pd.DataFrame(self.data)
+        )
+        return None if df.empty else df
+
     #
     # Deserialization methods for parsing API responses and input data
     #
@@ -411,20 +617,35 @@ class BaseChart(BaseModel):
 
         return data
 
+    @field_validator("data", mode="wrap")
     @classmethod
-    def deserialize_data(cls, csv_data: str | pd.DataFrame) -> pd.DataFrame:
+    def accept_tables(cls, value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+        """Keep polars DataFrames and pyarrow Tables as they are."""
+        if is_table(value):
+            return value
+        return handler(value)
+
+    @classmethod
+    def deserialize_data(
+        cls,
+        csv_data: str | bytes | pd.DataFrame,
+        dtype: dict[str, Any] | None = None,
+        dtype_backend: DtypeBackend | None = None,
+    ) -> pd.DataFrame:
         """Parse CSV string from Datawrapper API into DataFrame.
 
         Args:
             csv_data: The CSV data from the chart data endpoint
+            dtype: Optional column types to use instead of inferring them
+            dtype_backend: Optional column backend, "numpy_nullable" or "pyarrow"
 
         Returns:
             DataFrame containing the parsed CSV data
         """
-        # Use sep=None with engine='python' to auto-detect delimiter (comma or tab)
         if isinstance(csv_data, pd.DataFrame):
             return csv_data
-        return pd.read_csv(StringIO(csv_data), sep=None, engine="python")
+        # Sniff the delimiter (comma or tab) from the header and use the C parser
+        return read_csv_data(csv_data, dtype=dtype, dtype_backend=dtype_backend)
 
     @classmethod
     def deserialize_model(cls, api_response: dict[str, Any]) -> dict[str, Any]:
@@ -497,20 +718,120 @@ class BaseChart(BaseModel):
         """Initialize the BaseChart with private attributes."""
         super().__init__(**data)
         self._client = None
+        self._async_client = None
+        self._synced_metadata = None
+        self._synced_data = None
+        self._version = None
+        self._data_loader = None
+        self._data_options = {}
+
+    def __getattr__(self, name: str) -> Any:
+        """Load data that was deferred with lazy_data the first time it is read."""
+        if name == "data" and self.__dict__.get("_data_loader") is not None:
+            return self._set_loaded_data(self._data_loader())
+        # BaseModel hides its __getattr__ from type checkers
+        return super().__getattr__(name)  # type: ignore[misc]
+
+    @property
+    def _data_loaded(self) -> bool:
+        """Whether the chart's data is in memory rather than waiting to be fetched."""
+        return "data" in self.__dict__
+
+    def _defer_data(
+        self,
+        client: Datawrapper | None,
+        dtype: dict[str, Any] | None = None,
+        dtype_backend: DtypeBackend | None = None,
+    ) -> None:
+        """Fetch the chart's data the first time it is read instead of now.
 
-    def _get_client(self, access_token: str | None = None) -> Datawrapper:
-        """Get or create a Datawrapper client instance.
+        Args:
+            client: The client to fetch the data through, or None if the data
+                can only be loaded with aload_data()
+            dtype: Optional column types to parse the data with
+            dtype_backend: Optional column backend to parse the data with
+        """
+        options: dict[str, Any] = {"dtype": dtype, "dtype_backend": dtype_backend}
+        chart_id = str(self.chart_id)
+
+        def load() -> pd.DataFrame:
+            if client is None:
+                raise RuntimeError(
+                    "The data of a chart fetched with aget(lazy_data=True) isn't "
+                    "loaded yet. Call `await chart.aload_data()` before reading it."
+                )
+            return self.deserialize_data(
+                self._fetch_data(client, chart_id, **options), **options
+            )
+
+        del self.__dict__["data"]
+        self._data_options = options
+        self._data_loader = load
+        self._synced_data = _UNLOADED
+
+    def _set_loaded_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Store deferred data once it arrives, remembering it as the API's data."""
+        if not self._data_loaded:
+            self.__dict__["data"] = df
+            if self._synced_data == _UNLOADED:
+                self._synced_data = self._data_fingerprint()
+        self._data_loader = None
+        return self.__dict__["data"]
+
+    @model_serializer(mode="wrap")
+    def include_deferred_data(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> Any:
+        """Load data deferred with lazy_data before dumping, so it isn't left out."""
+        excluded = info.exclude is not None and "data" in info.exclude
+        included = info.include is None or "data" in info.include
+        if not self._data_loaded and included and not excluded:
+            self.load_data()
+        return handler(self)
+
+    def load_data(self) -> pd.DataFrame:
+        """Fetch data that was deferred with ``lazy_data=True``.
+
+        Reading ``data`` does this on first access, so calling it is only needed
+        to choose when the request is made.
+
+        Returns:
+            The chart's data.
+        """
+        return self.data
+
+    async def aload_data(self, client: AsyncDatawrapper | None = None) -> pd.DataFrame:
+        """Fetch data that was deferred with ``lazy_data=True`` without blocking.
+
+        Call this before reading ``data`` on a chart fetched with aget(). Reading
+        it first raises a RuntimeError rather than blocking the event loop.
 
         Args:
-            access_token: Optional Datawrapper API access token.
-                           If not provided, will use DATAWRAPPER_ACCESS_TOKEN environment variable.
+            client: Optional async client to send the request through.
 
         Returns:
-            An instance of the Datawrapper client.
+            The chart's data.
         """
-        if self._client is not None:
-            return self._client
+        if self._data_loaded:
+            return self.data
+        async with self._get_async_client(client=client) as client:
+            options = self._data_options
+            response = await self._fetch_data(client, str(self.chart_id), **options)
+            return self._set_loaded_data(self.deserialize_data(response, **options))
+
+    @staticmethod
+    def _resolve_access_token(access_token: str | None = None) -> str:
+        """Return the access token to use, falling back to the environment.
+
+        Args:
+            access_token: Optional Datawrapper API access token.
 
+        Returns:
+            The access token.
+
+        Raises:
+            ValueError: If no access token is available.
+        """
         # Try to get access token from parameter, environment, or raise error
         token = access_token or os.getenv("DATAWRAPPER_ACCESS_TOKEN")
         if not token:
@@ -518,10 +839,71 @@ class BaseChart(BaseModel):
                 "No Datawrapper access token provided. "
                 "Set DATAWRAPPER_ACCESS_TOKEN environment variable or pass access_token parameter."
             )
+        return token
+
+    def _get_client(self, access_token: str | None = None) -> Datawrapper:
+        """Get or create a Datawrapper client instance.
+
+        Args:
+            access_token: Optional Datawrapper API access token.
+                           If not provided, will use DATAWRAPPER_ACCESS_TOKEN environment variable.
+
+        Returns:
+            An instance of the Datawrapper client.
+        """
+        if self._client is not None:
+            return self._client
 
+        token = self._resolve_access_token(access_token)
         self._client = Datawrapper(access_token=token)
         return self._client
 
+    def _get_async_client(
+        self,
+        access_token: str | None = None,
+        client: AsyncDatawrapper | None = None,
+    ) -> AbstractAsyncContextManager[AsyncDatawrapper]:
+        """Get the async client to send one call's requests through.
+
+        Args:
+            access_token: Optional Datawrapper API access token.
+                           If not provided, will use DATAWRAPPER_ACCESS_TOKEN environment variable.
+            client: Optional async client to use. It is kept for later calls.
+
+        Returns:
+            A context manager that yields the given client, or the one the chart
+            was fetched or created with. Without either, it opens a client for
+            the call and closes it on exit.
+        """
+        if client is not None:
+            self._async_client = client
+        return self._open_async_client(access_token, self._async_client)
+
+    @staticmethod
+    @asynccontextmanager
+    async def _open_async_client(
+        access_token: str | None = None,
+        client: AsyncDatawrapper | None = None,
+    ) -> AsyncIterator[AsyncDatawrapper]:
+        """Yield the given async client, or one that only lives for the call.
+
+        An httpx connection pool is tied to the event loop it was opened on and
+        has to be closed, so a client the caller didn't pass in isn't kept.
+
+        Args:
+            access_token: Optional Datawrapper API access token.
+            client: Optional async client to yield as it is.
+
+        Yields:
+            The async client to send the requests through.
+        """
+        if client is not None:
+            yield client
+            return
+        token = BaseChart._resolve_access_token(access_token)
+        async with AsyncDatawrapper(access_token=token) as client:
+            yield client
+
     @classmethod
     def _validate_chart_type(cls, chart_type: str) -> None:
         """Validate that the chart type matches the class's allowed types.
@@ -544,13 +926,29 @@ class BaseChart(BaseModel):
                     )
 
     @classmethod
-    def get(cls, chart_id: str, access_token: str | None = None) -> "BaseChart":
+    def get(
+        cls,
+        chart_id: str,
+        access_token: str | None = None,
+        dtype: dict[str, Any] | None = None,
+        dtype_backend: DtypeBackend | None = None,
+        lazy_data: bool = False,
+    ) -> "BaseChart":
         """Fetch an existing chart from the Datawrapper API.
 
+        The chart metadata and data are requested concurrently, unless the data
+        is deferred with lazy_data.
+
         Args:
             chart_id: The ID of the chart to fetch
             access_token: Optional Datawrapper API access token.
                         If not provided, will use DATAWRAPPER_ACCESS_TOKEN environment variable.
+            dtype: Optional column types for the data, such as a schema saved with
+                dtype_schema(), so they aren't inferred.
+            dtype_backend: Optional backend for the data's columns. "pyarrow"
+                stores strings and numbers in Arrow memory and requires pyarrow.
+            lazy_data: Only fetch the data the first time ``data`` is read. Until
+                then, update() leaves the data stored by the API untouched.
 
         Returns:
             An instance of the chart class with data populated from the API.
@@ -560,55 +958,175 @@ class BaseChart(BaseModel):
             Exception: If the API request fails.
         """
         # Get token from parameter or environment
-        token = access_token or os.getenv("DATAWRAPPER_ACCESS_TOKEN")
-        if not token:
-            raise ValueError(
-                "No Datawrapper access token provided. "
-                "Set DATAWRAPPER_ACCESS_TOKEN environment variable or pass access_token parameter."
-            )
+        token = cls._resolve_access_token(access_token)
 
         # Create a Datawrapper client instance
         client = Datawrapper(access_token=token)
 
-        try:
-            # Fetch chart metadata
-            metadata_response = client.get(f"{client._CHARTS_URL}/{chart_id}")
+        # Fetch chart data in the background while the metadata is fetched here
+        data_future = None
+        if not lazy_data:
+            data_future = _get_fetch_executor().submit(
+                cls._fetch_data, client, chart_id, dtype, dtype_backend
+            )
 
-            if not isinstance(metadata_response, dict):
-                raise ValueError(
-                    f"Unexpected response type from API: {type(metadata_response)}"
-                )
-        except Exception as e:
-            raise Exception(
-                f"Failed to fetch chart from Datawrapper API. Error: {str(e)}"
-            ) from e
+        return cls._load(
+            client,
+            chart_id,
+            lambda: client.get(f"{client._CHARTS_URL}/{chart_id}"),
+            data_future,
+            dtype=dtype,
+            dtype_backend=dtype_backend,
+        )
 
-        # Verify chart type matches if this is a subclass
-        chart_type = metadata_response.get("type")
-        assert chart_type is not None, "API response missing 'type' field"
-        cls._validate_chart_type(chart_type)
+    @staticmethod
+    def _fetch_data(
+        client: BaseDatawrapper,
+        chart_id: str,
+        dtype: dict[str, Any] | None = None,
+        dtype_backend: DtypeBackend | None = None,
+    ) -> Any:
+        """Request a chart's data, unparsed if it is to be parsed with options.
+
+        Args:
+            client: The client to send the request through
+            chart_id: The ID of the chart
+            dtype: Column types the data will be parsed with
+            dtype_backend: Column backend the data will be parsed with
+
+        Returns:
+            The response of the data endpoint, or an awaitable for async clients.
+        """
+        url = f"{client._CHARTS_URL}/{chart_id}/data"
+        if dtype is None and dtype_backend is None:
+            return client.get(url)
+        return client.get(url, raw=True)
+
+    @classmethod
+    def _load(
+        cls,
+        client: Datawrapper,
+        chart_id: str,
+        fetch_metadata: Callable[[], Any],
+        data_future: Future | None,
+        resolve_class: Callable[[dict[str, Any]], type["BaseChart"]] | None = None,
+        dtype: dict[str, Any] | None = None,
+        dtype_backend: DtypeBackend | None = None,
+    ) -> "BaseChart":
+        """Build a chart from a metadata request and an in-flight data request.
+
+        Args:
+            client: The client the requests were sent through
+            chart_id: The ID of the chart being fetched
+            fetch_metadata: Returns the chart metadata, blocking until it arrives
+            data_future: Resolves to the chart data, or None to defer the data
+                until it is first read
+            resolve_class: Picks the chart class from the metadata. By default
+                the metadata must match this class's chart type.
+            dtype: Optional column types to parse the data with
+            dtype_backend: Optional column backend to parse the data with
+
+        Returns:
+            An instance of the chart class with data populated from the API.
+
+        Raises:
+            ValueError: If the chart type doesn't match.
+            Exception: If either API request fails.
+        """
+        try:
+            try:
+                # Fetch chart metadata
+                metadata_response = fetch_metadata()
+
+                if not isinstance(metadata_response, dict):
+                    raise ValueError(
+                        f"Unexpected response type from API: {type(metadata_response)}"
+                    )
+            except Exception as e:
+                raise Exception(
+                    f"Failed to fetch chart from Datawrapper API. Error: {str(e)}"
+                ) from e
+
+            if resolve_class is not None:
+                chart_class = resolve_class(metadata_response)
+            else:
+                # Verify chart type matches if this is a subclass
+                chart_type = metadata_response.get("type")
+                assert chart_type is not None, "API response missing 'type' field"
+                cls._validate_chart_type(chart_type)
+                chart_class = cls
+        except BaseException:
+            # The data is no use without valid metadata
+            if data_future is not None:
+                data_future.cancel()
+            raise
+
+        if data_future is None:
+            instance = chart_class._from_api_responses(
+                chart_id, metadata_response, None
+            )
+            instance._defer_data(client, dtype, dtype_backend)
+            instance._client = client
+            return instance
 
         try:
-            # Fetch chart data
-            data_response = client.get(f"{client._CHARTS_URL}/{chart_id}/data")
+            # Wait for the chart data
+            data_response = data_future.result()
         except Exception as e:
             raise Exception(
                 f"Failed to fetch chart data from Datawrapper API. Error: {str(e)}"
             ) from e
 
+        # Create instance and set chart_id and client
+        instance = chart_class._from_api_responses(
+            chart_id, metadata_response, data_response, dtype, dtype_backend
+        )
+        instance._client = client
+
+        # Return the instance
+        return instance
+
+    @classmethod
+    def _from_api_responses(
+        cls,
+        chart_id: str,
+        metadata_response: dict[str, Any],
+        data_response: Any,
+        dtype: dict[str, Any] | None = None,
+        dtype_backend: DtypeBackend | None = None,
+    ) -> "BaseChart":
+        """Build a chart instance from the API's metadata and data responses.
+
+        Args:
+            chart_id: The ID of the fetched chart
+            metadata_response: The chart metadata returned by the API
+            data_response: The chart data returned by the API, or None if the
+                data is deferred
+            dtype: Optional column types to parse the data with
+            dtype_backend: Optional column backend to parse the data with
+
+        Returns:
+            An instance of the chart class with chart_id set.
+        """
         # Parse metadata and data separately
         metadata_dict = cls.deserialize_model(metadata_response)
-        data_df = cls.deserialize_data(data_response)
+        parsed_data = metadata_dict
+        if data_response is not None:
+            data_df = cls.deserialize_data(data_response, dtype, dtype_backend)
+            parsed_data = {**metadata_dict, "data": data_df}
 
-        # Merge them
-        parsed_data = {**metadata_dict, "data": data_df}
-
-        # Create instance and set chart_id and client
+        # Create instance and set chart_id
         instance = cls(**parsed_data)
         instance.chart_id = chart_id
-        instance._client = client
 
-        # Return the instance
+        # Remember the fetched state so update() only sends what changes.
+        # Charts that cannot be serialized as fetched fall back to full updates.
+        try:
+            instance._mark_synced()
+        except (TypeError, ValueError):
+            pass
+        instance._version = chart_version(metadata_response)
+
         return instance
 
     def create(
@@ -639,30 +1157,80 @@ class BaseChart(BaseModel):
             title=metadata["title"],
             chart_type=metadata["type"],
             theme=metadata.get("theme") or None,
-            data=self.serialize_data(),
+            data=self._data_payload(),
             forkable=self.forkable,
             language=metadata.get("language"),
             metadata=metadata["metadata"],
             folder_id=folder_id,
         )
 
-        # Extract and validate the chart ID
+        # Store the chart ID and return self for chaining
+        self.chart_id = self._created_chart_id(response)
+        self._mark_synced()
+        return self
+
+    def _post_chart(self, folder_id: int | None = None) -> "BaseChart":
+        """Create the chart via the Datawrapper API without uploading its data.
+
+        The chart ID is stored as soon as the chart exists, and the data is left
+        for update() to upload. A failed upload can then be retried without
+        creating the chart a second time.
+
+        Args:
+            folder_id: Optional folder ID to create the chart in.
+
+        Returns:
+            Self, with the new chart ID in self.chart_id.
+        """
+        client = self._get_client()
+        metadata = self.serialize_model()
+        response = client.create_chart(
+            title=metadata["title"],
+            chart_type=metadata["type"],
+            theme=metadata.get("theme") or None,
+            forkable=self.forkable,
+            language=metadata.get("language"),
+            metadata=metadata["metadata"],
+            folder_id=folder_id,
+        )
+        self.chart_id = self._created_chart_id(response)
+        # The API holds the metadata but no data yet
+        self._mark_synced(metadata, None)
+        return self
+
+    @staticmethod
+    def _created_chart_id(response: Any) -> str:
+        """Extract and validate the ID of a chart the API just created.
+
+        Args:
+            response: The API's response to the create request.
+
+        Returns:
+            The new chart's ID.
+
+        Raises:
+            ValueError: If the response doesn't hold a valid chart ID.
+        """
         if not isinstance(response, dict):
             raise ValueError(f"Unexpected response type from API: {type(response)}")
         chart_id = response.get("id")
         if not chart_id or not isinstance(chart_id, str):
             raise ValueError(f"Invalid chart ID received from API: {chart_id}")
+        return chart_id
 
-        # Store the chart ID and return self for chaining
-        self.chart_id = chart_id
-        return self
-
-    def update(self, access_token: str | None = None) -> "BaseChart":
+    def update(
+        self, access_token: str | None = None, force: bool = False
+    ) -> "BaseChart":
         """Update an existing chart via the Datawrapper API.
 
+        Charts that were fetched with get() or created with create() only send
+        the metadata that changed since then, and only upload the data if it
+        changed. Nothing is sent if nothing changed.
+
         Args:
             access_token: Optional Datawrapper API access token.
                          If not provided, will use DATAWRAPPER_ACCESS_TOKEN environment variable.
+            force: Send all metadata and data, even if unchanged.
 
         Returns:
             Self, to enable method chaining.
@@ -679,19 +1247,18 @@ class BaseChart(BaseModel):
         # Get the client
         client = self._get_client(access_token)
 
-        # Get the serialized chart metadata
-        metadata = self.serialize_model()
+        # Work out what changed since the chart was last synced
+        update_kwargs, data, metadata, fingerprint = self._pending_update(force)
 
-        # Use the convenience method from the client to update the chart
-        client.update_chart(
-            chart_id=self.chart_id,
-            title=metadata["title"],
-            chart_type=metadata["type"],
-            theme=metadata.get("theme") or None,
-            data=self.serialize_data(),
-            language=metadata.get("language"),
-            metadata=metadata["metadata"],
-        )
+        if any(value is not None for value in update_kwargs.values()):
+            # Use the convenience method from the client to update the chart
+            client.update_chart(chart_id=self.chart_id, data=data, **update_kwargs)
+        elif data is not None:
+            # Only the data changed
+            client.upload_data(self.chart_id, data)
+
+        # Remember what the API now holds
+        self._mark_synced(metadata, fingerprint)
 
         # Return self for chaining
         return self
@@ -727,10 +1294,155 @@ class BaseChart(BaseModel):
         # Raise an exception if publishing failed
         if not result:
             raise Exception(f"Failed to publish chart {self.chart_id}")
+        self._version = None
 
         # Return self for chaining
         return self
 
+    @staticmethod
+    def _export_params(
+        *,
+        unit: str = "px",
+        mode: str | None = None,
+        width: int | None,
+        height: int | None,
+        plain: bool,
+        scale: int,
+        zoom: int,
+        transparent: bool,
+        border_width: int,
+        border_color: str | None,
+        logo: str,
+        logo_id: str | None,
+        dark: bool,
+        ligatures: bool,
+        full_vector: bool,
+        download: bool,
+    ) -> dict[str, str]:
+        """Build the query parameters for an export request.
+
+        Args:
+            unit: Unit for measurements: "px", "mm", or "inch".
+            mode: Color mode, "rgb" or "cmyk". Only sent when provided.
+            The remaining arguments are described in export_png().
+
+        Returns:
+            The query parameters keyed by their API names.
+
+        Raises:
+            ValueError: If the unit or mode is invalid.
+        """
+        # Validate parameters
+        if unit not in ("px", "mm", "inch"):
+            raise ValueError(f"Invalid unit: {unit}. Must be 'px', 'mm', or 'inch'.")
+        if mode is not None and mode not in ("rgb", "cmyk"):
+            raise ValueError(f"Invalid mode: {mode}. Must be 'rgb' or 'cmyk'.")
+
+        params = {"unit": unit}
+        if mode is not None:
+            params["mode"] = mode
+        params.update(
+            {
+                "plain": str(plain).lower(),
+                "scale": str(scale),
+                "zoom": str(zoom),
+                "transparent": str(transparent).lower(),
+                "borderWidth": str(border_width),
+                "logo": logo,
+                "dark": str(dark).lower(),
+                "ligatures": str(ligatures).lower(),
+                "fullVector": str(full_vector).lower(),
+                "download": str(download).lower(),
+            }
+        )
+
+        if width is not None:
+            params["width"] = str(width)
+        if height is not None:
+            params["height"] = str(height)
+        if border_color is not None:
+            params["borderColor"] = border_color
+        if logo_id is not None:
+            params["logoId"] = logo_id
+
+        return params
+
+    def _export(
+        self,
+        client: Datawrapper,
+        output: str,
+        params: dict[str, str],
+        timeout: int,
+        destination: str | os.PathLike | BinaryIO | None = None,
+        checksum: str | None = None,
+        cache: ExportCache | None = None,
+    ) -> bytes | Download:
+        """Request a rendered export of the chart.
+
+        Args:
+            client: The client to send the request through.
+            output: The export format: "png", "pdf" or "svg".
+            params: The query parameters built by _export_params().
+            timeout: Timeout for the API request in seconds.
+            destination: Optional path or file-like object to stream the export to.
+            checksum: Optional hashlib algorithm name for the streamed export.
+            cache: Optional cache to serve the export from or store it in.
+
+        Returns:
+            The raw bytes of the rendered file, or the Download written to
+            destination when one is given.
+        """
+        url = f"{client._CHARTS_URL}/{self.chart_id}/export/{output}"
+        if checksum is not None and destination is None:
+            raise ValueError("checksum requires a destination to stream the export to.")
+
+        if cache is not None:
+            if self._version is None:
+                self._version = chart_version(
+                    client.get(f"{client._CHARTS_URL}/{self.chart_id}")
+                )
+            key = cache.key(str(self.chart_id), self._version, output, params)
+            cached = cache.get(key)
+            if cached is None:
+                # Render into the cache once, then serve it like a hit
+                cached = cache.path(key)
+                client.download(url, cached, params=params, timeout=timeout)
+                cache.trim(keep=key)
+            return self._serve_cached(cached, destination, checksum)
+
+        # Stream large exports straight to their destination
+        if destination is not None:
+            return client.download(
+                url, destination, params=params, timeout=timeout, checksum=checksum
+            )
+
+        response = client.get(url, params=params, timeout=timeout)
+
+        # Return raw bytes
+        if isinstance(response, bytes):
+            return response
+        raise ValueError(f"Unexpected response type from API: {type(response)}")
+
+    @staticmethod
+    def _serve_cached(
+        cached: Path,
+        destination: str | os.PathLike | BinaryIO | None,
+        checksum: str | None,
+    ) -> bytes | Download:
+        """Return a cached export, or copy it to the destination.
+
+        Args:
+            cached: The path of the cached export.
+            destination: Optional path or file-like object to copy the export to.
+            checksum: Optional hashlib algorithm name for the copy.
+
+        Returns:
+            The raw bytes of the export, or the Download written to destination.
+        """
+        if destination is None:
+            return cached.read_bytes()
+        return copy_file(cached, destination, checksum)
+
     def export_png(
         self,
         *,
@@ -748,9 +1460,12 @@ class BaseChart(BaseModel):
         ligatures: bool = True,
         full_vector: bool = False,
         download: bool = False,
+        destination: str | os.PathLike | BinaryIO | None = None,
+        checksum: str | None = None,
+        cache: ExportCache | None = None,
         access_token: str | None = None,
         timeout: int = 30,
-    ) -> bytes:
+    ) -> bytes | Download:
         """Export chart as PNG and return the raw bytes.
 
         Args:
@@ -768,11 +1483,18 @@ class BaseChart(BaseModel):
             ligatures: If True (default), enables typography ligatures.
             full_vector: If True, exports as full vector output.
             download: If True, includes download headers in response.
+            destination: Optional path or binary file-like object to stream the
+                export to as it arrives, instead of returning it in memory.
+            checksum: Optional hashlib algorithm name, such as "sha256", to
+                compute over the streamed export. Requires destination.
+            cache: Optional ExportCache to serve the export from while the chart
+                is unchanged, skipping the render on the server.
             access_token: Optional Datawrapper API access token.
             timeout: Timeout for the API request in seconds.
 
         Returns:
-            Raw PNG image data as bytes.
+            Raw PNG image data as bytes, or the Download written to
+            destination when one is given.
 
         Raises:
             ValueError: If no chart_id is set.
@@ -791,41 +1513,28 @@ class BaseChart(BaseModel):
         client = self._get_client(access_token)
 
         # Build query parameters with PNG-specific defaults
-        params = {
-            "unit": "px",
-            "plain": str(plain).lower(),
-            "scale": str(scale),
-            "zoom": str(zoom),
-            "transparent": str(transparent).lower(),
-            "borderWidth": str(border_width),
-            "logo": logo,
-            "dark": str(dark).lower(),
-            "ligatures": str(ligatures).lower(),
-            "fullVector": str(full_vector).lower(),
-            "download": str(download).lower(),
-        }
-
-        if width is not None:
-            params["width"] = str(width)
-        if height is not None:
-            params["height"] = str(height)
-        if border_color is not None:
-            params["borderColor"] = border_color
-        if logo_id is not None:
-            params["logoId"] = logo_id
+        params = self._export_params(
+            width=width,
+            height=height,
+            plain=plain,
+            scale=scale,
+            zoom=zoom,
+            transparent=transparent,
+            border_width=border_width,
+            border_color=border_color,
+            logo=logo,
+            logo_id=logo_id,
+            dark=dark,
+            ligatures=ligatures,
+            full_vector=full_vector,
+            download=download,
+        )
 
         # Make the API request
-        response = client.get(
-            f"{client._CHARTS_URL}/{self.chart_id}/export/png",
-            params=params,
-            timeout=timeout,
+        return self._export(
+            client, "png", params, timeout, destination, checksum, cache
         )
 
-        # Return raw bytes
-        if isinstance(response, bytes):
-            return response
-        raise ValueError(f"Unexpected response type from API: {type(response)}")
-
     def export_pdf(
         self,
         *,
@@ -845,9 +1554,12 @@ class BaseChart(BaseModel):
         ligatures: bool = True,
         full_vector: bool = False,
         download: bool = False,
+        destination: str | os.PathLike | BinaryIO | None = None,
+        checksum: str | None = None,
+        cache: ExportCache | None = None,
         access_token: str | None = None,
         timeout: int = 30,
-    ) -> bytes:
+    ) -> bytes | Download:
         """Export chart as PDF and return the raw bytes.
 
         Args:
@@ -867,11 +1579,18 @@ class BaseChart(BaseModel):
             ligatures: If True (default), enables typography ligatures.
             full_vector: If True, exports as full vector output.
             download: If True, includes download headers in response.
+            destination: Optional path or binary file-like object to stream the
+                export to as it arrives, instead of returning it in memory.
+            checksum: Optional hashlib algorithm name, such as "sha256", to
+                compute over the streamed export. Requires destination.
+            cache: Optional ExportCache to serve the export from while the chart
+                is unchanged, skipping the render on the server.
             access_token: Optional Datawrapper API access token.
             timeout: Timeout for the API request in seconds.
 
         Returns:
-            Raw PDF document data as bytes.
+            Raw PDF document data as bytes, or the Download written to
+            destination when one is given.
 
         Raises:
             ValueError: If no chart_id is set or invalid parameters provided.
@@ -887,51 +1606,33 @@ class BaseChart(BaseModel):
                 "No chart_id set. Use create() first or set chart_id manually."
             )
 
-        # Validate parameters
-        if unit not in ("px", "mm", "inch"):
-            raise ValueError(f"Invalid unit: {unit}. Must be 'px', 'mm', or 'inch'.")
-        if mode not in ("rgb", "cmyk"):
-            raise ValueError(f"Invalid mode: {mode}. Must be 'rgb' or 'cmyk'.")
-
         client = self._get_client(access_token)
 
         # Build query parameters
-        params = {
-            "unit": unit,
-            "mode": mode,
-            "plain": str(plain).lower(),
-            "scale": str(scale),
-            "zoom": str(zoom),
-            "transparent": str(transparent).lower(),
-            "borderWidth": str(border_width),
-            "logo": logo,
-            "dark": str(dark).lower(),
-            "ligatures": str(ligatures).lower(),
-            "fullVector": str(full_vector).lower(),
-            "download": str(download).lower(),
-        }
-
-        if width is not None:
-            params["width"] = str(width)
-        if height is not None:
-            params["height"] = str(height)
-        if border_color is not None:
-            params["borderColor"] = border_color
-        if logo_id is not None:
-            params["logoId"] = logo_id
+        params = self._export_params(
+            unit=unit,
+            mode=mode,
+            width=width,
+            height=height,
+            plain=plain,
+            scale=scale,
+            zoom=zoom,
+            transparent=transparent,
+            border_width=border_width,
+            border_color=border_color,
+            logo=logo,
+            logo_id=logo_id,
+            dark=dark,
+            ligatures=ligatures,
+            full_vector=full_vector,
+            download=download,
+        )
 
         # Make the API request
-        response = client.get(
-            f"{client._CHARTS_URL}/{self.chart_id}/export/pdf",
-            params=params,
-            timeout=timeout,
+        return self._export(
+            client, "pdf", params, timeout, destination, checksum, cache
         )
 
-        # Return raw bytes
-        if isinstance(response, bytes):
-            return response
-        raise ValueError(f"Unexpected response type from API: {type(response)}")
-
     def export_svg(
         self,
         *,
@@ -949,9 +1650,12 @@ class BaseChart(BaseModel):
         ligatures: bool = True,
         full_vector: bool = False,
         download: bool = False,
+        destination: str | os.PathLike | BinaryIO | None = None,
+        checksum: str | None = None,
+        cache: ExportCache | None = None,
         access_token: str | None = None,
         timeout: int = 30,
-    ) -> bytes:
+    ) -> bytes | Download:
         """Export chart as SVG and return the raw bytes.
 
         Args:
@@ -969,11 +1673,18 @@ class BaseChart(BaseModel):
             ligatures: If True (default), enables typography ligatures.
             full_vector: If True, exports as full vector output.
             download: If True, includes download headers in response.
+            destination: Optional path or binary file-like object to stream the
+                export to as it arrives, instead of returning it in memory.
+            checksum: Optional hashlib algorithm name, such as "sha256", to
+                compute over the streamed export. Requires destination.
+            cache: Optional ExportCache to serve the export from while the chart
+                is unchanged, skipping the render on the server.
             access_token: Optional Datawrapper API access token.
             timeout: Timeout for the API request in seconds.
 
         Returns:
-            Raw SVG document data as bytes.
+            Raw SVG document data as bytes, or the Download written to
+            destination when one is given.
 
         Raises:
             ValueError: If no chart_id is set.
@@ -992,41 +1703,28 @@ class BaseChart(BaseModel):
         client = self._get_client(access_token)
 
         # Build query parameters
-        params = {
-            "unit": "px",
-            "plain": str(plain).lower(),
-            "scale": str(scale),
-            "zoom": str(zoom),
-            "transparent": str(transparent).lower(),
-            "borderWidth": str(border_width),
-            "logo": logo,
-            "dark": str(dark).lower(),
-            "ligatures": str(ligatures).lower(),
-            "fullVector": str(full_vector).lower(),
-            "download": str(download).lower(),
-        }
-
-        if width is not None:
-            params["width"] = str(width)
-        if height is not None:
-            params["height"] = str(height)
-        if border_color is not None:
-            params["borderColor"] = border_color
-        if logo_id is not None:
-            params["logoId"] = logo_id
+        params = self._export_params(
+            width=width,
+            height=height,
+            plain=plain,
+            scale=scale,
+            zoom=zoom,
+            transparent=transparent,
+            border_width=border_width,
+            border_color=border_color,
+            logo=logo,
+            logo_id=logo_id,
+            dark=dark,
+            ligatures=ligatures,
+            full_vector=full_vector,
+            download=download,
+        )
 
         # Make the API request
-        response = client.get(
-            f"{client._CHARTS_URL}/{self.chart_id}/export/svg",
-            params=params,
-            timeout=timeout,
+        return self._export(
+            client, "svg", params, timeout, destination, checksum, cache
         )
 
-        # Return raw bytes
-        if isinstance(response, bytes):
-            return response
-        raise ValueError(f"Unexpected response type from API: {type(response)}")
-
     def delete(self, access_token: str | None = None) -> bool:
         """Delete the chart via the Datawrapper API.
 
@@ -1128,6 +1826,612 @@ class BaseChart(BaseModel):
         # Fetch the full chart data using the class's get method
         return self.__class__.get(chart_id=new_chart_id, access_token=access_token)
 
+    #
+    # Async methods for Datawrapper API
+    #
+
+    @classmethod
+    async def aget(
+        cls,
+        chart_id: str,
+        access_token: str | None = None,
+        client: AsyncDatawrapper | None = None,
+        dtype: dict[str, Any] | None = None,
+        dtype_backend: DtypeBackend | None = None,
+        lazy_data: bool = False,
+    ) -> "BaseChart":
+        """Fetch an existing chart from the Datawrapper API without blocking.
+
+        The chart metadata and data are requested concurrently, unless the data
+        is deferred with lazy_data.
+
+        Args:
+            chart_id: The ID of the chart to fetch
+            access_token: Optional Datawrapper API access token.
+                        If not provided, will use DATAWRAPPER_ACCESS_TOKEN environment variable.
+            client: Optional async client to send the requests through.
+            dtype: Optional column types for the data, see get().
+            dtype_backend: Optional backend for the data's columns, see get().
+            lazy_data: Only fetch the data when aload_data() is awaited. Reading
+                ``data`` before that raises a RuntimeError.
+
+        Returns:
+            An instance of the chart class with data populated from the API.
+
+        Raises:
+            ValueError: If no access token is available or chart type doesn't match.
+            Exception: If the API request fails.
+        """
+        # Fetch chart metadata and data at the same time
+        async with cls._open_async_client(access_token, client) as opened:
+            requests = [opened.get(f"{opened._CHARTS_URL}/{chart_id}")]
+            if not lazy_data:
+                requests.append(cls._fetch_data(opened, chart_id, dtype, dtype_backend))
+            metadata_response, *data_responses = await asyncio.gather(
+                *requests, return_exceptions=True
+            )
+        data_response = data_responses[0] if data_responses else None
+
+        if not isinstance(metadata_response, BaseException) and not isinstance(
+            metadata_response, dict
+        ):
+            metadata_response = ValueError(
+                f"Unexpected response type from API: {type(metadata_response)}"
+            )
+        if isinstance(metadata_response, BaseException):
+            raise Exception(
+                f"Failed to fetch chart from Datawrapper API. Error: {str(metadata_response)}"
+            ) from metadata_response
+
+        # Verify chart type matches if this is a subclass
+        chart_type = metadata_response.get("type")
+        assert chart_type is not None, "API response missing 'type' field"
+        cls._validate_chart_type(chart_type)
+
+        if isinstance(data_response, BaseException):
+            raise Exception(
+                f"Failed to fetch chart data from Datawrapper API. Error: {str(data_response)}"
+            ) from data_response
+
+        # Create instance and set chart_id and client
+        instance = cls._from_api_responses(
+            chart_id, metadata_response, data_response, dtype, dtype_backend
+        )
+        if lazy_data:
+            # The data can only be loaded with aload_data(), never by blocking
+            instance._defer_data(None, dtype, dtype_backend)
+        # Only a client the caller passed in outlives the call
+        instance._async_client = client
+        return instance
+
+    async def acreate(
+        self,
+        access_token: str | None = None,
+        folder_id: int | None = None,
+        client: AsyncDatawrapper | None = None,
+    ) -> "BaseChart":
+        """Create a new chart via the Datawrapper API without blocking.
+
+        Args:
+            access_token: Optional Datawrapper API access token.
+                         If not provided, will use DATAWRAPPER_ACCESS_TOKEN environment variable.
+            folder_id: Optional folder ID to create the chart in.
+            client: Optional async client to send the requests through.
+
+        Returns:
+            Self, to enable method chaining. The chart ID is stored in self.chart_id.
+
+        Raises:
+            ValueError: If no access token is available or API returns invalid response.
+            Exception: If the API request fails.
+        """
+        # Get the client
+        async with self._get_async_client(access_token, client) as client:
+            # Get the serialized chart metadata
+            metadata = self.serialize_model()
+
+            # Use the convenience method from the client to create the chart
+            response = await client.create_chart(
+                title=metadata["title"],
+                chart_type=metadata["type"],
+                theme=metadata.get("theme") or None,
+                data=self._data_payload(),
+                forkable=self.forkable,
+                language=metadata.get("language"),
+                metadata=metadata["metadata"],
+                folder_id=folder_id,
+            )
+
+            # Store the chart ID and return self for chaining
+            self.chart_id = self._created_chart_id(response)
+            self._mark_synced()
+            return self
+
+    async def _apost_chart(
+        self, folder_id: int | None = None, client: AsyncDatawrapper | None = None
+    ) -> "BaseChart":
+        """Create the chart without uploading its data and without blocking.
+
+        See _post_chart().
+
+        Args:
+            folder_id: Optional folder ID to create the chart in.
+            client: Optional async client to send the request through.
+
+        Returns:
+            Self, with the new chart ID in self.chart_id.
+        """
+        async with self._get_async_client(client=client) as client:
+            metadata = self.serialize_model()
+            response = await client.create_chart(
+                title=metadata["title"],
+                chart_type=metadata["type"],
+                theme=metadata.get("theme") or None,
+                forkable=self.forkable,
+                language=metadata.get("language"),
+                metadata=metadata["metadata"],
+                folder_id=folder_id,
+            )
+            self.chart_id = self._created_chart_id(response)
+            # The API holds the metadata but no data yet
+            self._mark_synced(metadata, None)
+            return self
+
+    async def aupdate(
+        self,
+        access_token: str | None = None,
+        force: bool = False,
+        client: AsyncDatawrapper | None = None,
+    ) -> "BaseChart":
+        """Update an existing chart via the Datawrapper API without blocking.
+
+        Like update(), only what changed since the last sync is sent.
+
+        Args:
+            access_token: Optional Datawrapper API access token.
+                         If not provided, will use DATAWRAPPER_ACCESS_TOKEN environment variable.
+            force: Send all metadata and data, even if unchanged.
+            client: Optional async client to send the requests through.
+
+        Returns:
+            Self, to enable method chaining.
+
+        Raises:
+            ValueError: If no chart_id is set or no access token is available.
+            Exception: If the API request fails.
+        """
+        if not self.chart_id:
+            raise ValueError(
+                "No chart_id set. Use create() first or set chart_id manually."
+            )
+
+        # Get the client
+        async with self._get_async_client(access_token, client) as client:
+            # Work out what changed since the chart was last synced
+            update_kwargs, data, metadata, fingerprint = self._pending_update(force)
+
+            if any(value is not None for value in update_kwargs.values()):
+                # Use the convenience method from the client to update the chart
+                await client.update_chart(
+                    chart_id=self.chart_id, data=data, **update_kwargs
+                )
+            elif data is not None:
+                # Only the data changed
+                await client.upload_data(self.chart_id, data)
+
+            # Remember what the API now holds
+            self._mark_synced(metadata, fingerprint)
+
+            # Return self for chaining
+            return self
+
+    async def apublish(
+        self,
+        access_token: str | None = None,
+        client: AsyncDatawrapper | None = None,
+    ) -> "BaseChart":
+        """Publish the chart via the Datawrapper API without blocking.
+
+        Args:
+            access_token: Optional Datawrapper API access token.
+                         If not provided, will use DATAWRAPPER_ACCESS_TOKEN environment variable.
+            client: Optional async client to send the requests through.
+
+        Returns:
+            Self, to enable method chaining.
+
+        Raises:
+            ValueError: If no chart_id is set or no access token is available.
+            Exception: If the API request fails or publishing fails.
+        """
+        if not self.chart_id:
+            raise ValueError(
+                "No chart_id set. Use create() first or set chart_id manually."
+            )
+
+        # Get the client
+        async with self._get_async_client(access_token, client) as client:
+            # Call the publish_chart method from the client
+            result = await client.publish_chart(chart_id=self.chart_id)
+
+            # Raise an exception if publishing failed
+            if not result:
+                raise Exception(f"Failed to publish chart {self.chart_id}")
+            self._version = None
+
+            # Return self for chaining
+            return self
+
+    async def _aexport(
+        self,
+        client: AsyncDatawrapper,
+        output: str,
+        params: dict[str, str],
+        timeout: int,
+        destination: str | os.PathLike | BinaryIO | None = None,
+        checksum: str | None = None,
+        cache: ExportCache | None = None,
+    ) -> bytes | Download:
+        """Request a rendered export of the chart without blocking.
+
+        See _export().
+        """
+        url = f"{client._CHARTS_URL}/{self.chart_id}/export/{output}"
+        if checksum is not None and destination is None:
+            raise ValueError("checksum requires a destination to stream the export to.")
+
+        if cache is not None:
+            if self._version is None:
+                self._version = chart_version(
+                    await client.get(f"{client._CHARTS_URL}/{self.chart_id}")
+                )
+            key = cache.key(str(self.chart_id), self._version, output, params)
+            cached = cache.get(key)
+            if cached is None:
+                # Render into the cache once, then serve it like a hit
+                cached = cache.path(key)
+                await client.download(url, cached, params=params, timeout=timeout)
+                cache.trim(keep=key)
+            return self._serve_cached(cached, destination, checksum)
+
+        # Stream large exports straight to their destination
+        if destination is not None:
+            return await client.download(
+                url, destination, params=params, timeout=timeout, checksum=checksum
+            )
+
+        response = await client.get(url, params=params, timeout=timeout)
+
+        # Return raw bytes
+        if isinstance(response, bytes):
+            return response
+        raise ValueError(f"Unexpected response type from API: {type(response)}")
+
+    async def aexport_png(
+        self,
+        *,
+        width: int | None = None,
+        height: int | None = None,
+        plain: bool = False,
+        scale: int = 1,
+        zoom: int = 2,
+        transparent: bool = False,
+        border_width: int = 0,
+        border_color: str | None = None,
+        logo: Literal["auto", "on", "off"] = "auto",
+        logo_id: str | None = None,
+        dark: bool = False,
+        ligatures: bool = True,
+        full_vector: bool = False,
+        download: bool = False,
+        destination: str | os.PathLike | BinaryIO | None = None,
+        checksum: str | None = None,
+        cache: ExportCache | None = None,
+        access_token: str | None = None,
+        client: AsyncDatawrapper | None = None,
+        timeout: int = 30,
+    ) -> bytes | Download:
+        """Export the chart as a PNG image without blocking.
+
+        Takes the same arguments as export_png(), plus:
+
+        Args:
+            client: Optional async client to send the request through.
+
+        Returns:
+            Raw PNG image bytes, or the Download written to destination.
+
+        Raises:
+            ValueError: If no chart_id is set or no access token is available.
+            Exception: If the API request fails.
+        """
+        if not self.chart_id:
+            raise ValueError(
+                "No chart_id set. Use create() first or set chart_id manually."
+            )
+
+        # Get the client
+        async with self._get_async_client(access_token, client) as client:
+            # Build query parameters with PNG-specific defaults
+            params = self._export_params(
+                width=width,
+                height=height,
+                plain=plain,
+                scale=scale,
+                zoom=zoom,
+                transparent=transparent,
+                border_width=border_width,
+                border_color=border_color,
+                logo=logo,
+                logo_id=logo_id,
+                dark=dark,
+                ligatures=ligatures,
+                full_vector=full_vector,
+                download=download,
+            )
+
+            # Make the API request
+            return await self._aexport(
+                client, "png", params, timeout, destination, checksum, cache
+            )
+
+    async def aexport_pdf(
+        self,
+        *,
+        width: int | None = None,
+        height: int | None = None,
+        plain: bool = False,
+        scale: int = 1,
+        zoom: int = 2,
+        unit: Literal["px", "mm", "inch"] = "px",
+        mode: Literal["rgb", "cmyk"] = "rgb",
+        transparent: bool = False,
+        border_width: int = 0,
+        border_color: str | None = None,
+        logo: Literal["auto", "on", "off"] = "auto",
+        logo_id: str | None = None,
+        dark: bool = False,
+        ligatures: bool = True,
+        full_vector: bool = False,
+        download: bool = False,
+        destination: str | os.PathLike | BinaryIO | None = None,
+        checksum: str | None = None,
+        cache: ExportCache | None = None,
+        access_token: str | None = None,
+        client: AsyncDatawrapper | None = None,
+        timeout: int = 30,
+    ) -> bytes | Download:
+        """Export the chart as a PDF document without blocking.
+
+        Takes the same arguments as export_pdf(), plus:
+
+        Args:
+            client: Optional async client to send the request through.
+
+        Returns:
+            Raw PDF document bytes, or the Download written to destination.
+
+        Raises:
+            ValueError: If no chart_id is set, no access token is available,
+                       or invalid unit/mode values are provided.
+            Exception: If the API request fails.
+        """
+        if not self.chart_id:
+            raise ValueError(
+                "No chart_id set. Use create() first or set chart_id manually."
+            )
+
+        # Get the client
+        async with self._get_async_client(access_token, client) as client:
+            # Build query parameters
+            params = self._export_params(
+                unit=unit,
+                mode=mode,
+                width=width,
+                height=height,
+                plain=plain,
+                scale=scale,
+                zoom=zoom,
+                transparent=transparent,
+                border_width=border_width,
+                border_color=border_color,
+                logo=logo,
+                logo_id=logo_id,
+                dark=dark,
+                ligatures=ligatures,
+                full_vector=full_vector,
+                download=download,
+            )
+
+            # Make the API request
+            return await self._aexport(
+                client, "pdf", params, timeout, destination, checksum, cache
+            )
+
+    async def aexport_svg(
+        self,
+        *,
+        width: int | None = None,
+        height: int | None = None,
+        plain: bool = False,
+        scale: int = 1,
+        zoom: int = 2,
+        transparent: bool = False,
+        border_width: int = 0,
+        border_color: str | None = None,
+        logo: Literal["auto", "on", "off"] = "auto",
+        logo_id: str | None = None,
+        dark: bool = False,
+        ligatures: bool = True,
+        full_vector: bool = False,
+        download: bool = False,
+        destination: str | os.PathLike | BinaryIO | None = None,
+        checksum: str | None = None,
+        cache: ExportCache | None = None,
+        access_token: str | None = None,
+        client: AsyncDatawrapper | None = None,
+        timeout: int = 30,
+    ) -> bytes | Download:
+        """Export the chart as an SVG image without blocking.
+
+        Takes the same arguments as export_svg(), plus:
+
+        Args:
+            client: Optional async client to send the request through.
+
+        Returns:
+            Raw SVG image bytes, or the Download written to destination.
+
+        Raises:
+            ValueError: If no chart_id is set or no access token is available.
+            Exception: If the API request fails.
+        """
+        if not self.chart_id:
+            raise ValueError(
+                "No chart_id set. Use create() first or set chart_id manually."
+            )
+
+        # Get the client
+        async with self._get_async_client(access_token, client) as client:
+            # Build query parameters
+            params = self._export_params(
+                width=width,
+                height=height,
+                plain=plain,
+                scale=scale,
+                zoom=zoom,
+                transparent=transparent,
+                border_width=border_width,
+                border_color=border_color,
+                logo=logo,
+                logo_id=logo_id,
+                dark=dark,
+                ligatures=ligatures,
+                full_vector=full_vector,
+                download=download,
+            )
+
+            # Make the API request
+            return await self._aexport(
+                client, "svg", params, timeout, destination, checksum, cache
+            )
+
+    async def adelete(
+        self,
+        access_token: str | None = None,
+        client: AsyncDatawrapper | None = None,
+    ) -> bool:
+        """Delete the chart via the Datawrapper API without blocking.
+
+        Args:
+            access_token: Optional Datawrapper API access token.
+                         If not provided, will use DATAWRAPPER_ACCESS_TOKEN environment variable.
+            client: Optional async client to send the request through.
+
+        Returns:
+            True if the chart was deleted successfully.
+
+        Raises:
+            ValueError: If no chart_id is set or no access token is available.
+            Exception: If the API request fails.
+        """
+        if not self.chart_id:
+            raise ValueError(
+                "No chart_id set. Use create() first or set chart_id manually."
+            )
+
+        # Get the client
+        async with self._get_async_client(access_token, client) as client:
+            result = await client.delete(f"{client._CHARTS_URL}/{self.chart_id}")
+
+            # Clear the chart_id after successful deletion
+            if result:
+                self.chart_id = None
+
+            return result
+
+    async def aduplicate(
+        self,
+        access_token: str | None = None,
+        client: AsyncDatawrapper | None = None,
+    ) -> "BaseChart":
+        """Duplicate the chart via the Datawrapper API without blocking.
+
+        Args:
+            access_token: Optional Datawrapper API access token.
+                         If not provided, will use DATAWRAPPER_ACCESS_TOKEN environment variable.
+            client: Optional async client to send the requests through.
+
+        Returns:
+            A new BaseChart instance representing the duplicated chart.
+
+        Raises:
+            ValueError: If no chart_id is set or no access token is available.
+            Exception: If the API request fails.
+        """
+        if not self.chart_id:
+            raise ValueError(
+                "No chart_id set. Use create() first or set chart_id manually."
+            )
+
+        # Get the client
+        async with self._get_async_client(access_token, client) as client:
+            # Call the copy_chart method from the client
+            response = await client.copy_chart(chart_id=self.chart_id)
+
+            # Extract the new chart ID
+            if not isinstance(response, dict):
+                raise ValueError(f"Unexpected response type from API: {type(response)}")
+            new_chart_id = response.get("id")
+            if not new_chart_id or not isinstance(new_chart_id, str):
+                raise ValueError(f"Invalid chart ID received from API: {new_chart_id}")
+
+            # Fetch the full chart data using the class's aget method
+            return await self.__class__.aget(
+                chart_id=new_chart_id, access_token=access_token, client=client
+            )
+
+    async def afork(
+        self,
+        access_token: str | None = None,
+        client: AsyncDatawrapper | None = None,
+    ) -> "BaseChart":
+        """Fork the chart via the Datawrapper API without blocking.
+
+        Args:
+            access_token: Optional Datawrapper API access token.
+                         If not provided, will use DATAWRAPPER_ACCESS_TOKEN environment variable.
+            client: Optional async client to send the requests through.
+
+        Returns:
+            A new BaseChart instance representing the forked chart.
+
+        Raises:
+            ValueError: If no chart_id is set or no access token is available.
+            Exception: If the API request fails.
+        """
+        if not self.chart_id:
+            raise ValueError(
+                "No chart_id set. Use create() first or set chart_id manually."
+            )
+
+        # Get the client
+        async with self._get_async_client(access_token, client) as client:
+            # Call the fork_chart method from the client
+            response = await client.fork_chart(chart_id=self.chart_id)
+
+            # Extract the new chart ID
+            if not isinstance(response, dict):
+                raise ValueError(f"Unexpected response type from API: {type(response)}")
+            new_chart_id = response.get("id")
+            if not new_chart_id or not isinstance(new_chart_id, str):
+                raise ValueError(f"Invalid chart ID received from API: {new_chart_id}")
+
+            # Fetch the full chart data using the class's aget method
+            return await self.__class__.aget(
+                chart_id=new_chart_id, access_token=access_token, client=client
+            )
+
     def get_display_urls(self, access_token: str | None = None) -> list[dict]:
         """Get the URLs for the published chart, table or map.
 
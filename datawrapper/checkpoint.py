@@ -0,0 +1,91 @@
+"""A local ledger of finished work, so interrupted bulk jobs can resume."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+
+class Checkpoint:
+    """A thread-safe ledger of finished steps, stored as a JSON Lines file.
+
+    Every finished step is appended to the file as one line holding its key and
+    what it returned, such as the ID of a created chart. Opening the same file
+    again loads those records, so a rerun of the job can skip the steps that
+    already finished. Later records for a key replace earlier ones, and a line
+    cut short by a crash is ignored.
+
+    Example:
+        >>> from datawrapper import Checkpoint, export_many
+        >>> checkpoint = Checkpoint("exports.ckpt.jsonl")
+        >>> results = export_many(chart_ids, out_dir="exports", checkpoint=checkpoint)
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """Initialize the ledger and load the records of earlier runs.
+
+        Args:
+            path: The ledger file. Created, along with its directory, on the first
+                record.
+        """
+        self.path = Path(path).expanduser()
+        self._records: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Read the records written by earlier runs."""
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Skip a line left incomplete by an interrupted write
+                        continue
+                    if isinstance(record, dict) and isinstance(record.get("key"), str):
+                        self._records[record["key"]] = record.get("value") or {}
+        except FileNotFoundError:
+            pass
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return what a finished step recorded, or None if it hasn't finished.
+
+        Args:
+            key: The step's key.
+
+        Returns:
+            A copy of the recorded values.
+        """
+        with self._lock:
+            value = self._records.get(key)
+        return dict(value) if value is not None else None
+
+    def record(self, key: str, **value: Any) -> None:
+        """Record a finished step and write it to the ledger straight away.
+
+        Args:
+            key: The step's key.
+            value: What the step returned. Must be JSON serializable.
+        """
+        line = json.dumps({"key": key, "value": value}, default=str)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.write(line + "\n")
+            self._records[key] = value
+
+    def clear(self) -> None:
+        """Forget every record and delete the ledger file."""
+        with self._lock:
+            self._records.clear()
+            self.path.unlink(missing_ok=True)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
@@ -0,0 +1,83 @@
+"""Compression of request bodies sent to the Datawrapper API."""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import Iterable, Iterator
+from typing import Any, Literal
+
+#: Content-Encoding values the client can produce
+Encoding = Literal["gzip", "deflate"]
+
+#: zlib window bits selecting the gzip and zlib ("deflate") container formats
+_WBITS = {"gzip": 31, "deflate": 15}
+
+#: Status code a server answers with when it cannot decode the request body
+UNSUPPORTED_MEDIA_TYPE = 415
+
+
+def _compressor(encoding: Encoding, level: int):
+    """Create a zlib compressor for the given Content-Encoding."""
+    if encoding not in _WBITS:
+        raise ValueError(f"Invalid encoding: {encoding}. Must be 'gzip' or 'deflate'.")
+    return zlib.compressobj(level, zlib.DEFLATED, _WBITS[encoding])
+
+
+class CompressedStream:
+    """Compress an iterable of byte chunks as it is read.
+
+    Like the stream it wraps, a ``CompressedStream`` can be iterated again when
+    the wrapped body can, so a compressed upload can still be retried.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], encoding: Encoding, level: int = 6):
+        """Initialize the stream.
+
+        Args:
+            chunks: The uncompressed body.
+            encoding: The Content-Encoding to produce.
+            level: The zlib compression level, from 1 (fastest) to 9 (smallest).
+        """
+        _compressor(encoding, level)
+        self.chunks = chunks
+        self.encoding = encoding
+        self.level = level
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield the compressed body."""
+        compressor = _compressor(self.encoding, self.level)
+        for chunk in self.chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+
+def compress_body(
+    body: Any, encoding: Encoding, min_size: int = 1024, level: int = 6
+) -> bytes | CompressedStream | None:
+    """Compress a request body if it is worth it.
+
+    Bodies given as text or bytes are compressed when they hold at least
+    ``min_size`` bytes. Streamed bodies have no known size and are always
+    compressed, since streaming is only used for large uploads.
+
+    Args:
+        body: The request body, as text, bytes or an iterable of byte chunks.
+        encoding: The Content-Encoding to produce.
+        min_size: Smallest body in bytes that is compressed.
+        level: The zlib compression level, from 1 (fastest) to 9 (smallest).
+
+    Returns:
+        The compressed body, or None if it should be sent as it is.
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if isinstance(body, (bytes, bytearray)):
+        if len(body) < min_size:
+            return None
+        compressor = _compressor(encoding, level)
+        return compressor.compress(body) + compressor.flush()
+    if isinstance(body, Iterable) and not isinstance(body, dict):
+        return CompressedStream(body, encoding, level)
+    return None
@@ -0,0 +1,221 @@
+"""Helpers for moving chart data between DataFrames and the Datawrapper API."""
+
+from __future__ import annotations
+
+import re
+import sys
+from collections.abc import Iterator, Mapping
+from io import BytesIO, StringIO
+from typing import Any, Literal
+
+import pandas as pd
+
+#: Number of DataFrame rows encoded into each chunk of a streamed upload
+DEFAULT_CHUNK_ROWS = 50_000
+
+#: Backends for the columns of parsed data, see pandas.read_csv
+DtypeBackend = Literal["numpy_nullable", "pyarrow"]
+
+#: Delimiters recognised when sniffing CSV data, in order of preference on a tie
+DELIMITERS = (",", "\t", ";", "|")
+
+_QUOTED = re.compile(r'"[^"]*"')
+
+
+def is_polars_frame(data: Any) -> bool:
+    """Check whether data is a polars DataFrame, without importing polars."""
+    polars = sys.modules.get("polars")
+    return polars is not None and isinstance(data, polars.DataFrame)
+
+
+def is_arrow_table(data: Any) -> bool:
+    """Check whether data is a pyarrow Table, without importing pyarrow."""
+    pyarrow = sys.modules.get("pyarrow")
+    return pyarrow is not None and isinstance(data, pyarrow.Table)
+
+
+def is_table(data: Any) -> bool:
+    """Check whether data is a polars DataFrame or a pyarrow Table.
+
+    These are encoded with their own library's CSV writer rather than pandas.
+    """
+    return is_polars_frame(data) or is_arrow_table(data)
+
+
+def is_empty_data(data: Any) -> bool:
+    """Check whether chart data has no rows.
+
+    Args:
+        data: A pandas or polars DataFrame, a pyarrow Table or a list of records.
+
+    Returns:
+        True if there is nothing to upload.
+    """
+    if isinstance(data, pd.DataFrame):
+        return data.empty
+    if is_polars_frame(data):
+        return data.is_empty()
+    if is_arrow_table(data):
+        return data.num_rows == 0
+    return not data
+
+
+def write_csv_data(data: Any, header: bool = True) -> bytes:
+    """Encode chart data as UTF-8 CSV.
+
+    polars DataFrames and pyarrow Tables are written by their library's
+    multithreaded CSV writer, without converting them to pandas.
+
+    Args:
+        data: A pandas or polars DataFrame, a pyarrow Table or a list of records.
+        header: Include the line of column names.
+
+    Returns:
+        The CSV data.
+    """
+    if is_polars_frame(data):
+        buffer = BytesIO()
+        data.write_csv(buffer, include_header=header)
+        return buffer.getvalue()
+    if is_arrow_table(data):
+        import pyarrow as pa
+        import pyarrow.csv
+
+        sink = pa.BufferOutputStream()
+        options = pyarrow.csv.WriteOptions(include_header=header)
+        pyarrow.csv.write_csv(data, sink, write_options=options)
+        return sink.getvalue().to_pybytes()
+    df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+    return df.to_csv(index=False, header=header).encode("utf-8")
+
+
+def sniff_delimiter(data: bytes | str) -> str:
+    """Guess the delimiter of CSV data from its header line.
+
+    Only the first line is read, so this is fast however large the data is.
+    Quoted field names are skipped, so delimiters inside them aren't counted.
+
+    Args:
+        data: The CSV data.
+
+    Returns:
+        The delimiter that appears most often in the header line, or a comma if
+        none of DELIMITERS appears.
+    """
+    if isinstance(data, bytes):
+        newline = data.find(b"\n")
+        line = data[:newline] if newline != -1 else data
+        header = line.decode("utf-8", errors="replace")
+    else:
+        newline = data.find("\n")
+        header = data[:newline] if newline != -1 else data
+    header = _QUOTED.sub("", header)
+    counts = {delimiter: header.count(delimiter) for delimiter in DELIMITERS}
+    best = max(DELIMITERS, key=counts.__getitem__)
+    return best if counts[best] else ","
+
+
+def read_csv_data(
+    data: bytes | str,
+    sep: str | None = None,
+    dtype: Mapping[str, Any] | None = None,
+    dtype_backend: DtypeBackend | None = None,
+) -> pd.DataFrame:
+    """Parse CSV data returned by the API with pandas' C parser.
+
+    Bytes are parsed straight from the response body without decoding them into
+    a string first. With the pyarrow backend, the data is parsed by pyarrow's
+    multithreaded reader instead, and every column is stored in Arrow memory.
+
+    Args:
+        data: The CSV data, as UTF-8 encoded bytes or a string.
+        sep: The delimiter. Sniffed from the header line if not given.
+        dtype: Optional column types, such as a schema from dtype_schema(). The
+            types of these columns aren't inferred.
+        dtype_backend: Optional backend for the columns, "numpy_nullable" or
+            "pyarrow". The pyarrow backend requires pyarrow.
+
+    Returns:
+        The parsed data.
+    """
+    if sep is None:
+        sep = sniff_delimiter(data)
+    buffer = BytesIO(data) if isinstance(data, bytes) else StringIO(data)
+    options: dict[str, Any] = {"sep": sep, "dtype": dtype}
+    if dtype_backend is not None:
+        options["dtype_backend"] = dtype_backend
+    engine = "pyarrow" if dtype_backend == "pyarrow" else "c"
+    return pd.read_csv(buffer, engine=engine, **options)
+
+
+def dtype_schema(df: pd.DataFrame) -> dict[str, str]:
+    """Describe the column types of parsed data, to skip inferring them next time.
+
+    The schema is a plain dictionary that can be stored as JSON and passed back
+    as ``dtype`` when the same chart's data is loaded again.
+
+    Args:
+        df: Data parsed from a chart.
+
+    Returns:
+        The name of each column's type, by column.
+
+    Example:
+        >>> dtype_schema(pd.DataFrame({"year": [2024], "value": [1.5]}))
+        {'year': 'int64', 'value': 'float64'}
+    """
+    return {str(column): str(dtype) for column, dtype in df.dtypes.items()}
+
+
+class CSVStream:
+    """Encode a DataFrame as CSV a chunk of rows at a time.
+
+    Iterating yields the UTF-8 encoded header line followed by one ``bytes``
+    chunk per ``chunk_rows`` rows, so the full CSV never exists in memory at
+    once. The output is identical to ``DataFrame.to_csv(index=False)``.
+    polars DataFrames and pyarrow Tables are sliced without copying and
+    encoded by their own CSV writer, see write_csv_data().
+
+    The stream can be iterated more than once, which lets a failed upload be
+    retried. Passing it as a request body makes ``requests`` send it with
+    chunked transfer encoding.
+
+    Example:
+        >>> stream = CSVStream(pd.DataFrame({"a": [1, 2]}))
+        >>> b"".join(stream)
+        b'a\\n1\\n2\\n'
+    """
+
+    def __init__(
+        self,
+        data: Any,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    ):
+        """Initialize the stream.
+
+        Args:
+            data: The rows to encode, as a pandas or polars DataFrame, a pyarrow
+                Table or a list of records.
+            chunk_rows: Number of rows encoded into each chunk.
+        """
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be at least 1, got {chunk_rows}")
+        if not isinstance(data, pd.DataFrame) and not is_table(data):
+            data = pd.DataFrame(data)
+        self.data = data
+        self.chunk_rows = chunk_rows
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield the CSV header followed by the encoded rows."""
+        df = self.data
+        if is_table(df):
+            # polars and pyarrow slices are views, so slicing copies nothing
+            yield write_csv_data(df.slice(0, 0))
+            for start in range(0, len(df), self.chunk_rows):
+                chunk = df.slice(start, self.chunk_rows)
+                yield write_csv_data(chunk, header=False)
+            return
+        yield df.iloc[0:0].to_csv(index=False).encode("utf-8")
+        for start in range(0, len(df), self.chunk_rows):
+            chunk = df.iloc[start : start + self.chunk_rows]
+            yield chunk.to_csv(index=False, header=False).encode("utf-8")
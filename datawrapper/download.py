@@ -0,0 +1,137 @@
+"""Streaming downloads of exported charts to disk or file-like objects."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import BinaryIO
+
+from pydantic import BaseModel, ConfigDict, Field
+
+#: Number of bytes read from the network at a time
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class Download(BaseModel):
+    """The outcome of a streamed download."""
+
+    model_config = ConfigDict(frozen=True)
+
+    #: Where the file was written, or None for a file-like destination
+    path: Path | None = Field(
+        default=None,
+        description="Where the file was written, or None for a file-like destination",
+    )
+
+    #: Number of bytes written
+    size: int = Field(description="Number of bytes written")
+
+    #: Hex digest of the content, if a checksum was requested
+    checksum: str | None = Field(
+        default=None,
+        description="Hex digest of the content, if a checksum was requested",
+    )
+
+    #: Name of the hash algorithm used for the checksum
+    algorithm: str | None = Field(
+        default=None,
+        description="Name of the hash algorithm used for the checksum",
+    )
+
+
+class DownloadSink:
+    """Write a download to its destination chunk by chunk.
+
+    Paths are written through a temporary file in the same directory that
+    replaces the destination only once every chunk has arrived, so a failed
+    download never leaves a truncated file behind. File-like objects are written
+    to directly and left open.
+    """
+
+    def __init__(
+        self,
+        destination: str | os.PathLike | BinaryIO,
+        checksum: str | None = None,
+    ):
+        """Initialize the sink.
+
+        Args:
+            destination: A path, or a binary file-like object with a write() method.
+            checksum: Name of a hashlib algorithm, such as "sha256", to compute
+                while writing. By default None, which computes no checksum.
+        """
+        self._hash = hashlib.new(checksum) if checksum else None
+        self.size = 0
+
+        if isinstance(destination, (str, os.PathLike)):
+            self.path: Path | None = Path(destination)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".part"
+            )
+            self._file: BinaryIO = os.fdopen(fd, "wb")
+            self._tmp_path: Path | None = Path(tmp_name)
+        else:
+            self.path = None
+            self._file = destination
+            self._tmp_path = None
+
+    def write(self, chunk: bytes) -> None:
+        """Write the next chunk of the download."""
+        self._file.write(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+        self.size += len(chunk)
+
+    def commit(self) -> Download:
+        """Finish the download and move it into place.
+
+        Returns:
+            The path, size and checksum of the download.
+        """
+        if self._tmp_path is not None:
+            self._file.close()
+            os.replace(self._tmp_path, self.path)  # type: ignore[arg-type]
+            self._tmp_path = None
+        return Download(
+            path=self.path,
+            size=self.size,
+            checksum=self._hash.hexdigest() if self._hash is not None else None,
+            algorithm=self._hash.name if self._hash is not None else None,
+        )
+
+    def abort(self) -> None:
+        """Discard a partial download."""
+        if self._tmp_path is not None:
+            self._file.close()
+            self._tmp_path.unlink(missing_ok=True)
+            self._tmp_path = None
+
+
+def copy_file(
+    source: str | os.PathLike,
+    destination: str | os.PathLike | BinaryIO,
+    checksum: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Download:
+    """Copy a local file to a destination the way a download would be written.
+
+    Args:
+        source: The file to copy.
+        destination: A path, or a binary file-like object with a write() method.
+        checksum: Name of a hashlib algorithm to compute while writing.
+        chunk_size: Number of bytes copied at a time.
+
+    Returns:
+        The path, size and checksum of the copy.
+    """
+    sink = DownloadSink(destination, checksum)
+    try:
+        with open(source, "rb") as file:
+            while chunk := file.read(chunk_size):
+                sink.write(chunk)
+    except BaseException:
+        sink.abort()
+        raise
+    return sink.commit()
@@ -1,5 +1,7 @@
 """Custom exceptions for the datawrapper package."""
 
+from datawrapper.retry import parse_retry_after
+
 
 class FailedRequestError(Exception):
     """Custom exception for failed API requests."""
@@ -33,6 +35,9 @@ class RateLimitError(FailedRequestError):
         self.response = response
         self.resource_type = resource_type
 
+        # How many seconds the server asked us to wait, if it said
+        self.retry_after = parse_retry_after(getattr(response, "headers", None))
+
         # Try to parse the error message from response
         try:
             import json
@@ -0,0 +1,147 @@
+"""A local on-disk cache of rendered chart exports."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+#: Default upper bound for the total size of a cache directory, in bytes
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+#: Chart metadata fields that change whenever the rendered chart may change
+VERSION_FIELDS = ("publicVersion", "publishedAt", "lastModifiedAt")
+
+
+def chart_version(metadata: dict[str, Any]) -> dict[str, Any]:
+    """Pick the fields that identify a version of a chart from its metadata.
+
+    Args:
+        metadata: The chart metadata returned by the API.
+
+    Returns:
+        The version fields present in the metadata.
+    """
+    return {field: metadata[field] for field in VERSION_FIELDS if field in metadata}
+
+
+class ExportCache:
+    """A content-addressed cache of chart exports, evicted least recently used first.
+
+    Exports are stored under a key built from the chart ID, the chart's version
+    and the export format and parameters, so a cached file is only served while
+    the chart is unchanged. Reading an export marks it as recently used, and the
+    oldest exports are removed once the cache grows beyond ``max_size`` bytes.
+    One cache directory can be shared by several processes.
+
+    Example:
+        >>> from datawrapper import BarChart, ExportCache
+        >>> cache = ExportCache("~/.cache/datawrapper/exports", max_size=1024**3)
+        >>> chart = BarChart.get("abc123")
+        >>> png = chart.export_png(zoom=2, width=600, cache=cache)
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_size: int = DEFAULT_MAX_SIZE):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory to store exports in. Created if it doesn't exist.
+            max_size: Maximum total size of the cached exports in bytes, by default
+                512 MiB.
+        """
+        if max_size < 0:
+            raise ValueError(f"max_size must not be negative, got {max_size}")
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(
+        chart_id: str,
+        version: dict[str, Any],
+        output: str,
+        params: dict[str, str],
+    ) -> str:
+        """Build the cache key for an export.
+
+        Args:
+            chart_id: The ID of the exported chart.
+            version: The chart's version fields, see chart_version().
+            output: The export format.
+            params: The export query parameters.
+
+        Returns:
+            A hex digest that is the same for identical exports of the same version.
+        """
+        payload = json.dumps(
+            [chart_id, version, output, params], sort_keys=True, default=str
+        )
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{digest}.{output}"
+
+    def path(self, key: str) -> Path:
+        """Return where the export with the given key is stored."""
+        return self.directory / key
+
+    def get(self, key: str) -> Path | None:
+        """Look up an export and mark it as recently used.
+
+        Args:
+            key: The cache key, see key().
+
+        Returns:
+            The path of the cached export, or None if it isn't cached.
+        """
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def trim(self, keep: str | None = None) -> None:
+        """Evict the least recently used exports until the cache fits in max_size.
+
+        Args:
+            keep: Key of an export that must not be evicted, such as the one just
+                added.
+        """
+        with self._lock:
+            entries = []
+            for path in self.directory.iterdir():
+                # Skip partial downloads in progress
+                if path.name.startswith("."):
+                    continue
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_size:
+                    break
+                if path.name == keep:
+                    continue
+                path.unlink(missing_ok=True)
+                total -= size
+
+    def size(self) -> int:
+        """Return the total size of the cached exports in bytes."""
+        return sum(
+            path.stat().st_size
+            for path in self.directory.iterdir()
+            if not path.name.startswith(".")
+        )
+
+    def clear(self) -> None:
+        """Remove every cached export."""
+        with self._lock:
+            for path in self.directory.iterdir():
+                if not path.name.startswith("."):
+                    path.unlink(missing_ok=True)
@@ -0,0 +1,300 @@
+"""Conditional GET caching for responses from the Datawrapper API."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from datawrapper.data_io import read_csv_data
+from datawrapper.download import DownloadSink
+
+#: Status code of a response confirming the cached copy is still current
+NOT_MODIFIED = 304
+
+
+class CacheEntry(BaseModel):
+    """A cached response body with the validators needed to revalidate it."""
+
+    model_config = ConfigDict(frozen=True)
+
+    #: The ETag response header
+    etag: str | None = Field(default=None, description="The ETag response header")
+
+    #: The Last-Modified response header
+    last_modified: str | None = Field(
+        default=None, description="The Last-Modified response header"
+    )
+
+    #: The Content-Type response header
+    content_type: str = Field(
+        default="", description="The Content-Type response header"
+    )
+
+    #: The raw response body
+    body: bytes = Field(description="The raw response body")
+
+    #: When the entry was stored or last revalidated, as a Unix timestamp
+    stored_at: float = Field(
+        default_factory=time.time,
+        description="When the entry was stored or last revalidated, as a Unix timestamp",
+    )
+
+    @classmethod
+    def from_response(cls, headers: Any, body: bytes) -> CacheEntry | None:
+        """Build an entry from a response, if the response can be revalidated.
+
+        Args:
+            headers: The response headers.
+            body: The raw response body.
+
+        Returns:
+            The entry, or None if the response has neither an ETag nor a
+            Last-Modified header.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            return None
+        return cls(
+            etag=etag,
+            last_modified=last_modified,
+            content_type=headers.get("content-type", ""),
+            body=body,
+        )
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build the headers that ask the server to confirm this entry is current."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def revalidated(self) -> CacheEntry:
+        """Return a copy of the entry marked as just confirmed by the server."""
+        return self.model_copy(update={"stored_at": time.time()})
+
+    def parse(self) -> Any:
+        """Parse the body the same way Datawrapper.get parses a response."""
+        if "json" in self.content_type:
+            return json.loads(self.body)
+        if "text/csv" in self.content_type:
+            return read_csv_data(self.body)
+        return self.body
+
+
+def cache_key(access_token: str | None, url: str, params: dict | None) -> str:
+    """Build the cache key for a GET request.
+
+    The access token is part of the key, so clients with different tokens never
+    read each other's responses from a shared cache.
+
+    Args:
+        access_token: The client's access token.
+        url: The requested URL.
+        params: The query parameters.
+
+    Returns:
+        A hex digest identifying the request.
+    """
+    payload = json.dumps(
+        [access_token or "", url, params or {}], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheBackend(ABC):
+    """Storage for cached responses, evicting expired entries."""
+
+    def __init__(self, ttl: float | None = None):
+        """Initialize the backend.
+
+        Args:
+            ttl: Seconds an entry is kept after it was stored or last revalidated.
+                By default None, which keeps entries until they are evicted.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        self.ttl = ttl
+
+    def _expired(self, entry: CacheEntry) -> bool:
+        """Whether an entry has outlived the TTL."""
+        return self.ttl is not None and time.time() - entry.stored_at > self.ttl
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for a key, or None if it is missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, evicting the least recently used entries if needed."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry for a key, if there is one."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+
+class MemoryCache(CacheBackend):
+    """A thread-safe in-memory cache that holds up to ``max_entries`` responses.
+
+    Example:
+        >>> from datawrapper import Datawrapper, MemoryCache
+        >>> dw = Datawrapper(http_cache=MemoryCache(max_entries=1000, ttl=3600))
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float | None = None):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses kept, by default 256.
+            ttl: Seconds an entry is kept after it was stored or last
+                revalidated. By default None, which never expires entries.
+        """
+        super().__init__(ttl)
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._expired(entry):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCache(CacheBackend):
+    """A cache that stores responses as files, shared between processes.
+
+    Each entry is one file holding a JSON header line followed by the body.
+    Reading an entry marks it as recently used, and the least recently used
+    entries are removed once the directory grows beyond ``max_size`` bytes.
+
+    Example:
+        >>> from datawrapper import Datawrapper, DiskCache
+        >>> dw = Datawrapper(http_cache=DiskCache("~/.cache/datawrapper/http"))
+    """
+
+    _SUFFIX = ".entry"
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_size: int = 256 * 1024 * 1024,
+        ttl: float | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory to store entries in. Created if it doesn't exist.
+            max_size: Maximum total size of the entries in bytes, by default 256 MiB.
+            ttl: Seconds an entry is kept after it was stored or last
+                revalidated. By default None, which never expires entries.
+        """
+        super().__init__(ttl)
+        if max_size < 0:
+            raise ValueError(f"max_size must not be negative, got {max_size}")
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        """Return where the entry for a key is stored."""
+        return self.directory / f"{key}{self._SUFFIX}"
+
+    def get(self, key: str) -> CacheEntry | None:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                header = json.loads(file.readline())
+                entry = CacheEntry(**header, body=file.read())
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError):
+            # Drop entries that are corrupt or from an incompatible version
+            path.unlink(missing_ok=True)
+            return None
+        if self._expired(entry):
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        header = entry.model_dump(exclude={"body"})
+        sink = DownloadSink(self._path(key))
+        try:
+            sink.write(json.dumps(header).encode("utf-8") + b"\n")
+            sink.write(entry.body)
+        except BaseException:
+            sink.abort()
+            raise
+        sink.commit()
+        self._trim(keep=self._path(key))
+
+    def _trim(self, keep: Path) -> None:
+        """Evict the least recently used entries until the cache fits in max_size."""
+        with self._lock:
+            entries = []
+            for path in self.directory.glob(f"*{self._SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_size:
+                    break
+                if path == keep:
+                    continue
+                path.unlink(missing_ok=True)
+                total -= size
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self.directory.glob(f"*{self._SUFFIX}"):
+                path.unlink(missing_ok=True)
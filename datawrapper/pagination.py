@@ -0,0 +1,267 @@
+"""Iterate over offset-paginated Datawrapper API endpoints one item at a time."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Any
+
+#: Default number of items requested per page
+DEFAULT_PAGE_SIZE = 100
+
+#: Largest number of items the API returns on one page
+MAX_PAGE_SIZE = 100
+
+
+def page_items(page: Any) -> list[Any]:
+    """Return the items on a page returned by the API.
+
+    Args:
+        page: A response with a "list" of items, or a list of items.
+
+    Returns:
+        The items on the page.
+
+    Raises:
+        ValueError: If the page doesn't contain a list of items.
+    """
+    if isinstance(page, list):
+        return page
+    if isinstance(page, dict) and isinstance(page.get("list"), list):
+        return page["list"]
+    raise ValueError(f"Unexpected page from API: {type(page)}")
+
+
+def page_total(page: Any) -> int | None:
+    """Return the total number of items reported on a page, if there is one."""
+    if isinstance(page, dict) and isinstance(page.get("total"), int):
+        return page["total"]
+    return None
+
+
+def _is_last_page(
+    items: list[Any], next_offset: int, page_size: int, total: int | None
+) -> bool:
+    """Whether a page is the last one, judging by the reported total or its size.
+
+    A reported total is trusted over the size of the page, since the server may
+    return fewer items than were asked for without being at the end.
+    """
+    if total is not None:
+        return not items or next_offset >= total
+    return len(items) < page_size
+
+
+def _stride(first_page: Any, page_size: int) -> int:
+    """Return how many items each page holds, judging by the first page.
+
+    The server may return fewer items than were asked for, so planning the
+    other pages by page_size would skip the items in between.
+    """
+    return min(len(page_items(first_page)), page_size) or page_size
+
+
+def _validate(page_size: int, offset: int, max_workers: int) -> None:
+    """Reject page sizes, offsets and worker counts that can't be served."""
+    if page_size < 1:
+        raise ValueError(f"page_size must be at least 1, got {page_size}")
+    if page_size > MAX_PAGE_SIZE:
+        raise ValueError(f"page_size must be at most {MAX_PAGE_SIZE}, got {page_size}")
+    if offset < 0:
+        raise ValueError(f"offset must not be negative, got {offset}")
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+
+def _sequential(
+    fetch_page: Callable[[int, int], Any],
+    page_size: int,
+    offset: int,
+    prefetch: bool,
+    page: Any = None,
+) -> Iterator[Any]:
+    """Yield the items of one page after another, starting from an optional first page."""
+    executor = (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="datawrapper-page")
+        if prefetch
+        else None
+    )
+    pending: Future | None = None
+    try:
+        if page is None:
+            page = fetch_page(page_size, offset)
+        while True:
+            items = page_items(page)
+            offset += len(items)
+            if _is_last_page(items, offset, page_size, page_total(page)):
+                yield from items
+                return
+            if executor is not None:
+                pending = executor.submit(fetch_page, page_size, offset)
+            yield from items
+            if pending is not None:
+                page, pending = pending.result(), None
+            else:
+                page = fetch_page(page_size, offset)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _fan_out(
+    fetch_page: Callable[[int, int], Any],
+    page_size: int,
+    offset: int,
+    prefetch: bool,
+    max_workers: int,
+) -> Iterator[Any]:
+    """Read the total from the first page, then fetch the other pages concurrently."""
+    page = fetch_page(page_size, offset)
+    total = page_total(page)
+    if total is None:
+        # Without a total there is nothing to plan, so continue page by page
+        yield from _sequential(fetch_page, page_size, offset, prefetch, page)
+        return
+
+    stride = _stride(page, page_size)
+    offsets = iter(range(offset + stride, total, stride))
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="datawrapper-page"
+    )
+    try:
+        # Keep max_workers requests in flight and hand out pages in order
+        window = deque(
+            executor.submit(fetch_page, stride, next_offset)
+            for next_offset in islice(offsets, max_workers)
+        )
+        yield from page_items(page)
+        while window:
+            page = window.popleft().result()
+            for next_offset in islice(offsets, 1):
+                window.append(executor.submit(fetch_page, stride, next_offset))
+            yield from page_items(page)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_items(
+    fetch_page: Callable[[int, int], Any],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+    prefetch: bool = False,
+    max_workers: int = 1,
+) -> Iterator[Any]:
+    """Yield every item of an offset-paginated endpoint, fetching pages on demand.
+
+    Args:
+        fetch_page: Fetches the page with the given limit and offset.
+        page_size: Number of items requested per page, at most 100.
+        offset: Number of items to skip before the first page.
+        prefetch: Fetch the next page in a background thread while the items of
+            the current page are consumed.
+        max_workers: Number of pages fetched concurrently. Above 1, the total
+            reported on the first page is used to request the remaining pages in
+            parallel. The items are still yielded in order, and endpoints that
+            don't report a total are read one page at a time.
+
+    Returns:
+        An iterator over the items. Only one page is held in memory at a time,
+        or two while prefetching, or up to max_workers + 1 while fanning out.
+
+    Raises:
+        ValueError: If page_size is below 1 or above the API's maximum of 100,
+            offset is negative or max_workers is below 1.
+    """
+    _validate(page_size, offset, max_workers)
+    if max_workers > 1:
+        return _fan_out(fetch_page, page_size, offset, prefetch, max_workers)
+    return _sequential(fetch_page, page_size, offset, prefetch)
+
+
+async def _asequential(
+    fetch_page: Callable[[int, int], Awaitable[Any]],
+    page_size: int,
+    offset: int,
+    prefetch: bool,
+    page: Any = None,
+) -> AsyncIterator[Any]:
+    """Yield the items of one page after another without blocking."""
+    pending: asyncio.Future | None = None
+    try:
+        if page is None:
+            page = await fetch_page(page_size, offset)
+        while True:
+            items = page_items(page)
+            offset += len(items)
+            if _is_last_page(items, offset, page_size, page_total(page)):
+                for item in items:
+                    yield item
+                return
+            if prefetch:
+                pending = asyncio.ensure_future(fetch_page(page_size, offset))
+            for item in items:
+                yield item
+            if pending is not None:
+                page, pending = await pending, None
+            else:
+                page = await fetch_page(page_size, offset)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def _afan_out(
+    fetch_page: Callable[[int, int], Awaitable[Any]],
+    page_size: int,
+    offset: int,
+    prefetch: bool,
+    max_workers: int,
+) -> AsyncIterator[Any]:
+    """Read the total from the first page, then fetch the other pages as tasks."""
+    page = await fetch_page(page_size, offset)
+    total = page_total(page)
+    if total is None:
+        async for item in _asequential(fetch_page, page_size, offset, prefetch, page):
+            yield item
+        return
+
+    stride = _stride(page, page_size)
+    offsets = iter(range(offset + stride, total, stride))
+    window: deque[asyncio.Future] = deque()
+    try:
+        window.extend(
+            asyncio.ensure_future(fetch_page(stride, next_offset))
+            for next_offset in islice(offsets, max_workers)
+        )
+        for item in page_items(page):
+            yield item
+        while window:
+            page = await window.popleft()
+            for next_offset in islice(offsets, 1):
+                window.append(asyncio.ensure_future(fetch_page(stride, next_offset)))
+            for item in page_items(page):
+                yield item
+    finally:
+        for task in window:
+            task.cancel()
+
+
+def aiter_items(
+    fetch_page: Callable[[int, int], Awaitable[Any]],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+    prefetch: bool = False,
+    max_workers: int = 1,
+) -> AsyncIterator[Any]:
+    """Yield every item of an offset-paginated endpoint without blocking.
+
+    See iter_items(). Prefetched and fanned-out requests run as tasks on the
+    event loop instead of in threads.
+    """
+    _validate(page_size, offset, max_workers)
+    if max_workers > 1:
+        return _afan_out(fetch_page, page_size, offset, prefetch, max_workers)
+    return _asequential(fetch_page, page_size, offset, prefetch)
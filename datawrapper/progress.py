@@ -0,0 +1,209 @@
+"""Live progress and request statistics for bulk operations."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    ProgressColumn,
+    SpinnerColumn,
+    Task,
+    TextColumn,
+    TimeRemainingColumn,
+)
+from rich.text import Text
+
+if TYPE_CHECKING:
+    from datawrapper.__main__ import BaseDatawrapper
+
+T = TypeVar("T")
+
+#: Status code of a rate-limited response
+TOO_MANY_REQUESTS = 429
+
+
+class RequestStats:
+    """Thread-safe counters for the requests sent by a client.
+
+    Latency percentiles are computed over the most recent ``window`` requests,
+    so they follow the current state of a long run rather than its average.
+    """
+
+    def __init__(self, window: int = 1000):
+        """Initialize the counters.
+
+        Args:
+            window: Number of recent requests the latency percentiles cover.
+        """
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+        self.requests = 0
+        self.failures = 0
+        self.throttled = 0
+        self.bytes = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, status_code: int | None, size: int = 0) -> None:
+        """Count a finished request.
+
+        Args:
+            latency: Seconds until the response arrived.
+            status_code: The response status, or None if the connection failed.
+            size: Number of body bytes received.
+        """
+        with self._lock:
+            self.requests += 1
+            self.bytes += size
+            self._latencies.append(latency)
+            if status_code == TOO_MANY_REQUESTS:
+                self.throttled += 1
+            elif status_code is None or status_code >= 400:
+                self.failures += 1
+
+    def add_bytes(self, size: int) -> None:
+        """Count body bytes read after the request was recorded, such as a stream."""
+        with self._lock:
+            self.bytes += size
+
+    @property
+    def rate(self) -> float:
+        """Requests per second since the counters were created."""
+        elapsed = time.monotonic() - self._started
+        return self.requests / elapsed if elapsed > 0 else 0.0
+
+    def percentile(self, q: float) -> float | None:
+        """Return a latency percentile in seconds, or None before the first request.
+
+        Args:
+            q: The percentile, between 0 and 100.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if not latencies:
+            return None
+        rank = max(math.ceil(q / 100 * len(latencies)), 1)
+        return latencies[rank - 1]
+
+    def summary(self) -> str:
+        """Describe the counters in one line, as shown by BulkProgress."""
+        parts = [f"{self.rate:.1f} req/s"]
+        for q in (50, 95):
+            latency = self.percentile(q)
+            if latency is not None:
+                parts.append(f"p{q} {latency * 1000:.0f} ms")
+        parts.append(_format_bytes(self.bytes))
+        parts.append(f"{self.throttled}×429")
+        if self.failures:
+            parts.append(f"{self.failures} failed")
+        return " · ".join(parts)
+
+
+def _format_bytes(size: float) -> str:
+    """Format a number of bytes with a binary unit, such as "4.2 MiB"."""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"  # pragma: no cover
+
+
+class _StatsColumn(ProgressColumn):
+    """A progress column that redraws the request statistics on every refresh."""
+
+    def __init__(self, stats: RequestStats):
+        super().__init__()
+        self.stats = stats
+
+    def render(self, task: Task) -> Text:
+        return Text(self.stats.summary(), style="progress.data.speed")
+
+
+class BulkProgress:
+    """A live progress bar with the request rate, latency and throttling of a client.
+
+    While the display is open, every request the client sends is counted,
+    including retries, so a run that is throttled shows a growing 429 count and
+    a run that is stuck shows no requests at all.
+
+    Example:
+        >>> from datawrapper import BulkProgress, Datawrapper
+        >>> dw = Datawrapper()
+        >>> with BulkProgress(dw, "Charts") as progress:
+        ...     for chart in progress.track(dw.iter_charts()):
+        ...         ...
+    """
+
+    def __init__(
+        self,
+        client: BaseDatawrapper,
+        description: str = "Working",
+        total: int | None = None,
+        console: Console | None = None,
+        transient: bool = False,
+    ):
+        """Initialize the display.
+
+        Args:
+            client: The client whose requests are counted.
+            description: Text shown in front of the progress bar.
+            total: Number of items expected, or None if unknown.
+            console: Optional rich console to draw on.
+            transient: Remove the display once it is closed.
+        """
+        self.client = client
+        self.description = description
+        self.total = total
+        self.stats = RequestStats()
+        self._progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeRemainingColumn(),
+            _StatsColumn(self.stats),
+            console=console,
+            transient=transient,
+        )
+        self._task = self._progress.add_task(description, total=total)
+        self._previous: RequestStats | None = None
+
+    def __enter__(self) -> BulkProgress:
+        self._previous = self.client._stats
+        self.client._stats = self.stats
+        self._progress.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._progress.stop()
+        self.client._stats = self._previous
+
+    def advance(self, count: int = 1) -> None:
+        """Mark items as done."""
+        self._progress.advance(self._task, count)
+
+    def update(self, total: int | None = None, description: str | None = None) -> None:
+        """Change the expected total or the description."""
+        self._progress.update(self._task, total=total, description=description)
+
+    def track(self, items: Iterable[T]) -> Iterator[T]:
+        """Yield items and mark each as done once the next one is requested."""
+        for item in items:
+            yield item
+            self.advance()
+
+    async def atrack(self, items: AsyncIterable[T]) -> AsyncIterator[T]:
+        """Yield items from an async iterator, such as an AsyncDatawrapper iter_*."""
+        async for item in items:
+            yield item
+            self.advance()
@@ -0,0 +1,160 @@
+"""Client-side rate limiting for requests to the Datawrapper API."""
+
+from __future__ import annotations
+
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """A thread-safe token bucket that paces callers to a steady request rate.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``. Each
+    call to :meth:`acquire` takes tokens, reserving them ahead of time when the
+    bucket is empty, so concurrent callers are served in the order they asked
+    and the long-run rate never exceeds the budget.
+
+    Example:
+        >>> bucket = TokenBucket(rate=5)  # five requests per second
+        >>> bucket.acquire()
+        0.0
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of tokens the bucket holds, which is the
+                largest burst allowed. Defaults to one second's worth of tokens.
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, rate)
+        if self.capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens from the bucket without waiting for them.
+
+        Args:
+            tokens: Number of tokens to take, by default 1.
+
+        Returns:
+            How many seconds the caller must wait before the tokens are its own.
+        """
+        if tokens > self.capacity:
+            raise ValueError(
+                f"Cannot acquire {tokens} tokens from a bucket with capacity {self.capacity}"
+            )
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            deficit = -self._tokens
+        return deficit / self.rate if deficit > 0 else 0.0
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until the requested tokens are available.
+
+        Args:
+            tokens: Number of tokens to take, by default 1.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        wait = self.reserve(tokens)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """Paces requests with a global budget plus optional per-endpoint budgets.
+
+    Endpoint budgets are keyed by a URL path fragment, such as ``"/export/"`` or
+    ``"/publish"``. A request whose path contains the fragment draws from that
+    endpoint's bucket as well as the global one. One limiter can be shared by
+    several clients and threads to enforce a budget across all of them.
+
+    Example:
+        >>> from datawrapper import Datawrapper, RateLimiter
+        >>> limiter = RateLimiter(rate=10, endpoints={"/export/": 1, "/publish": 2})
+        >>> dw = Datawrapper(rate_limit=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float | TokenBucket | None = None,
+        endpoints: dict[str, float | TokenBucket] | None = None,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            rate: Requests per second allowed across all endpoints, or a bucket to
+                draw from. None leaves requests outside ``endpoints`` unpaced.
+            endpoints: Extra budgets for expensive endpoints, keyed by a path
+                fragment and given as requests per second or as a bucket.
+        """
+        self.bucket = self._as_bucket(rate) if rate is not None else None
+        self.endpoints = {
+            fragment: self._as_bucket(budget)
+            for fragment, budget in (endpoints or {}).items()
+        }
+
+    @staticmethod
+    def _as_bucket(budget: float | TokenBucket) -> TokenBucket:
+        """Wrap a requests-per-second figure in a bucket."""
+        if isinstance(budget, TokenBucket):
+            return budget
+        return TokenBucket(rate=budget)
+
+    def buckets_for(self, url: str) -> list[TokenBucket]:
+        """List the buckets a request to the given URL must draw from.
+
+        Args:
+            url: The URL being requested.
+
+        Returns:
+            The matching endpoint buckets followed by the global bucket.
+        """
+        path = urlparse(url).path
+        buckets = [
+            bucket for fragment, bucket in self.endpoints.items() if fragment in path
+        ]
+        if self.bucket is not None:
+            buckets.append(self.bucket)
+        return buckets
+
+    def reserve(self, url: str) -> float:
+        """Take a token from every budget a request to the URL draws from.
+
+        Args:
+            url: The URL being requested.
+
+        Returns:
+            How many seconds the caller must wait before sending the request.
+        """
+        return max((bucket.reserve() for bucket in self.buckets_for(url)), default=0.0)
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to the given URL fits within every budget.
+
+        Args:
+            url: The URL being requested.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        wait = self.reserve(url)
+        if wait:
+            time.sleep(wait)
+        return wait
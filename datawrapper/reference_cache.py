@@ -0,0 +1,113 @@
+"""A time-based cache for reference data that rarely changes, such as themes and folders."""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections.abc import Hashable
+from typing import Any
+
+#: Seconds each kind of reference data is cached for by default
+DEFAULT_TTLS: dict[str, float] = {
+    "themes": 3600,
+    "basemaps": 86400,
+    "folders": 300,
+    "token_scopes": 3600,
+    "account": 300,
+}
+
+
+class ReferenceCache:
+    """A thread-safe cache of reference data that expires after a per-category TTL.
+
+    Each client method that reads reference data belongs to a category:
+    ``"themes"``, ``"basemaps"``, ``"folders"``, ``"token_scopes"`` or
+    ``"account"``. Cached values are copied on the way in and out, so changing a
+    returned dictionary never changes what later calls see.
+
+    Example:
+        >>> from datawrapper import Datawrapper, ReferenceCache
+        >>> dw = Datawrapper(reference_cache=ReferenceCache(ttl={"folders": 60}))
+        >>> dw.get_themes()  # fetched
+        >>> dw.get_themes()  # served from the cache for the next hour
+    """
+
+    def __init__(self, ttl: float | dict[str, float] | None = None):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds to cache every category for, or a mapping of categories to
+                seconds that overrides the defaults in DEFAULT_TTLS. A TTL of 0
+                turns caching off for that category.
+        """
+        if isinstance(ttl, dict):
+            unknown = set(ttl) - set(DEFAULT_TTLS)
+            if unknown:
+                raise ValueError(
+                    f"Unknown reference categories: {', '.join(sorted(unknown))}. "
+                    f"Must be one of: {', '.join(DEFAULT_TTLS)}"
+                )
+            self.ttls = {**DEFAULT_TTLS, **ttl}
+        elif ttl is not None:
+            self.ttls = dict.fromkeys(DEFAULT_TTLS, float(ttl))
+        else:
+            self.ttls = dict(DEFAULT_TTLS)
+        for category, seconds in self.ttls.items():
+            if seconds < 0:
+                raise ValueError(
+                    f"ttl for {category} must not be negative, got {seconds}"
+                )
+
+        self._entries: dict[tuple[str, Hashable], tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, category: str, key: Hashable = None) -> tuple[bool, Any]:
+        """Look up a cached value.
+
+        Args:
+            category: The kind of reference data.
+            key: Identifies the call within the category, such as its arguments.
+
+        Returns:
+            Whether the value was cached and still fresh, and a copy of the value.
+        """
+        with self._lock:
+            entry = self._entries.get((category, key))
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[(category, key)]
+                return False, None
+        return True, copy.deepcopy(value)
+
+    def store(self, category: str, key: Hashable, value: Any) -> None:
+        """Cache a value for its category's TTL.
+
+        Args:
+            category: The kind of reference data.
+            key: Identifies the call within the category, such as its arguments.
+            value: The value returned by the API.
+        """
+        ttl = self.ttls[category]
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[(category, key)] = (
+                time.monotonic() + ttl,
+                copy.deepcopy(value),
+            )
+
+    def invalidate(self, *categories: str) -> None:
+        """Drop cached values.
+
+        Args:
+            categories: The categories to drop. Drops everything if none are given.
+        """
+        with self._lock:
+            if not categories:
+                self._entries.clear()
+                return
+            for entry_key in [k for k in self._entries if k[0] in categories]:
+                del self._entries[entry_key]
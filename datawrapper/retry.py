@@ -0,0 +1,181 @@
+"""Retry policy for rate-limited and transiently failing Datawrapper API requests."""
+
+from __future__ import annotations
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+def parse_retry_after(headers: Any) -> float | None:
+    """Read how long the server asked us to wait from a response's headers.
+
+    ``Retry-After`` may hold a number of seconds or an HTTP date. When it is
+    missing, an exhausted ``X-RateLimit-Remaining`` budget combined with
+    ``X-RateLimit-Reset`` (an epoch timestamp or a number of seconds) is used.
+
+    Args:
+        headers: The response headers.
+
+    Returns:
+        The number of seconds to wait, or None if the headers don't say.
+    """
+    try:
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                moment = parsedate_to_datetime(retry_after)
+                return max(0.0, moment.timestamp() - time.time())
+
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is not None and reset is not None and int(remaining) <= 0:
+            reset_value = float(reset)
+            # Values this large are epoch timestamps rather than durations
+            if reset_value > 1_000_000_000:
+                return max(0.0, reset_value - time.time())
+            return max(0.0, reset_value)
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return None
+
+
+class RetryPolicy(BaseModel):
+    """How a Datawrapper client retries rate-limited and transiently failing requests.
+
+    Rate-limited (429) requests are always safe to retry because the server
+    rejected them outright. Server errors and connection failures are only
+    retried for the methods in ``retry_methods`` so that a POST which may have
+    already created a chart is not sent twice.
+
+    Example:
+        >>> from datawrapper import Datawrapper, RetryPolicy
+        >>> dw = Datawrapper(retry=RetryPolicy(max_retries=5, backoff_factor=1.0))
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    #: Maximum number of times a single request is retried
+    max_retries: int = Field(
+        default=3,
+        ge=0,
+        description="Maximum number of times a single request is retried",
+    )
+
+    #: Base delay in seconds, doubled for every further attempt
+    backoff_factor: float = Field(
+        default=0.5,
+        ge=0,
+        description="Base delay in seconds, doubled for every further attempt",
+    )
+
+    #: Upper bound in seconds for a single backoff delay
+    backoff_max: float = Field(
+        default=60.0,
+        ge=0,
+        description="Upper bound in seconds for a single backoff delay",
+    )
+
+    #: Fraction of each backoff delay that is randomized to spread out retries
+    jitter: float = Field(
+        default=0.5,
+        ge=0,
+        le=1,
+        description="Fraction of each backoff delay that is randomized to spread out retries",
+    )
+
+    #: HTTP status codes that trigger a retry
+    retry_statuses: frozenset[int] = Field(
+        default=frozenset({429, 500, 502, 503, 504}),
+        description="HTTP status codes that trigger a retry",
+    )
+
+    #: HTTP methods retried after server errors and connection failures
+    retry_methods: frozenset[str] = Field(
+        default=frozenset({"GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"}),
+        description="HTTP methods retried after server errors and connection failures",
+    )
+
+    #: Whether connection errors and timeouts are retried
+    retry_connection_errors: bool = Field(
+        default=True,
+        description="Whether connection errors and timeouts are retried",
+    )
+
+    #: Whether to wait as long as the Retry-After and X-RateLimit-* headers ask
+    respect_retry_after: bool = Field(
+        default=True,
+        description="Whether to wait as long as the Retry-After and X-RateLimit-* headers ask",
+    )
+
+    #: Longest server-requested wait in seconds that will be honored
+    max_retry_after: float = Field(
+        default=300.0,
+        ge=0,
+        description="Longest server-requested wait in seconds that will be honored",
+    )
+
+    def should_retry_status(self, method: str, status_code: int, attempt: int) -> bool:
+        """Decide whether a response with the given status should be retried.
+
+        Args:
+            method: The HTTP method of the request.
+            status_code: The response status code.
+            attempt: How many retries have already been made.
+
+        Returns:
+            True if the request should be sent again.
+        """
+        if attempt >= self.max_retries or status_code not in self.retry_statuses:
+            return False
+        return status_code == 429 or method.upper() in self.retry_methods
+
+    def should_retry_error(self, method: str, attempt: int) -> bool:
+        """Decide whether a request that raised a connection error should be retried.
+
+        Args:
+            method: The HTTP method of the request.
+            attempt: How many retries have already been made.
+
+        Returns:
+            True if the request should be sent again.
+        """
+        return (
+            self.retry_connection_errors
+            and attempt < self.max_retries
+            and method.upper() in self.retry_methods
+        )
+
+    def get_backoff(self, attempt: int) -> float:
+        """Compute the exponential backoff delay for a retry attempt.
+
+        Args:
+            attempt: How many retries have already been made.
+
+        Returns:
+            The number of seconds to wait, with jitter applied.
+        """
+        delay = min(self.backoff_max, self.backoff_factor * (2**attempt))
+        return delay * (1 - self.jitter * random.random())
+
+    def get_delay(self, attempt: int, headers: Any = None) -> float:
+        """Compute how long to wait before the next attempt.
+
+        Args:
+            attempt: How many retries have already been made.
+            headers: The headers of the failed response, if there was one.
+
+        Returns:
+            The server-requested wait when there is one and it is honored,
+            otherwise the exponential backoff delay.
+        """
+        if self.respect_retry_after and headers is not None:
+            retry_after = parse_retry_after(headers)
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        return self.get_backoff(attempt)
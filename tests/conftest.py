@@ -9,6 +9,7 @@ from unittest.mock import Mock
 
 import pandas as pd
 import pytest
+import requests
 from faker import Faker
 from pydantic import BaseModel
 
@@ -16,6 +17,7 @@ from pydantic import BaseModel
 from datawrapper import (
     BarChart,
     BaseChart,
+    Datawrapper,
     RangeAnnotation,
     TextAnnotation,
 )
@@ -188,6 +190,66 @@ class MockAPIResponseFactory:
         }
 
 
+class MockHTTPFactory:
+    """Factory for mock HTTP responses and clients that send requests through them."""
+
+    @staticmethod
+    def response(
+        status_code: int = 200,
+        payload: Any = None,
+        headers: dict[str, str] | None = None,
+        content_type: str = "application/json",
+        chunks: list[bytes] | None = None,
+        content: bytes | None = None,
+    ) -> Mock:
+        """Mock a requests response.
+
+        Args:
+            status_code: The response status.
+            payload: The JSON body, by default an empty object.
+            headers: Extra response headers.
+            content_type: The content-type header.
+            chunks: The body of a streamed response, in chunks.
+            content: A raw body to send instead of the JSON payload.
+        """
+        payload = {} if payload is None else payload
+        response = Mock()
+        response.ok = status_code < 400
+        response.status_code = status_code
+        response.headers = {"content-type": content_type, **(headers or {})}
+        if content is None:
+            response.text = json.dumps(payload)
+            response.content = response.text.encode()
+            response.json.return_value = payload
+        else:
+            response.text = content.decode()
+            response.content = content
+            response.json.side_effect = lambda: json.loads(content)
+        if chunks is not None:
+            response.iter_content.return_value = iter(chunks)
+        return response
+
+    @staticmethod
+    def session(*responses: Mock | Exception) -> Mock:
+        """Mock a requests session that answers with the given responses in turn.
+
+        A single response answers every request.
+        """
+        session = Mock(spec=requests.Session)
+        if len(responses) == 1 and not isinstance(responses[0], Exception):
+            session.request.return_value = responses[0]
+        elif responses:
+            session.request.side_effect = list(responses)
+        return session
+
+    @staticmethod
+    def client(session: Mock | None = None, **kwargs: Any) -> Datawrapper:
+        """Build a client that sends its requests through a mock session."""
+        if session is None:
+            session = MockHTTPFactory.session(MockHTTPFactory.response())
+        return Datawrapper(access_token="token", session=session, **kwargs)
+
+
 # ============================================================================
 # Fixtures
 # ============================================================================
@@ -256,6 +318,12 @@ def mock_api_responses():
     return MockAPIResponseFactory
 
 
+@pytest.fixture
+def mock_http():
+    """Provide the mock HTTP response, session and client factory."""
+    return MockHTTPFactory
+
+
 @pytest.fixture
 def temp_config_file():
     """Provide a temporary configuration file."""
@@ -7,6 +7,7 @@ from unittest.mock import Mock, patch
 import pandas as pd
 
 from datawrapper import BarChart
+from datawrapper.data_io import CSVStream
 
 
 def test_create_sample_bar_chart_mock():
@@ -106,9 +107,9 @@ def test_create_sample_bar_chart_mock():
         assert call_kwargs["chart_type"] == chart.chart_type
         assert "metadata" in call_kwargs
 
-        # Check that CSV data was provided
-        csv_data = call_kwargs["data"]
-        assert csv_data is not None
+        # Check that the data was provided, and streams as the expected CSV
+        assert call_kwargs["data"] is not None
+        csv_data = b"".join(CSVStream(call_kwargs["data"])).decode("utf-8")
         assert "Country,Turnout" in csv_data  # CSV header
         assert "Romania (2020),33.2" in csv_data  # Sample data row
 
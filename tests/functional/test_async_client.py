@@ -0,0 +1,217 @@
+"""Tests for the asyncio Datawrapper client."""
+
+import asyncio
+import inspect
+import json
+
+import pandas as pd
+import pytest
+
+from datawrapper import AsyncDatawrapper, Datawrapper, RetryPolicy
+from datawrapper.__main__ import BaseDatawrapper
+from datawrapper.exceptions import FailedRequestError, RateLimitError
+
+httpx = pytest.importorskip("httpx")
+
+
+def _client(handler, **kwargs):
+    """Build an async client whose requests are answered by the handler."""
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncDatawrapper(access_token="token", client=http_client, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_get_parses_json_and_csv():
+    """GET responses are parsed by content type, like the blocking client."""
+
+    def handler(request):
+        assert request.headers["Authorization"] == "Bearer token"
+        if request.url.path.endswith("/data"):
+            return httpx.Response(
+                200, content=b"a,b\n1,2\n", headers={"content-type": "text/csv"}
+            )
+        return httpx.Response(200, json={"id": "abc123", "type": "d3-bars"})
+
+    dw = _client(handler)
+
+    chart, data = await asyncio.gather(
+        dw.get(f"{dw._CHARTS_URL}/abc123"), dw.get_data("abc123")
+    )
+
+    assert chart == {"id": "abc123", "type": "d3-bars"}
+    assert isinstance(data, pd.DataFrame)
+    assert list(data.columns) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_inherited_methods_are_awaitable():
+    """Methods that only wrap a single request become coroutines."""
+    seen = []
+
+    def handler(request):
+        seen.append((request.method, request.url.path, dict(request.url.params)))
+        return httpx.Response(200, json={"list": [], "total": 0})
+
+    dw = _client(handler)
+
+    result = dw.get_users(search="ana", limit=10)
+    assert inspect.isawaitable(result)
+    assert await result == {"list": [], "total": 0}
+    assert seen == [
+        (
+            "GET",
+            "/v3/users",
+            {"search": "ana", "order": "ASC", "orderBy": "id", "limit": "10"},
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bool_params_encoded_like_requests():
+    """Boolean query parameters match what the blocking client sends."""
+    seen = []
+
+    def handler(request):
+        seen.append(dict(request.url.params))
+        return httpx.Response(200, json={})
+
+    await _client(handler).get_basemap("world", wgs84=True)
+
+    assert seen == [{"wgs84": "True"}]
+
+
+@pytest.mark.asyncio
+async def test_post_body_and_composite_method():
+    """create_folder sends a JSON body and returns the parsed response."""
+
+    def handler(request):
+        assert request.method == "POST"
+        assert json.loads(request.content) == {"name": "Reports", "parentId": 4}
+        return httpx.Response(201, json={"id": 9, "name": "Reports"})
+
+    folder = await _client(handler).create_folder("Reports", parent_id=4)
+
+    assert folder == {"id": 9, "name": "Reports"}
+
+
+@pytest.mark.asyncio
+async def test_create_chart_uploads_data():
+    """create_chart awaits both the chart creation and the data upload."""
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, request.url.path, request.content))
+        if request.method == "POST":
+            return httpx.Response(201, json={"id": "new123"})
+        return httpx.Response(204)
+
+    dw = _client(handler)
+    with pytest.warns(DeprecationWarning):
+        chart = await dw.create_chart(
+            title="Test", chart_type="d3-bars", data=pd.DataFrame({"a": [1]})
+        )
+
+    assert chart == {"id": "new123"}
+    assert calls[1] == ("PUT", "/v3/charts/new123/data", b"a\n1\n")
+
+
+@pytest.mark.asyncio
+async def test_errors_raise_library_exceptions():
+    """Failed responses raise the same exceptions as the blocking client."""
+
+    def handler(request):
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404, content=b"Not Found")
+        return httpx.Response(429, json={"message": "Slow down"})
+
+    dw = _client(handler)
+
+    with pytest.raises(FailedRequestError, match="404"):
+        await dw.get(f"{dw._CHARTS_URL}/missing")
+    with pytest.raises(RateLimitError):
+        await dw.delete(f"{dw._CHARTS_URL}/abc123")
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_applies(monkeypatch):
+    """Rate-limited requests are retried without blocking the loop."""
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "1"}),
+            httpx.Response(200, json={"ok": True}),
+        ]
+    )
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("datawrapper.async_client.asyncio.sleep", fake_sleep)
+    dw = _client(lambda request: next(responses), retry=RetryPolicy())
+
+    assert await dw.get_my_account() == {"ok": True}
+    assert sleeps == [1.0]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    """No more than max_concurrency requests are in flight at once."""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    dw = _client(handler, max_concurrency=3)
+
+    await asyncio.gather(*(dw.get_chart_display_urls(str(n)) for n in range(10)))
+
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_context_manager_closes_owned_pool():
+    """Exiting the context closes a pool the client created."""
+    async with AsyncDatawrapper(access_token="token", max_connections=5) as dw:
+        assert not dw.client.is_closed
+    assert dw.client.is_closed
+
+
+def test_every_public_method_is_available():
+    """The async client exposes the full blocking API surface."""
+    public = {name for name in dir(Datawrapper) if not name.startswith("_")}
+    # The requests session belongs to the blocking client only
+    public -= {"close", "create_session", "session"}
+    assert public <= set(dir(AsyncDatawrapper))
+
+
+@pytest.mark.asyncio
+async def test_async_client_is_not_a_blocking_client():
+    """The async client shares settings with Datawrapper without being one."""
+    async with AsyncDatawrapper(access_token="token") as dw:
+        assert not isinstance(dw, Datawrapper)
+        assert isinstance(dw, BaseDatawrapper)
+        assert not hasattr(dw, "_session")
+
+
+@pytest.mark.asyncio
+async def test_upload_data_streams_dataframe():
+    """DataFrames are streamed to the API in chunks, and retried in full."""
+    bodies = []
+
+    async def handler(request):
+        bodies.append(await request.aread())
+        return httpx.Response(503 if len(bodies) == 1 else 204)
+
+    dw = _client(handler, retry=RetryPolicy(max_retries=1, backoff_factor=0))
+    df = pd.DataFrame({"a": range(10), "b": ["x"] * 10})
+
+    assert await dw.upload_data("abc123", df, chunk_rows=3) is True
+
+    expected = df.to_csv(index=False).encode("utf-8")
+    assert bodies == [expected, expected]
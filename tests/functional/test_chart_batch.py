@@ -0,0 +1,240 @@
+"""Tests for creating, updating and publishing many charts at once."""
+
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from datawrapper import AsyncDatawrapper, BarChart, ChartBatch, Datawrapper
+from datawrapper.bulk import ExceptionGroup
+
+
+def _charts():
+    """Build one new chart and one existing chart."""
+    new = BarChart(title="New")
+    existing = BarChart(title="Existing")
+    existing.chart_id = "abc123"
+    return [new, existing]
+
+
+def test_creates_updates_and_publishes_in_order():
+    """New charts are created, existing ones updated, and all published."""
+    client = Datawrapper(access_token="token")
+    charts = _charts()
+    calls = []
+    lock = threading.Lock()
+
+    def post_chart(self, folder_id=None):
+        assert self._client is client
+        with lock:
+            calls.append(("create", folder_id))
+        self.chart_id = "new001"
+        return self
+
+    def update(self, access_token=None, force=False):
+        with lock:
+            calls.append(("update", self.chart_id))
+        return self
+
+    def publish(self, access_token=None):
+        with lock:
+            calls.append(("publish", self.chart_id))
+        return self
+
+    with (
+        patch.object(BarChart, "_post_chart", post_chart),
+        patch.object(BarChart, "update", update),
+        patch.object(BarChart, "publish", publish),
+    ):
+        results = client.sync_many(charts, folder_id=7, max_workers=2)
+
+    assert [(r.chart_id, r.action, r.published) for r in results] == [
+        ("new001", "create", True),
+        ("abc123", "update", True),
+    ]
+    assert all(result.ok for result in results)
+    assert sorted(calls) == [
+        ("create", 7),
+        ("publish", "abc123"),
+        ("publish", "new001"),
+        ("update", "abc123"),
+        ("update", "new001"),
+    ]
+
+
+def test_publishes_while_other_charts_are_saving():
+    """A saved chart is published without waiting for the rest of the batch."""
+    published = threading.Event()
+
+    def update(self, access_token=None, force=False):
+        if self.chart_id == "slow":
+            assert published.wait(timeout=5)
+        return self
+
+    def publish(self, access_token=None):
+        if self.chart_id == "fast":
+            published.set()
+        return self
+
+    charts = [BarChart(title="Slow"), BarChart(title="Fast")]
+    charts[0].chart_id = "slow"
+    charts[1].chart_id = "fast"
+
+    with (
+        patch.object(BarChart, "update", update),
+        patch.object(BarChart, "publish", publish),
+    ):
+        results = ChartBatch(
+            charts, max_workers=2, client=Datawrapper(access_token="token")
+        ).run()
+
+    assert all(result.published for result in results)
+
+
+def test_failures_are_raised_as_a_group_after_the_batch():
+    """Every chart is processed and failures are reported per chart."""
+    charts = _charts()
+
+    def post_chart(self, folder_id=None):
+        self.chart_id = "new001"
+        return self
+
+    def update(self, access_token=None, force=False):
+        if self.chart_id == "abc123":
+            raise ValueError("update failed")
+        return self
+
+    with (
+        patch.object(BarChart, "_post_chart", post_chart),
+        patch.object(BarChart, "update", update),
+        patch.object(BarChart, "publish", lambda self, **kwargs: self),
+    ):
+        batch = ChartBatch(charts, client=Datawrapper(access_token="token"))
+        with pytest.raises(ExceptionGroup) as info:
+            batch.run()
+
+    assert str(info.value) == "1 of 2 charts failed (1 sub-exception)"
+    assert isinstance(info.value.exceptions[0], ValueError)
+    assert batch.results[0].ok and batch.results[0].published
+    assert batch.results[1].failed_stage == "save"
+    assert not batch.results[1].published
+
+
+def test_failures_can_be_returned_instead_of_raised():
+    """With raise_on_error=False the failed stage is recorded in the results."""
+    charts = _charts()
+    charts[0].chart_id = "def456"
+
+    def publish(self, access_token=None):
+        if self.chart_id == "def456":
+            raise RuntimeError("publish failed")
+        return self
+
+    with (
+        patch.object(BarChart, "update", lambda self, **kwargs: self),
+        patch.object(BarChart, "publish", publish),
+    ):
+        results = ChartBatch(charts, client=Datawrapper(access_token="token")).run(
+            raise_on_error=False
+        )
+
+    assert results[0].failed_stage == "publish"
+    assert str(results[0].error) == "publish failed"
+    assert results[1].ok
+
+
+def test_skips_publishing_when_disabled():
+    """publish=False only saves the charts."""
+    charts = _charts()[1:]
+
+    with (
+        patch.object(BarChart, "update", lambda self, **kwargs: self),
+        patch.object(BarChart, "publish") as publish,
+    ):
+        results = ChartBatch(
+            charts, publish=False, client=Datawrapper(access_token="token")
+        ).run()
+
+    publish.assert_not_called()
+    assert results[0].ok and not results[0].published
+
+
+def test_charts_with_a_client_run_through_the_batch_client():
+    """Charts loaded with their own client use the batch's client for the run."""
+    own = Datawrapper(access_token="own")
+    batch_client = Datawrapper(access_token="batch")
+    charts = _charts()
+    charts[1]._client = own
+    used = []
+
+    def update(self, access_token=None, force=False):
+        used.append(self._client)
+        return self
+
+    with (
+        patch.object(BarChart, "_post_chart", lambda self, folder_id=None: self),
+        patch.object(BarChart, "update", update),
+    ):
+        ChartBatch(charts, publish=False, client=batch_client).run()
+
+    assert used == [batch_client, batch_client]
+    assert charts[0]._client is None
+    assert charts[1]._client is own
+
+
+def test_run_closes_the_client_it_created():
+    """A batch without a client closes the pool it opened for the run."""
+    with (
+        patch.object(BarChart, "update", side_effect=ValueError),
+        patch.object(Datawrapper, "close") as close,
+    ):
+        ChartBatch(_charts()[1:], access_token="token").run(raise_on_error=False)
+
+    close.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_run_rejects_an_async_client():
+    """run() can't drive an async client, whose coroutines would never be awaited."""
+    async with AsyncDatawrapper(access_token="token") as client:
+        with (
+            patch.object(BarChart, "update") as update,
+            pytest.raises(TypeError, match="use arun"),
+        ):
+            ChartBatch(_charts(), client=client).run()
+
+    update.assert_not_called()
+
+
+def test_rejects_invalid_worker_count():
+    """max_workers must be at least 1."""
+    with pytest.raises(ValueError, match="max_workers must be at least 1"):
+        ChartBatch([], max_workers=0)
+
+
+@pytest.mark.asyncio
+async def test_async_sync_many():
+    """The async client saves and publishes every chart through itself."""
+    client = AsyncDatawrapper(access_token="token")
+    charts = _charts()
+
+    async def apost_chart(self, folder_id=None, client=None):
+        self.chart_id = "new001"
+        return self
+
+    async def aupdate(self, access_token=None, force=False, client=None):
+        if self.chart_id == "abc123":
+            raise ValueError
+        return self
+
+    with (
+        patch.object(BarChart, "_apost_chart", apost_chart),
+        patch.object(BarChart, "aupdate", aupdate),
+        patch.object(BarChart, "apublish", new=AsyncMock()) as apublish,
+    ):
+        results = await client.sync_many(charts, raise_on_error=False)
+
+    assert results[0].ok and results[0].published
+    assert results[1].failed_stage == "save"
+    apublish.assert_awaited_once_with(client=client)
+    await client.aclose()
@@ -0,0 +1,161 @@
+"""Tests for resuming bulk jobs from a checkpoint ledger."""
+
+import json
+from unittest.mock import patch
+
+import pandas as pd
+
+from datawrapper import BarChart, ChartBatch, Checkpoint, Datawrapper, export_many
+
+
+def test_records_survive_reopening(tmp_path):
+    """Records are written straight away and loaded by the next run."""
+    path = tmp_path / "jobs" / "ledger.jsonl"
+    checkpoint = Checkpoint(path)
+    checkpoint.record("chart:0", chart_id="abc123", published=False)
+    checkpoint.record("chart:0", chart_id="abc123", published=True)
+    # A crash in the middle of a write leaves a partial line behind
+    with open(path, "a") as file:
+        file.write('{"key": "chart:1", "val')
+
+    reopened = Checkpoint(path)
+
+    assert reopened.get("chart:0") == {"chart_id": "abc123", "published": True}
+    assert "chart:1" not in reopened
+    assert len(reopened) == 1
+
+    reopened.clear()
+    assert not path.exists()
+    assert reopened.get("chart:0") is None
+
+
+def test_export_many_skips_finished_exports(tmp_path, mock_http):
+    """A rerun only exports what the earlier run didn't finish."""
+    session = mock_http.session()
+
+    def request(method, url, **kwargs):
+        return mock_http.response(
+            500 if "/bad/" in url else 200,
+            content_type="application/octet-stream",
+            chunks=[b"image"],
+        )
+
+    session.request.side_effect = request
+    client = mock_http.client(session)
+    checkpoint = Checkpoint(tmp_path / "ledger.jsonl")
+
+    first = export_many(
+        ["good", "bad"],
+        formats=["png"],
+        out_dir=tmp_path,
+        client=client,
+        checkpoint=checkpoint,
+    )
+    assert [result.ok for result in first] == [True, False]
+    assert session.request.call_count == 2
+
+    session.request.reset_mock()
+    second = export_many(
+        ["good", "bad"],
+        formats=["png"],
+        out_dir=tmp_path,
+        client=client,
+        checkpoint=Checkpoint(tmp_path / "ledger.jsonl"),
+    )
+
+    assert second[0].resumed and second[0].download.size == 5
+    assert not second[1].resumed and not second[1].ok
+    assert session.request.call_count == 1
+
+
+def test_chart_batch_resumes_without_creating_charts_twice(tmp_path):
+    """Charts created by an interrupted run are reused, not created again."""
+    path = tmp_path / "ledger.jsonl"
+    client = Datawrapper(access_token="token")
+    created = []
+    failing = {"new002"}
+
+    def post_chart(self, folder_id=None):
+        self.chart_id = f"new00{len(created) + 1}"
+        created.append(self.chart_id)
+        return self
+
+    def publish(self, access_token=None):
+        if self.chart_id in failing:
+            raise RuntimeError("publish failed")
+        return self
+
+    def charts():
+        return [BarChart(title="One"), BarChart(title="Two")]
+
+    with (
+        patch.object(BarChart, "_post_chart", post_chart),
+        patch.object(BarChart, "update") as update,
+        patch.object(BarChart, "publish", publish),
+    ):
+        first = client.sync_many(
+            charts(), max_workers=1, checkpoint=Checkpoint(path), raise_on_error=False
+        )
+        assert [result.ok for result in first] == [True, False]
+        assert update.call_count == 2
+
+        update.reset_mock()
+        failing.clear()
+        second = ChartBatch(charts(), client=client, checkpoint=Checkpoint(path)).run()
+
+    assert created == ["new001", "new002"]
+    update.assert_not_called()
+    assert [(r.chart_id, r.action, r.published, r.resumed) for r in second] == [
+        ("new001", "create", True, True),
+        ("new002", "create", True, True),
+    ]
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert records[-1] == {
+        "key": "chart:1",
+        "value": {"chart_id": "new002", "action": "create", "stage": "published"},
+    }
+
+
+def test_chart_batch_resumes_after_a_failed_data_upload(tmp_path, mock_http):
+    """A chart whose data upload failed after it was created isn't created again."""
+    session = mock_http.session()
+    uploads = []
+
+    def request(method, url, **kwargs):
+        failed = False
+        if method == "PUT" and url.endswith("/data"):
+            uploads.append(b"".join(kwargs["data"]))
+            failed = len(uploads) == 1
+        return mock_http.response(400 if failed else 200, payload={"id": "new001"})
+
+    session.request.side_effect = request
+    client = mock_http.client(session)
+    path = tmp_path / "ledger.jsonl"
+
+    def charts():
+        return [BarChart(title="One", data=pd.DataFrame({"a": [1, 2]}))]
+
+    first = ChartBatch(
+        charts(), publish=False, client=client, checkpoint=Checkpoint(path)
+    ).run(raise_on_error=False)
+    assert first[0].failed_stage == "save"
+    assert first[0].chart_id == "new001"
+    assert Checkpoint(path).get("chart:0") == {
+        "chart_id": "new001",
+        "action": "create",
+        "stage": "created",
+    }
+
+    second = ChartBatch(
+        charts(), publish=False, client=client, checkpoint=Checkpoint(path)
+    ).run()
+
+    posts = [
+        call
+        for call in session.request.call_args_list
+        if call.args[0] == "POST" and call.args[1].endswith("/v3/charts")
+    ]
+    assert len(posts) == 1
+    assert second[0].ok and second[0].resumed and second[0].chart_id == "new001"
+    assert uploads == [b"a\n1\n2\n"] * 2
+    assert Checkpoint(path).get("chart:0")["stage"] == "saved"
@@ -0,0 +1,165 @@
+"""Tests for compressing request bodies."""
+
+import gzip
+import json
+import zlib
+
+import pandas as pd
+import pytest
+
+from datawrapper import AsyncDatawrapper, Datawrapper
+from datawrapper.compression import CompressedStream, compress_body
+from datawrapper.exceptions import FailedRequestError
+
+URL = "https://api.datawrapper.de/v3/charts/abc123"
+
+LARGE_METADATA = {"metadata": {"annotate": {"notes": "Lots of notes. " * 200}}}
+
+
+class TestCompressBody:
+    """Tests for the compression helpers."""
+
+    def test_gzip_and_deflate_round_trip(self):
+        """Bodies decompress to the original bytes."""
+        body = b"a,b\n" + b"1,2\n" * 1000
+
+        assert gzip.decompress(compress_body(body, "gzip")) == body
+        assert zlib.decompress(compress_body(body, "deflate")) == body
+
+    def test_small_bodies_are_left_alone(self):
+        """Bodies below the threshold are not compressed."""
+        assert compress_body('{"title": "Short"}', "gzip", min_size=1024) is None
+
+    def test_streams_are_compressed_lazily(self):
+        """Iterables are wrapped in a replayable compressed stream."""
+        stream = compress_body([b"a\n", b"1\n" * 500], "gzip")
+
+        assert isinstance(stream, CompressedStream)
+        assert gzip.decompress(b"".join(stream)) == b"a\n" + b"1\n" * 500
+        assert b"".join(stream) == b"".join(stream)
+
+    def test_invalid_encoding(self):
+        """Only gzip and deflate are supported."""
+        with pytest.raises(ValueError, match="Invalid compression"):
+            Datawrapper(access_token="token", compression="br")
+
+
+class TestClientCompression:
+    """Tests for compression in the blocking client."""
+
+    def test_disabled_by_default(self, mock_http):
+        """Bodies are sent uncompressed unless compression is enabled."""
+        session = mock_http.session(mock_http.response(200))
+
+        mock_http.client(session).patch(URL, data=LARGE_METADATA)
+
+        kwargs = session.request.call_args.kwargs
+        assert "Content-Encoding" not in kwargs["headers"]
+        assert json.loads(kwargs["data"]) == LARGE_METADATA
+
+    def test_large_json_body_is_compressed(self, mock_http):
+        """JSON bodies above the threshold are gzipped with a header."""
+        session = mock_http.session(mock_http.response(200))
+
+        mock_http.client(session, compression="gzip").patch(URL, data=LARGE_METADATA)
+
+        kwargs = session.request.call_args.kwargs
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        assert kwargs["headers"]["content-type"] == "application/json"
+        assert json.loads(gzip.decompress(kwargs["data"])) == LARGE_METADATA
+
+    def test_small_json_body_is_not_compressed(self, mock_http):
+        """Small bodies skip compression."""
+        session = mock_http.session(mock_http.response(200))
+
+        mock_http.client(session, compression="gzip").patch(
+            URL, data={"title": "Short"}
+        )
+
+        kwargs = session.request.call_args.kwargs
+        assert "Content-Encoding" not in kwargs["headers"]
+
+    def test_streamed_upload_is_compressed(self, mock_http):
+        """Streamed CSV uploads are compressed chunk by chunk."""
+        session = mock_http.session(mock_http.response(200))
+        df = pd.DataFrame({"a": range(100)})
+
+        mock_http.client(session, compression="deflate").upload_data("abc123", df)
+
+        kwargs = session.request.call_args.kwargs
+        assert kwargs["headers"]["Content-Encoding"] == "deflate"
+        body = zlib.decompress(b"".join(kwargs["data"]))
+        assert body == df.to_csv(index=False).encode("utf-8")
+
+    def test_rejected_compression_falls_back(self, mock_http):
+        """A 415 response resends the body uncompressed and turns compression off."""
+        session = mock_http.session(
+            mock_http.response(415), mock_http.response(200), mock_http.response(200)
+        )
+        dw = mock_http.client(session, compression="gzip")
+
+        dw.patch(URL, data=LARGE_METADATA)
+        dw.patch(URL, data=LARGE_METADATA)
+
+        sent = [call.kwargs for call in session.request.call_args_list]
+        assert sent[0]["headers"]["Content-Encoding"] == "gzip"
+        assert "Content-Encoding" not in sent[1]["headers"]
+        assert json.loads(sent[1]["data"]) == LARGE_METADATA
+        assert "Content-Encoding" not in sent[2]["headers"]
+
+    def test_rejected_one_shot_stream_turns_compression_off(self, mock_http):
+        """A 415 for a body that can't be resent still stops later compression."""
+        session = mock_http.session(mock_http.response(415), mock_http.response(200))
+        dw = mock_http.client(session, compression="gzip")
+
+        with pytest.raises(FailedRequestError):
+            dw.upload_data("abc123", iter([b"a,b\n", b"1,2\n"]))
+        dw.upload_data("abc123", iter([b"a,b\n", b"1,2\n"]))
+
+        sent = [call.kwargs for call in session.request.call_args_list]
+        assert sent[0]["headers"]["Content-Encoding"] == "gzip"
+        assert "Content-Encoding" not in sent[1]["headers"]
+
+
+@pytest.mark.asyncio
+async def test_async_client_compresses_and_falls_back():
+    """The async client compresses bodies and falls back the same way."""
+    httpx = pytest.importorskip("httpx")
+    requests_seen = []
+
+    async def handler(request):
+        body = await request.aread()
+        encoding = request.headers.get("Content-Encoding")
+        requests_seen.append(encoding)
+        if encoding:
+            assert json.loads(gzip.decompress(body)) == LARGE_METADATA
+            return httpx.Response(415)
+        assert json.loads(body) == LARGE_METADATA
+        return httpx.Response(200, json={"id": "abc123"})
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    dw = AsyncDatawrapper(access_token="token", client=http_client, compression="gzip")
+
+    assert await dw.patch(URL, data=LARGE_METADATA) == {"id": "abc123"}
+    assert requests_seen == ["gzip", None]
+
+
+@pytest.mark.asyncio
+async def test_async_rejected_one_shot_stream_turns_compression_off():
+    """The async client also stops compressing after a 415 it can't resend."""
+    httpx = pytest.importorskip("httpx")
+    encodings = []
+
+    def handler(request):
+        encodings.append(request.headers.get("Content-Encoding"))
+        return httpx.Response(415 if encodings[-1] else 200)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with AsyncDatawrapper(
+        access_token="token", client=http_client, compression="gzip"
+    ) as dw:
+        with pytest.raises(FailedRequestError):
+            await dw.upload_data("abc123", iter([b"a,b\n", b"1,2\n"]))
+        await dw.upload_data("abc123", iter([b"a,b\n", b"1,2\n"]))
+
+    assert encodings == ["gzip", None]
@@ -0,0 +1,146 @@
+"""Tests for streaming exports to disk and file-like objects."""
+
+import hashlib
+import io
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+import requests
+
+from datawrapper import AsyncDatawrapper, BarChart, Download
+from datawrapper.exceptions import FailedRequestError
+
+URL = "https://api.datawrapper.de/v3/charts/abc123/export/png"
+
+CHUNKS = [b"\x89PNG\r\n", b"chunk-one", b"chunk-two"]
+
+
+class TestDownload:
+    """Tests for Datawrapper.download."""
+
+    def test_writes_chunks_to_path(self, tmp_path, mock_http):
+        """The body is streamed to the destination path."""
+        response = mock_http.response(content_type="image/png", chunks=CHUNKS)
+        session = mock_http.session(response)
+        dw = mock_http.client(session)
+        destination = tmp_path / "chart.png"
+
+        result = dw.download(URL, destination, params={"zoom": "2"})
+
+        assert destination.read_bytes() == b"".join(CHUNKS)
+        assert result == Download(path=destination, size=len(b"".join(CHUNKS)))
+        assert session.request.call_args.kwargs["stream"] is True
+        assert session.request.call_args.kwargs["params"] == {"zoom": "2"}
+        response.close.assert_called_once()
+        assert list(tmp_path.iterdir()) == [destination]
+
+    def test_writes_chunks_to_file_object(self, mock_http):
+        """File-like destinations are written to and left open."""
+        response = mock_http.response(content_type="image/png", chunks=CHUNKS)
+        dw = mock_http.client(mock_http.session(response))
+        buffer = io.BytesIO()
+
+        result = dw.download(URL, buffer)
+
+        assert buffer.getvalue() == b"".join(CHUNKS)
+        assert result.path is None
+        assert not buffer.closed
+
+    def test_checksum(self, tmp_path, mock_http):
+        """A checksum of the content is computed while it is written."""
+        response = mock_http.response(content_type="image/png", chunks=CHUNKS)
+        dw = mock_http.client(mock_http.session(response))
+
+        result = dw.download(URL, tmp_path / "chart.png", checksum="sha256")
+
+        assert result.algorithm == "sha256"
+        assert result.checksum == hashlib.sha256(b"".join(CHUNKS)).hexdigest()
+
+    def test_failed_request_leaves_no_file(self, tmp_path, mock_http):
+        """An error response neither creates nor truncates the destination."""
+        destination = tmp_path / "chart.png"
+        destination.write_bytes(b"previous export")
+        response = mock_http.response(404, content_type="image/png", chunks=CHUNKS)
+        dw = mock_http.client(mock_http.session(response))
+
+        with pytest.raises(FailedRequestError):
+            dw.download(URL, destination)
+
+        assert destination.read_bytes() == b"previous export"
+        assert list(tmp_path.iterdir()) == [destination]
+
+    def test_interrupted_stream_leaves_no_partial_file(self, tmp_path, mock_http):
+        """A connection dropped mid-download discards the partial file."""
+        response = mock_http.response(content_type="image/png", chunks=CHUNKS)
+
+        def broken_stream(chunk_size):
+            yield b"partial"
+            raise requests.ConnectionError("connection reset")
+
+        response.iter_content.side_effect = broken_stream
+        dw = mock_http.client(mock_http.session(response))
+
+        with pytest.raises(requests.ConnectionError):
+            dw.download(URL, tmp_path / "chart.png")
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestExportDestination:
+    """Tests for streaming chart exports."""
+
+    def test_export_png_streams_to_destination(self, tmp_path):
+        """Passing a destination streams the export instead of returning bytes."""
+        chart = BarChart(title="Test")
+        chart.chart_id = "abc123"
+        client = Mock()
+        client._CHARTS_URL = "https://api.datawrapper.de/v3/charts"
+        client.download.return_value = Download(path=tmp_path / "chart.png", size=3)
+
+        with patch.object(BarChart, "_get_client", return_value=client):
+            result = chart.export_png(
+                destination=tmp_path / "chart.png", checksum="md5"
+            )
+
+        assert result == client.download.return_value
+        client.get.assert_not_called()
+        args, kwargs = client.download.call_args
+        assert args == (
+            f"{client._CHARTS_URL}/abc123/export/png",
+            tmp_path / "chart.png",
+        )
+        assert kwargs["checksum"] == "md5"
+        assert kwargs["params"]["zoom"] == "2"
+
+    def test_checksum_requires_destination(self):
+        """A checksum cannot be computed over an in-memory export."""
+        chart = BarChart(title="Test")
+        chart.chart_id = "abc123"
+        client = Mock()
+        client._CHARTS_URL = "https://api.datawrapper.de/v3/charts"
+
+        with (
+            patch.object(BarChart, "_get_client", return_value=client),
+            pytest.raises(ValueError, match="checksum requires a destination"),
+        ):
+            chart.export_pdf(checksum="sha256")
+
+
+@pytest.mark.asyncio
+async def test_async_download(tmp_path):
+    """The async client streams the body to disk."""
+    body = b"<svg>" + b"x" * 200_000 + b"</svg>"
+
+    def handler(request):
+        return httpx.Response(200, content=body)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with AsyncDatawrapper(access_token="token", client=http_client) as dw:
+        result = await dw.download(
+            URL.replace("png", "svg"), tmp_path / "chart.svg", checksum="sha1"
+        )
+
+    assert (tmp_path / "chart.svg").read_bytes() == body
+    assert result.size == len(body)
+    assert result.checksum == hashlib.sha1(body).hexdigest()
@@ -133,7 +133,7 @@ class TestExceptionRaisingInGetMethod:
 
     def test_get_raises_failed_request_on_404(self):
         """Test that GET request raises FailedRequestError on 404."""
-        with patch("datawrapper.__main__.r.get") as mock_get:
+        with patch("datawrapper.__main__.r.Session.request") as mock_get:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 404
@@ -149,7 +149,7 @@ class TestExceptionRaisingInGetMethod:
 
     def test_get_raises_rate_limit_on_429(self):
         """Test that GET request raises RateLimitError on 429."""
-        with patch("datawrapper.__main__.r.get") as mock_get:
+        with patch("datawrapper.__main__.r.Session.request") as mock_get:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 429
@@ -165,7 +165,7 @@ class TestExceptionRaisingInGetMethod:
 
     def test_get_raises_failed_request_on_500(self):
         """Test that GET request raises FailedRequestError on 500."""
-        with patch("datawrapper.__main__.r.get") as mock_get:
+        with patch("datawrapper.__main__.r.Session.request") as mock_get:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 500
@@ -185,7 +185,7 @@ class TestExceptionRaisingInPostMethod:
 
     def test_post_raises_failed_request_on_400(self):
         """Test that POST request raises FailedRequestError on 400."""
-        with patch("datawrapper.__main__.r.post") as mock_post:
+        with patch("datawrapper.__main__.r.Session.request") as mock_post:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 400
@@ -201,7 +201,7 @@ class TestExceptionRaisingInPostMethod:
 
     def test_post_raises_rate_limit_on_429(self):
         """Test that POST request raises RateLimitError on 429."""
-        with patch("datawrapper.__main__.r.post") as mock_post:
+        with patch("datawrapper.__main__.r.Session.request") as mock_post:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 429
@@ -217,7 +217,7 @@ class TestExceptionRaisingInPostMethod:
 
     def test_post_raises_failed_request_on_403(self):
         """Test that POST request raises FailedRequestError on 403."""
-        with patch("datawrapper.__main__.r.post") as mock_post:
+        with patch("datawrapper.__main__.r.Session.request") as mock_post:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 403
@@ -237,7 +237,7 @@ class TestExceptionRaisingInPatchMethod:
 
     def test_patch_raises_failed_request_on_404(self):
         """Test that PATCH request raises FailedRequestError on 404."""
-        with patch("datawrapper.__main__.r.patch") as mock_patch:
+        with patch("datawrapper.__main__.r.Session.request") as mock_patch:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 404
@@ -253,7 +253,7 @@ class TestExceptionRaisingInPatchMethod:
 
     def test_patch_raises_rate_limit_on_429(self):
         """Test that PATCH request raises RateLimitError on 429."""
-        with patch("datawrapper.__main__.r.patch") as mock_patch:
+        with patch("datawrapper.__main__.r.Session.request") as mock_patch:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 429
@@ -273,7 +273,7 @@ class TestExceptionRaisingInPutMethod:
 
     def test_put_raises_failed_request_on_400(self):
         """Test that PUT request raises FailedRequestError on 400."""
-        with patch("datawrapper.__main__.r.put") as mock_put:
+        with patch("datawrapper.__main__.r.Session.request") as mock_put:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 400
@@ -289,7 +289,7 @@ class TestExceptionRaisingInPutMethod:
 
     def test_put_raises_rate_limit_on_429(self):
         """Test that PUT request raises RateLimitError on 429."""
-        with patch("datawrapper.__main__.r.put") as mock_put:
+        with patch("datawrapper.__main__.r.Session.request") as mock_put:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 429
@@ -309,7 +309,7 @@ class TestExceptionRaisingInDeleteMethod:
 
     def test_delete_raises_failed_request_on_404(self):
         """Test that DELETE request raises FailedRequestError on 404."""
-        with patch("datawrapper.__main__.r.delete") as mock_delete:
+        with patch("datawrapper.__main__.r.Session.request") as mock_delete:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 404
@@ -325,7 +325,7 @@ class TestExceptionRaisingInDeleteMethod:
 
     def test_delete_raises_rate_limit_on_429(self):
         """Test that DELETE request raises RateLimitError on 429."""
-        with patch("datawrapper.__main__.r.delete") as mock_delete:
+        with patch("datawrapper.__main__.r.Session.request") as mock_delete:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 429
@@ -490,7 +490,7 @@ class TestExceptionInRealWorldScenarios:
 
     def test_get_chart_with_invalid_id_raises_failed_request(self):
         """Test that getting a chart with invalid ID raises FailedRequestError."""
-        with patch("datawrapper.__main__.r.get") as mock_get:
+        with patch("datawrapper.__main__.r.Session.request") as mock_get:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 404
@@ -504,7 +504,7 @@ class TestExceptionInRealWorldScenarios:
 
     def test_create_chart_with_rate_limit_raises_rate_limit_error(self):
         """Test that creating a chart when rate limited raises RateLimitError."""
-        with patch("datawrapper.__main__.r.post") as mock_post:
+        with patch("datawrapper.__main__.r.Session.request") as mock_post:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 429
@@ -520,7 +520,7 @@ class TestExceptionInRealWorldScenarios:
 
     def test_delete_chart_unauthorized_raises_failed_request(self):
         """Test that deleting a chart without permission raises FailedRequestError."""
-        with patch("datawrapper.__main__.r.delete") as mock_delete:
+        with patch("datawrapper.__main__.r.Session.request") as mock_delete:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 403
@@ -536,7 +536,7 @@ class TestExceptionInRealWorldScenarios:
 
     def test_publish_chart_server_error_raises_failed_request(self):
         """Test that publishing a chart with server error raises FailedRequestError."""
-        with patch("datawrapper.__main__.r.post") as mock_post:
+        with patch("datawrapper.__main__.r.Session.request") as mock_post:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 500
@@ -552,7 +552,7 @@ class TestExceptionInRealWorldScenarios:
 
     def test_add_data_bad_request_raises_failed_request(self):
         """Test that adding invalid data raises FailedRequestError."""
-        with patch("datawrapper.__main__.r.put") as mock_put:
+        with patch("datawrapper.__main__.r.Session.request") as mock_put:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 400
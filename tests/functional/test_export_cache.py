@@ -0,0 +1,127 @@
+"""Tests for the on-disk export cache."""
+
+import hashlib
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from datawrapper import BarChart, ExportCache
+
+
+class FakeAPI:
+    """Serve chart metadata and exports through a mock session."""
+
+    def __init__(self, mock_http, published_at="2024-01-01T00:00:00.000Z"):
+        self.mock_http = mock_http
+        self.published_at = published_at
+        self.exports = 0
+        self.metadata_requests = 0
+        self.session = mock_http.session()
+        self.session.request.side_effect = self.request
+
+    def request(self, method, url, **kwargs):
+        if "/export/" in url:
+            self.exports += 1
+            content = f"{url}?zoom={kwargs['params']['zoom']}".encode()
+            return self.mock_http.response(content_type="image/png", chunks=[content])
+        self.metadata_requests += 1
+        return self.mock_http.response(
+            payload={
+                "id": "abc123",
+                "publishedAt": self.published_at,
+                "publicVersion": 3,
+            }
+        )
+
+    def chart(self):
+        """Build a chart that sends its requests to this API."""
+        chart = BarChart(title="Test")
+        chart.chart_id = "abc123"
+        chart._client = self.mock_http.client(self.session)
+        return chart
+
+
+def test_repeated_export_is_served_from_cache(tmp_path, mock_http):
+    """The second identical export skips the network entirely."""
+    api = FakeAPI(mock_http)
+    cache = ExportCache(tmp_path)
+    chart = api.chart()
+
+    first = chart.export_png(zoom=2, width=600, cache=cache)
+    second = chart.export_png(zoom=2, width=600, cache=cache)
+
+    assert first == second
+    assert first.endswith(b"/abc123/export/png?zoom=2")
+    assert api.exports == 1
+    assert api.metadata_requests == 1
+
+
+def test_key_depends_on_parameters_and_version(tmp_path, mock_http):
+    """Different export options and new chart versions are cached separately."""
+    api = FakeAPI(mock_http)
+    cache = ExportCache(tmp_path)
+
+    api.chart().export_png(zoom=2, cache=cache)
+    api.chart().export_png(zoom=4, cache=cache)
+    api.chart().export_png(zoom=2, cache=cache)
+    assert api.exports == 2
+
+    api.published_at = "2024-02-01T00:00:00.000Z"
+    api.chart().export_png(zoom=2, cache=cache)
+    assert api.exports == 3
+
+
+def test_cached_export_is_copied_to_destination(tmp_path, mock_http):
+    """Hits are copied to a destination like a streamed export."""
+    api = FakeAPI(mock_http)
+    cache = ExportCache(tmp_path / "cache")
+    chart = api.chart()
+
+    data = chart.export_svg(cache=cache)
+    result = chart.export_svg(
+        cache=cache, destination=tmp_path / "chart.svg", checksum="sha256"
+    )
+
+    assert (tmp_path / "chart.svg").read_bytes() == data
+    assert result.checksum == hashlib.sha256(data).hexdigest()
+    assert api.exports == 1
+
+
+def test_publish_invalidates_version(tmp_path, mock_http):
+    """A published chart looks up its new version before using the cache."""
+    api = FakeAPI(mock_http)
+    cache = ExportCache(tmp_path)
+    chart = api.chart()
+    chart._client.publish_chart = Mock(return_value={"data": {}})
+
+    chart.export_pdf(cache=cache)
+    chart.publish()
+    chart.export_pdf(cache=cache)
+
+    assert api.metadata_requests == 2
+
+
+def test_trim_evicts_least_recently_used(tmp_path):
+    """Once over max_size, the least recently used exports are removed first."""
+    cache = ExportCache(tmp_path, max_size=20)
+    for age, name in enumerate(["old.png", "used.png", "new.png"]):
+        path = cache.path(name)
+        path.write_bytes(b"0123456789")
+        os.utime(path, (1_000_000 + age, 1_000_000 + age))
+
+    assert cache.get("old.png") is not None  # marks it as recently used
+    cache.trim(keep="new.png")
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["new.png", "old.png"]
+    assert cache.size() == 20
+    assert cache.get("used.png") is None
+
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_negative_max_size():
+    """The cache size must not be negative."""
+    with pytest.raises(ValueError, match="max_size"):
+        ExportCache(".", max_size=-1)
@@ -0,0 +1,132 @@
+"""Tests for exporting many charts at once."""
+
+import threading
+
+import pytest
+
+from datawrapper import BarChart, Datawrapper, export_many
+from datawrapper.exceptions import FailedRequestError
+
+
+def _session(mock_http, fail_chart=None):
+    """Build a mock session that serves every export as a small file."""
+    session = mock_http.session()
+    lock = threading.Lock()
+
+    def request(method, url, **kwargs):
+        failed = fail_chart is not None and f"/{fail_chart}/" in url
+        with lock:
+            session.urls.append((url, kwargs["params"]))
+        return mock_http.response(
+            500 if failed else 200,
+            content_type="application/octet-stream",
+            chunks=[url.encode()],
+        )
+
+    session.urls = []
+    session.request.side_effect = request
+    return session
+
+
+def test_exports_every_chart_format_and_size(tmp_path, mock_http):
+    """Each chart is exported once per format and size, named after all three."""
+    session = _session(mock_http)
+    chart = BarChart(title="Test")
+    chart.chart_id = "def456"
+
+    results = export_many(
+        ["abc123", chart],
+        formats=["png", "svg"],
+        sizes=[{"width": 600}, {"width": 1200, "zoom": 4}],
+        out_dir=tmp_path / "exports",
+        client=mock_http.client(session),
+    )
+
+    assert [(r.chart_id, r.format, r.path.name) for r in results] == [
+        ("abc123", "png", "abc123_width-600.png"),
+        ("abc123", "png", "abc123_width-1200_zoom-4.png"),
+        ("abc123", "svg", "abc123_width-600.svg"),
+        ("abc123", "svg", "abc123_width-1200_zoom-4.svg"),
+        ("def456", "png", "def456_width-600.png"),
+        ("def456", "png", "def456_width-1200_zoom-4.png"),
+        ("def456", "svg", "def456_width-600.svg"),
+        ("def456", "svg", "def456_width-1200_zoom-4.svg"),
+    ]
+    assert all(result.ok for result in results)
+    assert len(session.urls) == 8
+    assert (tmp_path / "exports" / "def456_width-600.svg").read_bytes() == (
+        b"https://api.datawrapper.de/v3/charts/def456/export/svg"
+    )
+    png_widths = sorted(
+        params["width"]
+        for url, params in session.urls
+        if url.endswith("/abc123/export/png")
+    )
+    assert png_widths == ["1200", "600"]
+
+
+def test_failures_are_collected_per_item(tmp_path, mock_http):
+    """A failing chart does not stop the other exports."""
+    session = _session(mock_http, fail_chart="bad")
+
+    results = export_many(
+        ["good", "bad"],
+        formats=["pdf"],
+        out_dir=tmp_path,
+        client=mock_http.client(session),
+    )
+
+    good, bad = results
+    assert good.ok and good.download.size > 0
+    assert not bad.ok
+    assert isinstance(bad.error, FailedRequestError)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["good.pdf"]
+
+
+def test_charts_with_a_client_export_through_the_shared_client(tmp_path, mock_http):
+    """Charts loaded with their own client are exported through the shared one."""
+    session = _session(mock_http)
+    own = mock_http.client(mock_http.session())
+    chart = BarChart(title="Test")
+    chart.chart_id = "abc123"
+    chart._client = own
+
+    results = export_many(
+        [chart],
+        formats=["png"],
+        out_dir=tmp_path,
+        client=mock_http.client(session),
+    )
+
+    assert results[0].ok
+    assert len(session.urls) == 1
+    own.session.request.assert_not_called()
+    assert chart._client is own
+
+
+def test_closes_the_client_it_created(tmp_path, monkeypatch, mock_http):
+    """Without a client, the pool opened for the exports is closed afterwards."""
+    monkeypatch.setattr(
+        Datawrapper,
+        "create_session",
+        staticmethod(lambda **kwargs: _session(mock_http)),
+    )
+    closed = []
+    monkeypatch.setattr(Datawrapper, "close", lambda self: closed.append(self))
+
+    results = export_many(
+        ["abc123"], formats=["png"], out_dir=tmp_path, access_token="token"
+    )
+
+    assert results[0].ok
+    assert len(closed) == 1
+
+
+def test_invalid_arguments(tmp_path, mock_http):
+    """Bad worker counts and formats are rejected before anything is exported."""
+    client = mock_http.client(_session(mock_http))
+
+    with pytest.raises(ValueError, match="max_workers"):
+        export_many(["abc123"], out_dir=tmp_path, max_workers=0, client=client)
+    with pytest.raises(ValueError, match="Invalid format"):
+        export_many(["abc123"], formats=["gif"], out_dir=tmp_path, client=client)
@@ -0,0 +1,161 @@
+"""Tests for conditional GET caching."""
+
+import time
+
+import httpx
+import pandas as pd
+import pytest
+
+from datawrapper import AsyncDatawrapper, Datawrapper, DiskCache, MemoryCache
+from datawrapper.http_cache import CacheEntry
+
+URL = "https://api.datawrapper.de/v3/charts/abc123"
+
+
+class ConditionalServer:
+    """A mock session that answers 304 when the client's ETag is current."""
+
+    def __init__(self, mock_http, body=b'{"id": "abc123", "title": "Test"}'):
+        self.mock_http = mock_http
+        self.body = body
+        self.etag = '"v1"'
+        self.content_type = "application/json"
+        self.requests = []
+        self.session = mock_http.session()
+        self.session.request.side_effect = self.request
+
+    def request(self, method, url, **kwargs):
+        self.requests.append(kwargs["headers"])
+        not_modified = kwargs["headers"].get("If-None-Match") == self.etag
+        return self.mock_http.response(
+            304 if not_modified else 200,
+            headers={"ETag": self.etag},
+            content_type=self.content_type,
+            content=b"" if not_modified else self.body,
+        )
+
+    def client(self, cache):
+        return self.mock_http.client(self.session, http_cache=cache)
+
+
+def test_unchanged_response_is_served_from_cache(mock_http):
+    """A 304 returns the cached object and the body isn't sent again."""
+    server = ConditionalServer(mock_http)
+    dw = server.client(True)
+
+    first = dw.get(URL)
+    second = dw.get(URL)
+
+    assert first == second == {"id": "abc123", "title": "Test"}
+    assert "If-None-Match" not in server.requests[0]
+    assert server.requests[1]["If-None-Match"] == '"v1"'
+
+
+def test_changed_response_replaces_cached_copy(mock_http):
+    """A new ETag means the new body is returned and cached."""
+    server = ConditionalServer(mock_http)
+    dw = server.client(MemoryCache())
+    dw.get(URL)
+
+    server.body = b'{"id": "abc123", "title": "Renamed"}'
+    server.etag = '"v2"'
+
+    assert dw.get(URL)["title"] == "Renamed"
+    assert dw.get(URL)["title"] == "Renamed"
+    assert server.requests[2]["If-None-Match"] == '"v2"'
+
+
+def test_csv_data_is_parsed_from_cache(mock_http):
+    """Cached CSV bodies are parsed into a fresh DataFrame."""
+    server = ConditionalServer(mock_http, body=b"x,y\n1,2\n3,4\n")
+    server.content_type = "text/csv"
+    dw = server.client(True)
+
+    dw.get(f"{URL}/data")
+    cached = dw.get(f"{URL}/data")
+
+    pd.testing.assert_frame_equal(cached, pd.DataFrame({"x": [1, 3], "y": [2, 4]}))
+
+
+def test_tokens_do_not_share_entries(mock_http):
+    """Clients with different tokens never read each other's responses."""
+    server = ConditionalServer(mock_http)
+    cache = MemoryCache()
+    server.client(cache).get(URL)
+
+    Datawrapper(access_token="other", session=server.session, http_cache=cache).get(URL)
+
+    assert "If-None-Match" not in server.requests[1]
+
+
+def test_memory_cache_ttl_and_lru():
+    """Entries expire after the TTL and the least recently used is evicted first."""
+    cache = MemoryCache(max_entries=2, ttl=60)
+    cache.set("a", CacheEntry(etag="a", body=b"a"))
+    cache.set("b", CacheEntry(etag="b", body=b"b"))
+    cache.get("a")
+    cache.set("c", CacheEntry(etag="c", body=b"c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+    cache.set("old", CacheEntry(etag="old", body=b"", stored_at=time.time() - 61))
+    assert cache.get("old") is None
+
+
+def test_disk_cache_round_trip(tmp_path):
+    """Entries survive on disk and the directory stays under max_size."""
+    cache = DiskCache(tmp_path, max_size=250)
+    entry = CacheEntry(etag='"v1"', content_type="application/json", body=b"{}" * 50)
+
+    cache.set("first", entry)
+    assert DiskCache(tmp_path).get("first") == entry
+
+    cache.set("second", entry)
+    assert cache.get("first") is None
+    assert cache.get("second") == entry
+
+    cache.clear()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_disk_cache_serves_304(tmp_path, mock_http):
+    """A disk cache works as a drop-in backend for the client."""
+    server = ConditionalServer(mock_http)
+    server.client(DiskCache(tmp_path)).get(URL)
+
+    result = server.client(DiskCache(tmp_path)).get(URL)
+
+    assert result == {"id": "abc123", "title": "Test"}
+    assert server.requests[1]["If-None-Match"] == '"v1"'
+
+
+def test_invalid_settings(tmp_path):
+    """Nonsensical cache settings are rejected."""
+    with pytest.raises(ValueError, match="ttl"):
+        MemoryCache(ttl=0)
+    with pytest.raises(ValueError, match="max_entries"):
+        MemoryCache(max_entries=0)
+    with pytest.raises(ValueError, match="max_size"):
+        DiskCache(tmp_path, max_size=-1)
+
+
+@pytest.mark.asyncio
+async def test_async_client_revalidates():
+    """The async client sends If-None-Match and serves 304s from the cache."""
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"id": "abc123"}, headers={"ETag": '"v1"'})
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with AsyncDatawrapper(
+        access_token="token", client=http_client, http_cache=True
+    ) as dw:
+        assert await dw.get(URL) == {"id": "abc123"}
+        assert await dw.get(URL) == {"id": "abc123"}
+
+    assert seen == [None, '"v1"']
@@ -0,0 +1,138 @@
+"""Tests for deferring chart data until it is read."""
+
+from unittest.mock import patch
+
+import httpx
+import pandas as pd
+import pytest
+
+from datawrapper import AsyncDatawrapper, BarChart, Datawrapper, get_chart
+
+METADATA = {"id": "abc123", "type": "d3-bars", "title": "Sales", "metadata": {}}
+
+
+def _get(requested):
+    def get(url, raw=False):
+        requested.append(url)
+        if url.endswith("/data"):
+            return pd.DataFrame({"label": ["A"], "value": [1]})
+        return METADATA
+
+    return get
+
+
+def test_data_is_fetched_on_first_read():
+    """Only the metadata is requested until data is read."""
+    requested = []
+    with patch.object(Datawrapper, "get", side_effect=_get(requested)):
+        chart = BarChart.get("abc123", access_token="token", lazy_data=True)
+        assert chart.title == "Sales"
+        assert len(requested) == 1
+
+        assert chart.data["value"].tolist() == [1]
+        assert chart.load_data() is chart.data
+
+    assert requested[-1].endswith("/abc123/data")
+    assert len(requested) == 2
+
+
+def test_model_dump_loads_deferred_data():
+    """Dumping a lazy chart fetches its data instead of leaving it out."""
+    requested = []
+    with patch.object(Datawrapper, "get", side_effect=_get(requested)):
+        chart = BarChart.get("abc123", access_token="token", lazy_data=True)
+        assert "data" not in chart.model_dump(exclude={"data"})
+        assert len(requested) == 1
+
+        dumped = chart.model_dump()
+
+    assert len(requested) == 2
+    assert dumped["data"]["value"].tolist() == [1]
+
+
+def test_update_leaves_unread_data_alone():
+    """Changing the title of a lazy chart sends no data and never fetches it."""
+    requested = []
+    with (
+        patch.object(Datawrapper, "get", side_effect=_get(requested)),
+        patch.object(Datawrapper, "update_chart") as update_chart,
+        patch.object(Datawrapper, "upload_data") as upload_data,
+    ):
+        chart = get_chart("abc123", access_token="token", lazy_data=True)
+        chart.title = "Revenue"
+        chart.update()
+
+        update_chart.assert_called_once()
+        assert update_chart.call_args.kwargs["data"] is None
+        assert update_chart.call_args.kwargs["title"] == "Revenue"
+
+        # Reading the data afterwards doesn't make it look changed
+        chart.load_data()
+        chart.update()
+        assert update_chart.call_count == 1
+        upload_data.assert_not_called()
+
+    assert len(requested) == 2
+
+
+def test_new_data_is_uploaded():
+    """Data assigned to a lazy chart replaces the API's data."""
+    requested = []
+    with (
+        patch.object(Datawrapper, "get", side_effect=_get(requested)),
+        patch.object(Datawrapper, "upload_data") as upload_data,
+    ):
+        chart = BarChart.get("abc123", access_token="token", lazy_data=True)
+        chart.data = pd.DataFrame({"label": ["B"], "value": [2]})
+        chart.update()
+
+    assert len(requested) == 1
+    assert upload_data.call_args.args[1]["label"].tolist() == ["B"]
+
+
+@pytest.mark.asyncio
+async def test_aload_data():
+    """Async charts load deferred data through the async client."""
+    requested = []
+
+    def handler(request):
+        requested.append(request.url.path)
+        if request.url.path.endswith("/data"):
+            return httpx.Response(
+                200, content=b"label,value\nA,1\n", headers={"content-type": "text/csv"}
+            )
+        return httpx.Response(200, json=METADATA)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with AsyncDatawrapper(access_token="token", client=http_client) as dw:
+        chart = await BarChart.aget("abc123", client=dw, lazy_data=True)
+        assert requested == ["/v3/charts/abc123"]
+
+        df = await chart.aload_data()
+
+    assert requested[-1] == "/v3/charts/abc123/data"
+    assert df.to_dict("records") == [{"label": "A", "value": 1}]
+    assert chart.data is df
+
+
+@pytest.mark.asyncio
+async def test_reading_async_lazy_data_before_aload_data_raises():
+    """Data deferred by aget() is never fetched with a blocking request."""
+    requested = []
+
+    def handler(request):
+        requested.append(request.url.path)
+        return httpx.Response(200, json=METADATA)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with AsyncDatawrapper(access_token="token", client=http_client) as dw:
+        chart = await BarChart.aget("abc123", client=dw, lazy_data=True)
+
+        with (
+            patch.object(Datawrapper, "get") as blocking_get,
+            pytest.raises(RuntimeError, match="aload_data"),
+        ):
+            chart.load_data()
+
+    blocking_get.assert_not_called()
+    assert requested == ["/v3/charts/abc123"]
@@ -0,0 +1,223 @@
+"""Tests for iterating over paginated endpoints."""
+
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from datawrapper import AsyncDatawrapper, Datawrapper
+from datawrapper.pagination import iter_items
+
+
+def _pages(total, report_total=True, cap=None):
+    """Serve ``total`` numbered items in pages of at most ``cap``, like the API does."""
+
+    def get(url, params=None, timeout=15):
+        offset = int((params or {}).get("offset", 0))
+        limit = min(int(params["limit"]), cap or total)
+        items = [{"id": i} for i in range(offset, min(offset + limit, total))]
+        page = {"list": items}
+        if report_total:
+            page["total"] = total
+        return page
+
+    return get
+
+
+def test_iter_users_yields_every_item_lazily():
+    """Pages are only requested as the iterator reaches them."""
+    dw = Datawrapper(access_token="token")
+
+    with patch.object(Datawrapper, "get", side_effect=_pages(250)) as mock_get:
+        users = dw.iter_users(search="a", page_size=100)
+        first = [next(users) for _ in range(5)]
+        assert mock_get.call_count == 1
+
+        rest = list(users)
+
+    assert [user["id"] for user in first + rest] == list(range(250))
+    offsets = [
+        call.kwargs["params"].get("offset", 0) for call in mock_get.call_args_list
+    ]
+    assert offsets == [0, 100, 200]
+    assert mock_get.call_args.kwargs["params"]["search"] == "a"
+
+
+def test_total_avoids_an_empty_last_request():
+    """When the total is a multiple of the page size, no empty page is fetched."""
+    dw = Datawrapper(access_token="token")
+
+    with patch.object(Datawrapper, "get", side_effect=_pages(200)) as mock_get:
+        assert len(list(dw.iter_river(page_size=100))) == 200
+
+    assert mock_get.call_count == 2
+
+
+def test_pages_without_total_stop_on_short_page():
+    """Endpoints that don't report a total stop at the first short page."""
+    dw = Datawrapper(access_token="token")
+
+    with patch.object(
+        Datawrapper, "get", side_effect=_pages(200, report_total=False)
+    ) as mock_get:
+        charts = list(dw.iter_charts(folder_id=5, page_size=100))
+
+    assert len(charts) == 200
+    assert mock_get.call_count == 3
+    assert mock_get.call_args.kwargs["params"]["folderId"] == 5
+
+
+def test_total_outlasts_pages_shorter_than_requested():
+    """A server that returns fewer items than asked for is read until the total."""
+    dw = Datawrapper(access_token="token")
+
+    with patch.object(Datawrapper, "get", side_effect=_pages(250, cap=40)) as mock_get:
+        users = list(dw.iter_users(page_size=100))
+
+    assert [user["id"] for user in users] == list(range(250))
+    offsets = [
+        call.kwargs["params"].get("offset", 0) for call in mock_get.call_args_list
+    ]
+    assert offsets == [0, 40, 80, 120, 160, 200, 240]
+
+
+def test_prefetch_requests_next_page_in_background():
+    """With prefetch on, the next page is requested before the current one is used."""
+    requested = threading.Event()
+    fetch = _pages(150)
+
+    def fetch_page(limit, offset):
+        if offset:
+            requested.set()
+        return fetch("", params={"limit": limit, "offset": offset})
+
+    items = iter_items(fetch_page, page_size=100, prefetch=True)
+    next(items)
+
+    assert requested.wait(timeout=5)
+    assert len(list(items)) == 149
+
+
+def test_invalid_page_size():
+    """Page sizes below one are rejected immediately."""
+    with pytest.raises(ValueError, match="page_size"):
+        Datawrapper(access_token="token").iter_themes(page_size=0)
+
+
+def test_page_size_above_the_api_maximum():
+    """Page sizes the API would cap are rejected instead of silently shortened."""
+    with pytest.raises(ValueError, match="page_size must be at most 100"):
+        Datawrapper(access_token="token").iter_charts(page_size=200)
+
+
+@pytest.mark.asyncio
+async def test_async_iter_workspace_members():
+    """The async client returns async iterators."""
+    fetch = _pages(120)
+    dw = AsyncDatawrapper(access_token="token")
+
+    async def get(url, params=None, timeout=15):
+        return fetch(url, params=params)
+
+    with patch.object(
+        AsyncDatawrapper, "get", new=AsyncMock(side_effect=get)
+    ) as mock_get:
+        members = [m async for m in dw.iter_workspace_members("news", prefetch=True)]
+
+    assert [member["id"] for member in members] == list(range(120))
+    assert mock_get.await_count == 2
+    assert "/workspaces/news/members" in mock_get.call_args.args[0]
+    await dw.aclose()
+
+
+def test_fan_out_fetches_remaining_pages_concurrently():
+    """With max_workers, pages after the first are in flight together and stay in order."""
+    fetch = _pages(1000)
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+    barrier = threading.Barrier(4, timeout=5)
+
+    def get(url, params=None, timeout=15):
+        nonlocal in_flight, peak
+        offset = int(params.get("offset", 0))
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        try:
+            # The four pages requested right after the first must overlap
+            if 100 <= offset <= 400:
+                barrier.wait()
+            return fetch(url, params=params)
+        finally:
+            with lock:
+                in_flight -= 1
+
+    dw = Datawrapper(access_token="token")
+    with patch.object(Datawrapper, "get", side_effect=get) as mock_get:
+        users = list(dw.iter_users(page_size=100, max_workers=4))
+
+    assert [user["id"] for user in users] == list(range(1000))
+    assert mock_get.call_count == 10
+    assert peak <= 4
+
+
+def test_fan_out_without_total_reads_sequentially():
+    """Endpoints that don't report a total fall back to one page at a time."""
+    dw = Datawrapper(access_token="token")
+
+    with patch.object(
+        Datawrapper, "get", side_effect=_pages(250, report_total=False)
+    ) as mock_get:
+        charts = list(dw.iter_charts(page_size=100, max_workers=8))
+
+    assert [chart["id"] for chart in charts] == list(range(250))
+    assert mock_get.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_async_fan_out():
+    """The async client fans out pages as tasks and keeps them in order."""
+    fetch = _pages(450)
+    dw = AsyncDatawrapper(access_token="token")
+
+    async def get(url, params=None, timeout=15):
+        return fetch(url, params=params)
+
+    with patch.object(
+        AsyncDatawrapper, "get", new=AsyncMock(side_effect=get)
+    ) as mock_get:
+        items = [
+            chart async for chart in dw.iter_recently_edited_charts(7, max_workers=3)
+        ]
+
+    assert [chart["id"] for chart in items] == list(range(450))
+    assert mock_get.await_count == 5
+    await dw.aclose()
+
+
+def test_fan_out_steps_by_the_items_the_server_returns():
+    """When the server caps the limit, the planned pages don't skip any items."""
+    dw = Datawrapper(access_token="token")
+
+    with patch.object(Datawrapper, "get", side_effect=_pages(250, cap=40)) as mock_get:
+        users = list(dw.iter_users(page_size=100, max_workers=4))
+
+    assert [user["id"] for user in users] == list(range(250))
+    assert mock_get.call_count == 7
+
+
+@pytest.mark.asyncio
+async def test_async_fan_out_steps_by_the_items_the_server_returns():
+    """The async fan-out plans its pages by the first page's size too."""
+    fetch = _pages(250, cap=40)
+    dw = AsyncDatawrapper(access_token="token")
+
+    async def get(url, params=None, timeout=15):
+        return fetch(url, params=params)
+
+    with patch.object(AsyncDatawrapper, "get", new=AsyncMock(side_effect=get)):
+        users = [user async for user in dw.iter_users(max_workers=4)]
+
+    assert [user["id"] for user in users] == list(range(250))
+    await dw.aclose()
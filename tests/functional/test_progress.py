@@ -0,0 +1,97 @@
+"""Tests for live progress displays and request statistics."""
+
+from io import StringIO
+from unittest.mock import patch
+
+import httpx
+import pytest
+from rich.console import Console
+
+from datawrapper import (
+    AsyncDatawrapper,
+    BulkProgress,
+    RequestStats,
+    export_many,
+)
+
+URL = "https://api.datawrapper.de/v3/me"
+
+
+def _console():
+    return Console(file=StringIO(), width=160)
+
+
+def test_request_stats():
+    """Requests, bytes, rate-limited responses and failures are counted."""
+    stats = RequestStats()
+    for latency in (0.1, 0.2, 0.3, 0.4, 1.0):
+        stats.record(latency, 200, size=1024)
+    stats.record(0.05, 429)
+    stats.record(0.05, None)
+    stats.add_bytes(1024)
+
+    assert stats.requests == 7
+    assert stats.bytes == 6 * 1024
+    assert stats.throttled == 1
+    assert stats.failures == 1
+    assert stats.percentile(50) == 0.2
+    assert stats.percentile(95) == 1.0
+    assert "p95 1000 ms" in stats.summary()
+    assert "6.0 KiB · 1×429 · 1 failed" in stats.summary()
+
+
+def test_bulk_progress_counts_every_attempt(mock_http):
+    """Retried rate-limited responses show up in the statistics."""
+    session = mock_http.session(
+        mock_http.response(429, headers={"Retry-After": "0"}, content=b""),
+        mock_http.response(payload={"id": 1}),
+    )
+    dw = mock_http.client(session, retry=1)
+
+    with (
+        patch("datawrapper.__main__.time.sleep"),
+        BulkProgress(dw, "Account", total=1, console=_console()) as progress,
+    ):
+        assert list(progress.track([dw.get(URL)])) == [{"id": 1}]
+
+    assert progress.stats.requests == 2
+    assert progress.stats.throttled == 1
+    assert progress.stats.bytes == 9
+    assert dw._stats is None
+
+
+def test_export_many_with_progress(tmp_path, mock_http):
+    """export_many opens one display covering every export."""
+    session = mock_http.session(
+        *(mock_http.response(chunks=[b"abc", b"de"]) for _ in range(2))
+    )
+    dw = mock_http.client(session)
+
+    with patch("datawrapper.bulk.BulkProgress", wraps=BulkProgress) as display:
+        results = export_many(
+            ["abc123", "def456"],
+            formats=["png"],
+            out_dir=tmp_path,
+            client=dw,
+            progress=True,
+        )
+
+    assert all(result.ok for result in results)
+    display.assert_called_once_with(dw, "Exporting charts", total=2)
+    assert dw._stats is None
+
+
+@pytest.mark.asyncio
+async def test_async_requests_are_counted():
+    """The async client records its requests in an open display."""
+
+    def handler(request):
+        return httpx.Response(200, json={"id": 1})
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with AsyncDatawrapper(access_token="token", client=http_client) as dw:
+        with BulkProgress(dw, console=_console()) as progress:
+            assert await dw.get(URL) == {"id": 1}
+
+    assert progress.stats.requests == 1
+    assert progress.stats.bytes == len(b'{"id":1}')
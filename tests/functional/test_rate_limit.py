@@ -0,0 +1,135 @@
+"""Tests for client-side rate limiting."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from datawrapper import Datawrapper, RateLimiter, TokenBucket
+
+
+class FakeClock:
+    """A monotonic clock that only moves when something sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Replace the rate limiter's clock with a fake one."""
+    fake = FakeClock()
+    with (
+        patch("datawrapper.rate_limit.time.monotonic", fake.monotonic),
+        patch("datawrapper.rate_limit.time.sleep", fake.sleep),
+    ):
+        yield fake
+
+
+class TestTokenBucket:
+    """Tests for the token bucket."""
+
+    def test_burst_then_paced(self, clock):
+        """A full bucket allows a burst, then callers wait for refills."""
+        bucket = TokenBucket(rate=2, capacity=2)
+
+        waits = [bucket.acquire() for _ in range(4)]
+
+        assert waits == [0.0, 0.0, 0.5, 0.5]
+        assert clock.now == pytest.approx(1.0)
+
+    def test_refills_over_time(self, clock):
+        """Idle time refills the bucket up to its capacity."""
+        bucket = TokenBucket(rate=1, capacity=3)
+        for _ in range(3):
+            bucket.acquire()
+
+        clock.now += 10
+
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.acquire() == pytest.approx(1.0)
+
+    def test_invalid_arguments(self):
+        """Non-positive rates and oversized requests are rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, capacity=1).acquire(2)
+
+    def test_thread_safe(self):
+        """Concurrent callers never take more tokens than were available."""
+        bucket = TokenBucket(rate=1000, capacity=50)
+        waits: list[float] = []
+
+        def worker():
+            for _ in range(10):
+                waits.append(bucket.reserve())
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(waits) == 50
+        assert bucket._tokens >= -1e-6
+
+
+class TestRateLimiter:
+    """Tests for global and per-endpoint budgets."""
+
+    def test_endpoint_budget_applies_to_matching_urls(self, clock):
+        """Export requests draw from both the export and the global budget."""
+        limiter = RateLimiter(rate=10, endpoints={"/export/": 1})
+
+        export_url = "https://api.datawrapper.de/v3/charts/abc/export/png"
+        assert len(limiter.buckets_for(export_url)) == 2
+        assert len(limiter.buckets_for("https://api.datawrapper.de/v3/me")) == 1
+
+        limiter.acquire(export_url)
+        assert limiter.acquire(export_url) == pytest.approx(1.0)
+
+    def test_no_global_budget(self, clock):
+        """Without a global rate only the listed endpoints are paced."""
+        limiter = RateLimiter(endpoints={"/publish": 1})
+
+        for _ in range(5):
+            assert limiter.acquire("https://api.datawrapper.de/v3/me") == 0.0
+
+
+class TestClientRateLimit:
+    """Tests for pacing the client's requests."""
+
+    def test_number_builds_limiter(self):
+        """A plain number becomes a global requests-per-second budget."""
+        dw = Datawrapper(access_token="token", rate_limit=5)
+        assert isinstance(dw._rate_limiter, RateLimiter)
+        assert dw._rate_limiter.bucket.rate == 5
+
+    def test_every_request_is_paced(self, clock, mock_http):
+        """Each request waits for a token before it is sent."""
+        dw = mock_http.client(rate_limit=TokenBucket(rate=4, capacity=1))
+
+        for _ in range(3):
+            dw.get("https://api.datawrapper.de/v3/me")
+
+        assert clock.sleeps == [0.25, 0.25]
+
+    def test_shared_limiter_spans_clients(self, clock, mock_http):
+        """Two clients sharing a limiter share its budget."""
+        limiter = RateLimiter(rate=1)
+        first = mock_http.client(rate_limit=limiter)
+        second = mock_http.client(rate_limit=limiter)
+
+        first.get("https://api.datawrapper.de/v3/me")
+        second.get("https://api.datawrapper.de/v3/me")
+
+        assert clock.sleeps == [1.0]
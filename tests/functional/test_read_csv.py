@@ -0,0 +1,94 @@
+"""Tests for parsing chart data returned by the API."""
+
+from io import StringIO
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from datawrapper import BarChart, Datawrapper
+from datawrapper.data_io import dtype_schema, read_csv_data, sniff_delimiter
+
+DATA_URL = "https://api.datawrapper.de/v3/charts/abc123/data"
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (b"a,b,c\n1,2,3\n", ","),
+        (b"a\tb\tc\n1\t2\t3\n", "\t"),
+        ("a;b\n1,5;2,5\n", ";"),
+        (b'"City, State"\tPopulation\n"Austin, TX"\t961855\n', "\t"),
+        (b"value\n1\n", ","),
+        (b"a|b", "|"),
+    ],
+)
+def test_sniff_delimiter(data, expected):
+    """The delimiter is read from the header line, ignoring quoted names."""
+    assert sniff_delimiter(data) == expected
+
+
+def test_read_csv_data_matches_the_python_sniffer():
+    """The C parser gives the same frame as the slower python engine."""
+    data = 'Country\tValue\tNote\n"Germany"\t1.5\t"a, b"\nFrance\t2\t\n'
+
+    expected = pd.read_csv(StringIO(data), sep=None, engine="python")
+
+    pd.testing.assert_frame_equal(read_csv_data(data.encode()), expected)
+    pd.testing.assert_frame_equal(BarChart.deserialize_data(data), expected)
+
+
+def test_get_parses_tab_separated_responses(mock_http):
+    """CSV responses are parsed from the raw body with the sniffed delimiter."""
+    response = mock_http.response(
+        content_type="text/csv; charset=utf-8",
+        content="Stadt\tWert\nKöln\t3\n".encode(),
+    )
+
+    df = mock_http.client(mock_http.session(response)).get(DATA_URL)
+
+    assert list(df.columns) == ["Stadt", "Wert"]
+    assert df.to_dict("records") == [{"Stadt": "Köln", "Wert": 3}]
+
+
+def test_pyarrow_backend():
+    """dtype_backend="pyarrow" stores every column in Arrow memory."""
+    pytest.importorskip("pyarrow")
+
+    df = read_csv_data(b"name\tvalue\nA\t1\nB\t\n", dtype_backend="pyarrow")
+
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+    assert df["value"].isna().tolist() == [False, True]
+
+
+def test_dtype_schema_round_trip():
+    """A saved schema parses the next load with the same types."""
+    data = b"code,value\n01,1.5\n02,2\n"
+    schema = {"code": "str", "value": "float64"}
+
+    df = read_csv_data(data, dtype=schema)
+
+    assert df["code"].tolist() == ["01", "02"]
+    assert dtype_schema(df) == schema
+
+
+def test_chart_get_parses_data_with_options():
+    """Charts fetched with dtype options request the data unparsed."""
+    metadata = {"id": "abc123", "type": "d3-bars", "metadata": {}}
+
+    def get(url, raw=False):
+        if url.endswith("/data"):
+            assert raw is True
+            return b"label,value\n01,1\n"
+        return metadata
+
+    with patch.object(Datawrapper, "get", side_effect=get):
+        chart = BarChart.get(
+            "abc123",
+            access_token="token",
+            dtype={"label": "str"},
+            dtype_backend="numpy_nullable",
+        )
+
+    assert chart.data["label"].tolist() == ["01"]
+    assert str(chart.data["value"].dtype) == "Int64"
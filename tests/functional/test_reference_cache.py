@@ -0,0 +1,129 @@
+"""Tests for caching reference data such as themes, basemaps and folders."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from datawrapper import AsyncDatawrapper, Datawrapper, ReferenceCache
+
+
+def test_reference_calls_are_cached():
+    """Repeated reference lookups only reach the API once."""
+    dw = Datawrapper(access_token="token", reference_cache=True)
+
+    with patch.object(Datawrapper, "get", return_value={"list": []}) as mock_get:
+        for _ in range(3):
+            dw.get_themes()
+            dw.get_basemaps()
+            dw.get_folders()
+            dw.get_token_scopes()
+            dw.get_my_account()
+
+    assert mock_get.call_count == 5
+
+
+def test_arguments_are_cached_separately():
+    """Calls with different arguments get their own entries."""
+    dw = Datawrapper(access_token="token", reference_cache=True)
+
+    with patch.object(Datawrapper, "get", return_value={}) as mock_get:
+        dw.get_basemap("world-2019")
+        dw.get_basemap("world-2019", wgs84=True)
+        dw.get_basemap("world-2019")
+        dw.get_themes(offset=100)
+        dw.get_themes()
+
+    assert mock_get.call_count == 4
+
+
+def test_cached_values_are_copies():
+    """Changing a returned value doesn't change the cached one."""
+    dw = Datawrapper(access_token="token", reference_cache=True)
+
+    with patch.object(Datawrapper, "get", return_value={"list": [{"id": 1}]}):
+        dw.get_folders()["list"].clear()
+
+        assert dw.get_folders() == {"list": [{"id": 1}]}
+
+
+def test_entries_expire_after_ttl():
+    """Entries are fetched again once their category's TTL has passed."""
+    cache = ReferenceCache(ttl={"folders": 10})
+    dw = Datawrapper(access_token="token", reference_cache=cache)
+
+    with (
+        patch.object(Datawrapper, "get", return_value={}) as mock_get,
+        patch("datawrapper.reference_cache.time.monotonic", side_effect=[0, 5, 11, 11]),
+    ):
+        dw.get_folders()
+        dw.get_folders()
+        dw.get_folders()
+
+    assert mock_get.call_count == 2
+    assert cache.ttls["themes"] == 3600
+
+
+def test_folder_changes_invalidate_folders():
+    """Changing folders through the client clears the cached folder list."""
+    dw = Datawrapper(access_token="token", reference_cache=True)
+
+    with (
+        patch.object(Datawrapper, "get", return_value={}) as mock_get,
+        patch.object(Datawrapper, "post", return_value={"id": 1}),
+        patch.object(Datawrapper, "patch", return_value={"id": 1}),
+        patch.object(Datawrapper, "delete", return_value=True),
+    ):
+        dw.get_folders()
+        dw.get_themes()
+        dw.create_folder("New")
+        dw.get_folders()
+        dw.update_folder(1, name="Renamed")
+        dw.get_folders()
+        dw.delete_folder(1)
+        dw.get_folders()
+        dw.get_themes()
+
+    assert mock_get.call_count == 5
+
+
+def test_explicit_invalidation():
+    """invalidate_reference_cache drops one category or everything."""
+    dw = Datawrapper(access_token="token", reference_cache=True)
+
+    with patch.object(Datawrapper, "get", return_value={}) as mock_get:
+        dw.get_themes()
+        dw.get_my_account()
+        dw.invalidate_reference_cache("themes")
+        dw.get_themes()
+        dw.get_my_account()
+        dw.invalidate_reference_cache()
+        dw.get_themes()
+        dw.get_my_account()
+
+    assert mock_get.call_count == 5
+
+
+def test_invalid_ttls():
+    """Unknown categories and negative TTLs are rejected."""
+    with pytest.raises(ValueError, match="Unknown reference categories"):
+        ReferenceCache(ttl={"charts": 10})
+    with pytest.raises(ValueError, match="must not be negative"):
+        ReferenceCache(ttl=-1)
+
+
+@pytest.mark.asyncio
+async def test_async_client_caches_and_invalidates():
+    """The async client awaits fetches and invalidates once changes complete."""
+    dw = AsyncDatawrapper(access_token="token", reference_cache=True)
+
+    with (
+        patch.object(AsyncDatawrapper, "get", new=AsyncMock(return_value={})) as get,
+        patch.object(AsyncDatawrapper, "patch", new=AsyncMock(return_value={})),
+    ):
+        await dw.get_folders()
+        await dw.get_folders()
+        await dw.move_chart("abc123", 1)
+        await dw.get_folders()
+
+    assert get.await_count == 2
+    await dw.aclose()
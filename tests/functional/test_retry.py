@@ -0,0 +1,169 @@
+"""Tests for retrying rate-limited and failed requests."""
+
+import time
+from email.utils import formatdate
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from datawrapper import RetryPolicy
+from datawrapper.exceptions import FailedRequestError, RateLimitError
+from datawrapper.retry import parse_retry_after
+
+URL = "https://api.datawrapper.de/v3/charts/abc123"
+
+
+class TestParseRetryAfter:
+    """Tests for reading server-requested waits from headers."""
+
+    def test_seconds(self):
+        """Retry-After given in seconds is returned as a float."""
+        assert parse_retry_after({"Retry-After": "7"}) == 7.0
+
+    def test_http_date(self):
+        """Retry-After given as an HTTP date is converted to a delay."""
+        delay = parse_retry_after({"Retry-After": formatdate(time.time() + 30)})
+        assert delay is not None
+        assert 25 <= delay <= 31
+
+    def test_rate_limit_reset_epoch(self):
+        """An exhausted X-RateLimit budget waits until the reset timestamp."""
+        headers = {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 10),
+        }
+        delay = parse_retry_after(headers)
+        assert delay is not None
+        assert 8 <= delay <= 11
+
+    def test_rate_limit_not_exhausted(self):
+        """Remaining budget means there is nothing to wait for."""
+        headers = {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "10"}
+        assert parse_retry_after(headers) is None
+
+    def test_missing_or_garbage(self):
+        """Missing or unreadable headers return None."""
+        assert parse_retry_after({}) is None
+        assert parse_retry_after(None) is None
+        assert parse_retry_after({"Retry-After": "soon"}) is None
+
+
+class TestRetryPolicy:
+    """Tests for the retry decisions and backoff calculation."""
+
+    def test_backoff_is_exponential_and_capped(self):
+        """Delays double each attempt and never exceed backoff_max."""
+        policy = RetryPolicy(backoff_factor=1.0, backoff_max=5.0, jitter=0)
+        assert [policy.get_backoff(n) for n in range(4)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_jitter_shortens_delay(self):
+        """Jitter only ever shortens the delay."""
+        policy = RetryPolicy(backoff_factor=1.0, jitter=1.0)
+        for _ in range(20):
+            assert 0 <= policy.get_backoff(2) <= 4.0
+
+    def test_retry_after_takes_precedence(self):
+        """Server-requested waits replace the computed backoff, up to a cap."""
+        policy = RetryPolicy(max_retry_after=10)
+        assert policy.get_delay(0, {"Retry-After": "3"}) == 3.0
+        assert policy.get_delay(0, {"Retry-After": "3600"}) == 10.0
+
+    def test_post_server_errors_not_retried(self):
+        """A POST is retried on 429 but not on a server error."""
+        policy = RetryPolicy()
+        assert policy.should_retry_status("POST", 429, 0)
+        assert not policy.should_retry_status("POST", 503, 0)
+        assert policy.should_retry_status("GET", 503, 0)
+
+    def test_budget_is_respected(self):
+        """No retries are allowed once the budget is spent."""
+        policy = RetryPolicy(max_retries=2)
+        assert policy.should_retry_status("GET", 429, 1)
+        assert not policy.should_retry_status("GET", 429, 2)
+
+
+class TestClientRetries:
+    """Tests for the retry loop in the client's request methods."""
+
+    def test_no_retry_by_default(self, mock_http):
+        """Without a policy a 429 raises immediately."""
+        session = mock_http.session(mock_http.response(429))
+
+        with pytest.raises(RateLimitError):
+            mock_http.client(session).get(URL)
+
+        assert session.request.call_count == 1
+
+    def test_retries_429_then_succeeds(self, mock_http):
+        """A rate-limited request is sent again after the Retry-After delay."""
+        session = mock_http.session(
+            mock_http.response(429, headers={"Retry-After": "2"}),
+            mock_http.response(200, payload={"id": "abc123"}),
+        )
+
+        with patch("datawrapper.__main__.time.sleep") as mock_sleep:
+            result = mock_http.client(session, retry=RetryPolicy()).get(URL)
+
+        assert result == {"id": "abc123"}
+        mock_sleep.assert_called_once_with(2.0)
+
+    def test_integer_shorthand(self, mock_http):
+        """An integer retry budget builds a default policy."""
+        session = mock_http.session(mock_http.response(503))
+
+        with patch("datawrapper.__main__.time.sleep") as mock_sleep:
+            with pytest.raises(FailedRequestError):
+                mock_http.client(session, retry=2).get(URL)
+
+        assert session.request.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    def test_custom_statuses(self, mock_http):
+        """Only the configured status codes are retried."""
+        session = mock_http.session(mock_http.response(503))
+        policy = RetryPolicy(retry_statuses={429})
+
+        with patch("datawrapper.__main__.time.sleep") as mock_sleep:
+            with pytest.raises(FailedRequestError):
+                mock_http.client(session, retry=policy).get(URL)
+
+        assert session.request.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_connection_errors_are_retried(self, mock_http):
+        """Connection failures are retried for idempotent methods."""
+        session = mock_http.session(
+            requests.ConnectionError("reset"),
+            mock_http.response(200),
+        )
+
+        with patch("datawrapper.__main__.time.sleep"):
+            assert (
+                mock_http.client(session, retry=RetryPolicy()).put(URL, data={"a": 1})
+                is True
+            )
+
+        assert session.request.call_count == 2
+
+    def test_connection_errors_reraised_for_post(self, mock_http):
+        """A POST that failed to connect is not resent."""
+        session = mock_http.session()
+        session.request.side_effect = requests.ConnectionError("reset")
+
+        with patch("datawrapper.__main__.time.sleep") as mock_sleep:
+            with pytest.raises(requests.ConnectionError):
+                mock_http.client(session, retry=RetryPolicy()).post(URL, data={"a": 1})
+
+        mock_sleep.assert_not_called()
+
+    def test_rate_limit_error_exposes_retry_after(self, mock_http):
+        """RateLimitError carries the server-requested wait."""
+        session = mock_http.session(
+            mock_http.response(429, headers={"Retry-After": "12"})
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            mock_http.client(session).get(URL)
+
+        assert exc_info.value.retry_after == 12.0
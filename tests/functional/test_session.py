@@ -0,0 +1,79 @@
+"""Tests for the pooled HTTP session owned by the Datawrapper client."""
+
+from unittest.mock import patch
+
+import requests
+
+from datawrapper import Datawrapper
+
+
+def test_default_clients_share_one_session():
+    """Clients created without pool settings reuse the process-wide session."""
+    first = Datawrapper(access_token="one")
+    second = Datawrapper(access_token="two")
+
+    assert first.session is second.session
+    assert isinstance(first.session, requests.Session)
+
+
+def test_pool_settings_create_dedicated_session():
+    """Passing pool settings gives the client its own configured adapter."""
+    dw = Datawrapper(access_token="token", pool_maxsize=32, pool_block=True)
+
+    assert dw.session is not Datawrapper(access_token="token").session
+    adapter = dw.session.get_adapter("https://api.datawrapper.de")
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+
+
+def test_keep_alive_disabled_sets_connection_header():
+    """Disabling keep-alive asks the server to close each connection."""
+    dw = Datawrapper(access_token="token", keep_alive=False)
+
+    assert dw.session.headers["Connection"] == "close"
+
+
+def test_custom_session_is_used_and_not_closed(mock_http):
+    """A caller-provided session receives every request and stays open."""
+    session = mock_http.session(mock_http.response(payload={"id": "abc123"}))
+
+    with mock_http.client(session) as dw:
+        result = dw.get("https://api.datawrapper.de/v3/charts/abc123")
+
+    assert result == {"id": "abc123"}
+    method, url = session.request.call_args.args
+    assert method == "GET"
+    assert url == "https://api.datawrapper.de/v3/charts/abc123"
+    session.close.assert_not_called()
+
+
+def test_close_only_closes_owned_session():
+    """close() shuts down dedicated pools but never the shared one."""
+    dedicated = Datawrapper(access_token="token", pool_connections=2)
+    shared = Datawrapper(access_token="token")
+
+    with (
+        patch.object(dedicated.session, "close") as mock_dedicated_close,
+        patch.object(shared.session, "close") as mock_shared_close,
+    ):
+        dedicated.close()
+        shared.close()
+
+    mock_dedicated_close.assert_called_once()
+    mock_shared_close.assert_not_called()
+
+
+def test_all_verbs_go_through_session(mock_http):
+    """Every HTTP verb is dispatched via the session's request method."""
+    session = mock_http.session(mock_http.response(payload={"ok": True}))
+    dw = mock_http.client(session)
+    url = "https://api.datawrapper.de/v3/charts/abc123"
+
+    dw.get(url)
+    dw.post(url, data={"title": "Test"})
+    dw.patch(url, data={"title": "Test"})
+    dw.put(url, data={"title": "Test"})
+    dw.delete(url)
+
+    methods = [call.args[0] for call in session.request.call_args_list]
+    assert methods == ["GET", "POST", "PATCH", "PUT", "DELETE"]
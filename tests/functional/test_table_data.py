@@ -0,0 +1,73 @@
+"""Tests for chart data held in polars DataFrames and pyarrow Tables."""
+
+from io import BytesIO
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from datawrapper import BarChart, Datawrapper
+from datawrapper.data_io import CSVStream, write_csv_data
+
+pa = pytest.importorskip("pyarrow")
+pl = pytest.importorskip("polars")
+
+ROWS = {"label": ["A, quoted", "B", "C"], "value": [1.5, None, 3.0]}
+
+
+@pytest.fixture(params=["polars", "pyarrow"])
+def table(request):
+    """The same rows as a polars DataFrame or a pyarrow Table."""
+    if request.param == "polars":
+        return pl.DataFrame(ROWS)
+    return pa.table(ROWS)
+
+
+def test_stream_matches_full_csv(table):
+    """Streamed chunks join up to the library's own CSV encoding."""
+    chunks = list(CSVStream(table, chunk_rows=2))
+
+    assert len(chunks) == 3
+    assert b"".join(chunks) == write_csv_data(table)
+    parsed = pd.read_csv(BytesIO(b"".join(chunks)))
+    pd.testing.assert_frame_equal(parsed, pd.DataFrame(ROWS))
+
+
+def test_chart_keeps_tables_as_they_are(table):
+    """Charts hold tables without converting them to pandas."""
+    chart = BarChart(title="Sales", data=table)
+
+    assert chart.data is table
+    assert chart.serialize_data() == write_csv_data(table).decode()
+    assert BarChart(data=table.slice(0, 0)).serialize_data() is None
+
+    with pytest.raises(ValueError):
+        BarChart(data="not a table")
+
+
+def test_upload_streams_tables(table, mock_http):
+    """upload_data() streams tables with their own CSV writer."""
+    session = mock_http.session(mock_http.response())
+    dw = mock_http.client(session)
+
+    with patch.object(pd.DataFrame, "to_csv") as to_csv:
+        dw.upload_data("abc123", table)
+        body = b"".join(session.request.call_args.kwargs["data"])
+
+    to_csv.assert_not_called()
+    assert body == write_csv_data(table)
+
+
+def test_update_only_uploads_changed_tables(table):
+    """Table data is fingerprinted, so unchanged tables aren't uploaded again."""
+    chart = BarChart(chart_id="abc123", title="Sales", data=table)
+    chart._mark_synced()
+
+    with patch.object(Datawrapper, "upload_data") as upload_data:
+        chart.update(access_token="token")
+        upload_data.assert_not_called()
+
+        chart.data = table.slice(0, 2)
+        chart.update(access_token="token")
+
+    assert upload_data.call_args.args[1] is chart.data
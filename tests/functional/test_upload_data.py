@@ -0,0 +1,227 @@
+"""Tests for streaming chart data uploads."""
+
+from unittest.mock import patch
+
+import httpx
+import numpy as np
+import pandas as pd
+import pytest
+
+from datawrapper import AsyncDatawrapper, Datawrapper, RetryPolicy
+from datawrapper.data_io import CSVStream
+from datawrapper.exceptions import FailedRequestError
+
+DATA_URL = "https://api.datawrapper.de/v3/charts/abc123/data"
+
+
+def _frame(rows=1000):
+    """Build a DataFrame with the column types charts usually hold."""
+    return pd.DataFrame(
+        {
+            "label": [f"Row {i}, quoted" for i in range(rows)],
+            "value": np.arange(rows) / 7,
+            "date": pd.date_range("2024-01-01", periods=rows, freq="h"),
+            "missing": [None, 1.5] * (rows // 2),
+        }
+    )
+
+
+class TestCSVStream:
+    """Tests for encoding DataFrames as CSV chunks."""
+
+    def test_matches_to_csv(self):
+        """The joined chunks equal DataFrame.to_csv(index=False)."""
+        df = _frame()
+
+        assert b"".join(CSVStream(df, chunk_rows=33)) == df.to_csv(index=False).encode(
+            "utf-8"
+        )
+
+    def test_yields_header_then_row_chunks(self):
+        """The header comes first, followed by one chunk per chunk_rows rows."""
+        chunks = list(CSVStream(pd.DataFrame({"a": range(5)}), chunk_rows=2))
+
+        assert chunks == [b"a\n", b"0\n1\n", b"2\n3\n", b"4\n"]
+
+    def test_can_be_iterated_again(self):
+        """A stream can be replayed, which a retried upload needs."""
+        stream = CSVStream(pd.DataFrame({"a": [1, 2]}))
+
+        assert list(stream) == list(stream)
+
+    def test_accepts_records(self):
+        """Lists of dicts are encoded like the equivalent DataFrame."""
+        stream = CSVStream([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}])
+
+        assert b"".join(stream) == b"a,b\n1,x\n2,y\n"
+
+    def test_rejects_non_positive_chunk_rows(self):
+        """chunk_rows must be at least one."""
+        with pytest.raises(ValueError, match="chunk_rows must be at least 1"):
+            CSVStream(pd.DataFrame({"a": [1]}), chunk_rows=0)
+
+
+class TestUploadData:
+    """Tests for Datawrapper.upload_data."""
+
+    def test_dataframe_is_streamed(self, mock_http):
+        """DataFrames are sent as a chunked CSV stream, not one string."""
+        session = mock_http.session(mock_http.response(200))
+        dw = mock_http.client(session)
+        df = _frame()
+
+        assert dw.upload_data("abc123", df, chunk_rows=100) is True
+
+        (method, url), kwargs = session.request.call_args
+        assert (method, url) == ("PUT", DATA_URL)
+        assert kwargs["headers"]["content-type"] == "text/csv"
+        assert isinstance(kwargs["data"], CSVStream)
+        assert b"".join(kwargs["data"]) == df.to_csv(index=False).encode("utf-8")
+
+    def test_string_is_encoded(self, mock_http):
+        """CSV text is sent as UTF-8 bytes."""
+        session = mock_http.session(mock_http.response(200))
+        dw = mock_http.client(session)
+
+        dw.upload_data("abc123", "a,b\n1,ü\n")
+
+        assert session.request.call_args.kwargs["data"] == "a,b\n1,ü\n".encode()
+
+    def test_list_of_byte_chunks_is_sent_as_is(self, mock_http):
+        """Lists of byte chunks are sent unchanged, not encoded as records."""
+        session = mock_http.session(mock_http.response(200))
+        dw = mock_http.client(session)
+        chunks = [b"a,b\n", b"1,2\n"]
+
+        dw.upload_data("abc123", chunks)
+        dw.upload_data("abc123", [{"a": 1, "b": 2}])
+
+        first, second = session.request.call_args_list
+        assert first.kwargs["data"] is chunks
+        assert b"".join(second.kwargs["data"]) == b"a,b\n1,2\n"
+
+    def test_add_data_streams_dataframes(self, mock_http):
+        """The deprecated add_data() goes through the same streaming upload."""
+        session = mock_http.session(mock_http.response(200))
+        dw = mock_http.client(session)
+
+        dw.add_data("abc123", pd.DataFrame({"a": [1]}))
+
+        assert isinstance(session.request.call_args.kwargs["data"], CSVStream)
+
+    def test_replayable_body_is_retried(self, mock_http):
+        """A failed DataFrame upload is retried with the full body."""
+        session = mock_http.session()
+        bodies = []
+
+        def request(method, url, **kwargs):
+            bodies.append(b"".join(kwargs["data"]))
+            return mock_http.response(503 if len(bodies) == 1 else 200)
+
+        session.request.side_effect = request
+        dw = Datawrapper(
+            access_token="token", session=session, retry=RetryPolicy(max_retries=2)
+        )
+
+        with patch("datawrapper.__main__.time.sleep"):
+            assert dw.upload_data("abc123", pd.DataFrame({"a": [1, 2]})) is True
+
+        assert bodies == [b"a\n1\n2\n", b"a\n1\n2\n"]
+
+    def test_one_shot_iterator_is_not_retried(self, mock_http):
+        """A generator body cannot be replayed, so it is not retried."""
+        session = mock_http.session(mock_http.response(503))
+        dw = Datawrapper(
+            access_token="token", session=session, retry=RetryPolicy(max_retries=3)
+        )
+
+        with pytest.raises(FailedRequestError):
+            dw.upload_data("abc123", (chunk for chunk in [b"a\n", b"1\n"]))
+
+        assert session.request.call_count == 1
+
+
+class TestRawData:
+    """Tests for reading, writing and copying chart data without pandas."""
+
+    def test_get_data_raw_returns_bytes(self, mock_http):
+        """raw=True returns the body as stored instead of a DataFrame."""
+        response = mock_http.response(200)
+        response.headers = {"content-type": "text/csv"}
+        response.content = b"a;b\n1;2\n"
+        session = mock_http.session(response)
+        dw = mock_http.client(session)
+
+        with patch("datawrapper.__main__.read_csv_data") as read_csv_data:
+            assert dw.get_data("abc123", raw=True) == b"a;b\n1;2\n"
+
+        read_csv_data.assert_not_called()
+
+    def test_copy_data_streams_between_charts(self, mock_http):
+        """The source body is forwarded chunk by chunk as the upload body."""
+        source = mock_http.response(200, content_type="text/csv")
+        source.iter_content.return_value = iter([b"a,b\n", b"1,2\n"])
+        uploaded = []
+
+        def request(method, url, **kwargs):
+            if method == "GET":
+                assert url == DATA_URL
+                assert kwargs["stream"] is True
+                return source
+            assert url == "https://api.datawrapper.de/v3/charts/def456/data"
+            assert kwargs["headers"]["content-type"] == "text/csv"
+            uploaded.append(b"".join(kwargs["data"]))
+            return mock_http.response(200)
+
+        session = mock_http.session()
+        session.request.side_effect = request
+        dw = mock_http.client(session)
+
+        assert dw.copy_data("abc123", "def456") is True
+
+        assert uploaded == [b"a,b\n1,2\n"]
+        source.close.assert_called_once()
+
+    def test_copy_data_keeps_the_content_type(self, mock_http):
+        """JSON data, such as a locator map's markers, isn't relabelled as CSV."""
+        source = mock_http.response(200, chunks=[b'{"markers": []}'])
+        session = mock_http.session(source, mock_http.response(200))
+        dw = mock_http.client(session)
+
+        assert dw.copy_data("abc123", "def456") is True
+
+        upload = session.request.call_args.kwargs
+        assert upload["headers"]["content-type"] == "application/json"
+
+    def test_copy_data_raises_when_the_source_fails(self, mock_http):
+        """Nothing is uploaded if the source can't be read."""
+        session = mock_http.session(mock_http.response(404))
+        dw = mock_http.client(session)
+
+        with pytest.raises(FailedRequestError):
+            dw.copy_data("abc123", "def456")
+
+        assert session.request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_async_copy_data(self):
+        """The async client streams the source body and its type into the upload."""
+        uploaded = []
+
+        async def handler(request):
+            if request.method == "GET":
+                return httpx.Response(
+                    200,
+                    content=b'{"markers": []}',
+                    headers={"content-type": "application/json"},
+                )
+            assert request.headers["content-type"] == "application/json"
+            uploaded.append(await request.aread())
+            return httpx.Response(204)
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncDatawrapper(access_token="token", client=http_client) as dw:
+            assert await dw.copy_data("abc123", "def456") is True
+            assert await dw.get_data("abc123", raw=True) == b'{"markers": []}'
+
+        assert uploaded == [b'{"markers": []}']
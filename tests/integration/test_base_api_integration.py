@@ -233,3 +233,101 @@ class TestBaseChartAPIIntegration:
             assert mock_client.update_chart.call_count == 1  # Chart update via update()
             assert mock_client.patch.call_count == 0  # No longer used
             assert mock_client.put.call_count == 0  # No longer used
+
+
+class TestBaseChartDirtyTracking:
+    """Test that update() only sends what changed since the last sync."""
+
+    @staticmethod
+    def _created_chart(mock_client):
+        """Create a chart with data through the mock client."""
+        chart = BaseChart(
+            **{
+                "chart-type": "d3-bars",
+                "title": "Initial Title",
+                "intro": "Initial intro",
+                "data": pd.DataFrame({"x": [1, 2], "y": [3, 4]}),
+            }
+        )
+        mock_client.create_chart.return_value = {"id": "tracked-id"}
+        mock_client.update_chart.return_value = {"id": "tracked-id"}
+        mock_client._CHARTS_URL = "https://api.datawrapper.de/v3/charts"
+        chart._client = mock_client
+        return chart.create()
+
+    def test_unchanged_chart_sends_nothing(self):
+        """Test update() makes no requests when nothing changed."""
+        mock_client = Mock()
+        chart = self._created_chart(mock_client)
+
+        chart.update()
+
+        mock_client.update_chart.assert_not_called()
+        mock_client.upload_data.assert_not_called()
+
+    def test_metadata_change_sends_minimal_patch(self):
+        """Test update() sends only the changed fields and skips unchanged data."""
+        mock_client = Mock()
+        chart = self._created_chart(mock_client)
+
+        chart.intro = "Updated intro"
+        chart.update()
+
+        mock_client.update_chart.assert_called_once_with(
+            chart_id="tracked-id",
+            data=None,
+            title=None,
+            chart_type=None,
+            theme=None,
+            language=None,
+            metadata={"describe": {"intro": "Updated intro"}},
+        )
+
+    def test_data_change_only_uploads_data(self):
+        """Test update() uploads just the data when only the data changed."""
+        mock_client = Mock()
+        chart = self._created_chart(mock_client)
+
+        chart.data = pd.DataFrame({"x": [1, 2], "y": [3, 5]})
+        chart.update()
+
+        mock_client.update_chart.assert_not_called()
+        mock_client.upload_data.assert_called_once()
+        chart_id, data = mock_client.upload_data.call_args[0]
+        assert chart_id == "tracked-id"
+        assert data.to_dict("list") == {"x": [1, 2], "y": [3, 5]}
+
+    def test_in_place_data_edit_is_detected(self):
+        """Test update() notices a DataFrame edited in place."""
+        mock_client = Mock()
+        chart = self._created_chart(mock_client)
+
+        chart.data.loc[0, "y"] = 99
+        chart.update()
+
+        mock_client.upload_data.assert_called_once()
+
+    def test_changes_are_forgotten_after_update(self):
+        """Test a second update() without new changes sends nothing."""
+        mock_client = Mock()
+        chart = self._created_chart(mock_client)
+
+        chart.title = "Updated Title"
+        chart.update()
+        chart.update()
+
+        mock_client.update_chart.assert_called_once()
+        assert mock_client.update_chart.call_args[1]["title"] == "Updated Title"
+
+    def test_force_sends_everything(self):
+        """Test update(force=True) sends all metadata and data."""
+        mock_client = Mock()
+        chart = self._created_chart(mock_client)
+
+        chart.update(force=True)
+
+        call_kwargs = mock_client.update_chart.call_args[1]
+        assert call_kwargs["title"] == "Initial Title"
+        assert call_kwargs["chart_type"] == "d3-bars"
+        assert call_kwargs["data"].to_dict("list") == {"x": [1, 2], "y": [3, 4]}
+        assert call_kwargs["metadata"]["describe"]["intro"] == "Initial intro"
@@ -0,0 +1,228 @@
+"""Integration tests for the async BaseChart methods."""
+
+import json
+import warnings
+
+import pandas as pd
+import pytest
+
+from datawrapper import AsyncDatawrapper, BarChart, BaseChart, LineChart
+
+httpx = pytest.importorskip("httpx")
+
+CHARTS_PATH = "/v3/charts"
+
+METADATA = {
+    "id": "abc12",
+    "type": "d3-bars",
+    "title": "Test Chart",
+    "metadata": {
+        "data": {},
+        "describe": {},
+        "visualize": {},
+        "publish": {"blocks": {}},
+        "annotate": {},
+    },
+}
+
+
+class FakeAPI:
+    """Answers async client requests like the Datawrapper API and records them."""
+
+    def __init__(self, metadata=None, csv="a,b\n1,2\n"):
+        self.metadata = metadata or METADATA
+        self.csv = csv
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        path = request.url.path
+        if request.method == "GET" and path.endswith("/data"):
+            return httpx.Response(
+                200, content=self.csv.encode(), headers={"content-type": "text/csv"}
+            )
+        if request.method == "GET" and "/export/" in path:
+            return httpx.Response(
+                200, content=b"\x89PNG", headers={"content-type": "image/png"}
+            )
+        if request.method == "GET":
+            chart_id = path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={**self.metadata, "id": chart_id})
+        if request.method == "POST" and path == CHARTS_PATH:
+            return httpx.Response(201, json={"id": "new01"})
+        if request.method == "POST" and path.endswith(("/copy", "/fork")):
+            return httpx.Response(201, json={"id": "copy1"})
+        if request.method == "POST" and path.endswith("/publish"):
+            return httpx.Response(200, json={"data": {"id": "abc12"}})
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(200, json={"id": path.split("/")[3]})
+
+    def calls(self):
+        return [(r.method, r.url.path) for r in self.requests]
+
+
+@pytest.fixture
+def api():
+    return FakeAPI()
+
+
+@pytest.fixture
+def client(api):
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(api))
+    return AsyncDatawrapper(access_token="token", client=http_client)
+
+
+@pytest.mark.asyncio
+async def test_aget_fetches_metadata_and_data(api, client):
+    """aget() builds the chart from concurrent metadata and data requests."""
+    chart = await BarChart.aget("abc12", client=client)
+
+    assert isinstance(chart, BarChart)
+    assert chart.chart_id == "abc12"
+    assert chart.title == "Test Chart"
+    assert isinstance(chart.data, pd.DataFrame)
+    assert list(chart.data.columns) == ["a", "b"]
+    assert chart._async_client is client
+    assert sorted(api.calls()) == [
+        ("GET", f"{CHARTS_PATH}/abc12"),
+        ("GET", f"{CHARTS_PATH}/abc12/data"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_calls_without_a_client_close_the_pool_they_open(api, monkeypatch):
+    """Without a client, each call opens its own pool and closes it when done."""
+    opened = []
+    real_async_client = httpx.AsyncClient
+
+    def async_client(**kwargs):
+        http_client = real_async_client(transport=httpx.MockTransport(api))
+        opened.append(http_client)
+        return http_client
+
+    monkeypatch.setattr(httpx, "AsyncClient", async_client)
+
+    chart = await BarChart.aget("abc12", access_token="token")
+    await chart.apublish(access_token="token")
+
+    assert len(opened) == 2
+    assert all(http_client.is_closed for http_client in opened)
+    assert chart._async_client is None
+
+
+@pytest.mark.asyncio
+async def test_aget_validates_chart_type(client):
+    """aget() rejects charts of another type, like get()."""
+    with pytest.raises(ValueError, match="Chart type mismatch"):
+        await LineChart.aget("abc12", client=client)
+
+
+@pytest.mark.asyncio
+async def test_aget_wraps_data_errors():
+    """A failed data request is reported with the same message as get()."""
+
+    def handler(request):
+        if request.url.path.endswith("/data"):
+            return httpx.Response(500, text="boom")
+        return httpx.Response(200, json=METADATA)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = AsyncDatawrapper(access_token="token", client=http_client)
+
+    with pytest.raises(Exception, match="Failed to fetch chart data"):
+        await BaseChart.aget("abc12", client=client)
+
+
+@pytest.mark.asyncio
+async def test_aget_requires_token(monkeypatch):
+    """aget() needs a token when no client is given."""
+    monkeypatch.delenv("DATAWRAPPER_ACCESS_TOKEN", raising=False)
+
+    with pytest.raises(ValueError, match="No Datawrapper access token provided"):
+        await BarChart.aget("abc12")
+
+
+@pytest.mark.asyncio
+async def test_acreate_aupdate_apublish(api, client):
+    """The async CRUD methods send the same requests as their sync versions."""
+    chart = BarChart(title="Test Chart", data=pd.DataFrame({"a": [1], "b": [2]}))
+
+    assert await chart.acreate(client=client) is chart
+    assert chart.chart_id == "new01"
+
+    chart.title = "Renamed"
+    await chart.aupdate()
+    await chart.apublish()
+
+    # Only the changed title is sent, and the unchanged data is not uploaded again
+    assert api.calls() == [
+        ("POST", CHARTS_PATH),
+        ("PUT", f"{CHARTS_PATH}/new01/data"),
+        ("PATCH", f"{CHARTS_PATH}/new01"),
+        ("POST", f"{CHARTS_PATH}/new01/publish"),
+    ]
+    assert json.loads(api.requests[2].content) == {"title": "Renamed"}
+
+
+@pytest.mark.asyncio
+async def test_aexport_png_params(api, client):
+    """aexport_png() sends the same query parameters as export_png()."""
+    chart = BarChart(title="Test Chart", chart_id="abc12")
+
+    result = await chart.aexport_png(width=800, transparent=True, client=client)
+
+    assert result == b"\x89PNG"
+    request = api.requests[-1]
+    assert request.url.path == f"{CHARTS_PATH}/abc12/export/png"
+    assert request.url.params["width"] == "800"
+    assert request.url.params["transparent"] == "true"
+    assert request.url.params["unit"] == "px"
+
+
+@pytest.mark.asyncio
+async def test_aexport_pdf_validates_mode(client):
+    """aexport_pdf() validates unit and mode before sending a request."""
+    chart = BarChart(title="Test Chart", chart_id="abc12")
+
+    with pytest.raises(ValueError, match="Invalid mode"):
+        await chart.aexport_pdf(mode="hsl", client=client)
+
+
+@pytest.mark.asyncio
+async def test_aduplicate_and_afork_fetch_new_chart(api, client):
+    """aduplicate() and afork() return the new chart fetched with aget()."""
+    chart = BarChart(title="Test Chart", chart_id="abc12")
+
+    duplicate = await chart.aduplicate(client=client)
+    fork = await chart.afork()
+
+    assert isinstance(duplicate, BarChart)
+    assert duplicate.chart_id == "copy1"
+    assert fork.chart_id == "copy1"
+    assert ("POST", f"{CHARTS_PATH}/abc12/copy") in api.calls()
+    assert ("POST", f"{CHARTS_PATH}/abc12/fork") in api.calls()
+
+
+@pytest.mark.asyncio
+async def test_adelete_clears_chart_id(api, client):
+    """adelete() clears the chart_id after a successful delete."""
+    chart = BarChart(title="Test Chart", chart_id="abc12")
+
+    # The deprecated client helpers aren't used along the way
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        assert await chart.adelete(client=client) is True
+    assert chart.chart_id is None
+    assert api.calls() == [("DELETE", f"{CHARTS_PATH}/abc12")]
+
+
+@pytest.mark.asyncio
+async def test_async_methods_require_chart_id(client):
+    """Async methods that act on an existing chart need a chart_id."""
+    chart = BarChart(title="Test Chart")
+
+    with pytest.raises(ValueError, match="No chart_id set"):
+        await chart.aupdate(client=client)
+    with pytest.raises(ValueError, match="No chart_id set"):
+        await chart.aexport_svg(client=client)
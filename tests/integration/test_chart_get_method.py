@@ -2,6 +2,7 @@
 
 import json
 import os
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -259,6 +260,71 @@ class TestBaseChartGet:
             assert chart.auto_dark_mode is False
             assert chart.get_the_data is False
 
+    def test_get_fetches_metadata_and_data_concurrently(self):
+        """Test get() has the metadata and data requests in flight together."""
+        mock_metadata = {
+            "id": "test-id",
+            "type": "d3-bars",
+            "title": "Test",
+            "metadata": {
+                "data": {},
+                "describe": {},
+                "visualize": {},
+                "publish": {"blocks": {}},
+                "annotate": {},
+            },
+        }
+
+        mock_client = Mock()
+        mock_client._CHARTS_URL = "https://api.datawrapper.de/v3/charts"
+
+        # Each request waits for the other, so a sequential get() would time out
+        both_in_flight = threading.Barrier(2, timeout=5)
+
+        def mock_get(url):
+            both_in_flight.wait()
+            if url.endswith("/data"):
+                return "a,b\n1,2"
+            return mock_metadata
+
+        mock_client.get.side_effect = mock_get
+
+        with patch("datawrapper.charts.base.Datawrapper", return_value=mock_client):
+            chart = BaseChart.get("test-id", access_token="test-token")
+
+        assert chart.chart_id == "test-id"
+        assert list(chart.data.columns) == ["a", "b"]
+        assert mock_client.get.call_count == 2
+
+    def test_get_data_error_message(self):
+        """Test get() reports a failed data request separately."""
+        mock_metadata = {
+            "id": "test-id",
+            "type": "d3-bars",
+            "title": "Test",
+            "metadata": {
+                "data": {},
+                "describe": {},
+                "visualize": {},
+                "publish": {"blocks": {}},
+                "annotate": {},
+            },
+        }
+
+        mock_client = Mock()
+        mock_client._CHARTS_URL = "https://api.datawrapper.de/v3/charts"
+
+        def mock_get(url):
+            if url.endswith("/data"):
+                raise ConnectionError("boom")
+            return mock_metadata
+
+        mock_client.get.side_effect = mock_get
+
+        with patch("datawrapper.charts.base.Datawrapper", return_value=mock_client):
+            with pytest.raises(Exception, match="Failed to fetch chart data.*boom"):
+                BaseChart.get("test-id", access_token="test-token")
+
 
 class TestBarChartGet:
     """Tests for BarChart.get() method using sample data."""